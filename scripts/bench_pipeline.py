@@ -0,0 +1,153 @@
+"""Compare plain and pipelined Repository turns over an injected-latency link.
+
+Usage (needs a reachable DATABASE_URL; the schema is reset):
+
+    python scripts/bench_pipeline.py --rtt-ms 2 --turns 200
+
+Connections go through an in-process proxy that delays every packet by half
+the round-trip time in each direction. Each mode plays the same seeded
+turns at 0 ms and at ``--rtt-ms``; the slope between the two is the number
+of round trips a turn waits for.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import threading
+import time
+from typing import Optional, Tuple
+
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+
+from monopoly.db import Database, Repository
+from monopoly.domain import GameEngine
+
+
+class LatencyProxy:
+    """TCP proxy to Postgres that delays each chunk by ``delay`` seconds."""
+
+    def __init__(self, dsn: str) -> None:
+        params = conninfo_to_dict(dsn)
+        host = str(params.get("host") or "localhost")
+        port = int(params.get("port") or 5432)
+        self.target: Tuple[str, int] = (host, port)
+        self.dsn = dsn
+        self.delay = 0.0
+        self.loop = asyncio.new_event_loop()
+        self.port: Optional[int] = None
+        ready = threading.Event()
+        threading.Thread(target=self._run, args=(ready,), daemon=True).start()
+        ready.wait()
+
+    def proxied_dsn(self) -> str:
+        return make_conninfo(self.dsn, host="127.0.0.1", port=self.port)
+
+    def _run(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self.loop)
+        server = self.loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        ready.set()
+        self.loop.run_forever()
+
+    async def _open(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        host, port = self.target
+        if host.startswith("/"):
+            return await asyncio.open_unix_connection(f"{host}/.s.PGSQL.{port}")
+        return await asyncio.open_connection(host, port)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        upstream_reader, upstream_writer = await self._open()
+        await asyncio.gather(
+            self._pipe(reader, upstream_writer), self._pipe(upstream_reader, writer)
+        )
+
+    async def _pipe(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Chunks are delivered ``delay`` after they arrive, not one ``delay``
+        # after another, so a burst of pipelined statements pays it once.
+        queue: asyncio.Queue[Tuple[float, bytes]] = asyncio.Queue()
+
+        async def deliver() -> None:
+            while True:
+                due, data = await queue.get()
+                if not data:
+                    break
+                wait = due - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                writer.write(data)
+                await writer.drain()
+
+        sender = asyncio.ensure_future(deliver())
+        try:
+            while True:
+                data = await reader.read(65536)
+                await queue.put((time.monotonic() + self.delay, data))
+                if not data:
+                    break
+            await sender
+        except ConnectionError:
+            sender.cancel()
+        finally:
+            writer.close()
+
+
+def play(repo: Repository, turns: int, seed: int) -> float:
+    """Milliseconds per turn (roll, buy when offered, next turn)."""
+    engine = GameEngine.new_game_with_defaults(
+        repo, [f"Bot {i}" for i in range(4)], 1_000_000, rng=random.Random(seed)
+    )
+    player = engine.get_current_player()
+    started = time.perf_counter()
+    for _ in range(turns):
+        result = engine.roll_and_resolve(player)
+        if result.needs_buy_decision:
+            engine.buy_property(result.player, result.space)
+        player = engine.next_turn()
+    elapsed = time.perf_counter() - started
+    repo.delete_game(engine.game_id)
+    return elapsed / turns * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--no-check-connections",
+        action="store_true",
+        help="Skip the pool's liveness query on every checkout.",
+    )
+    args = parser.parse_args()
+
+    with Database() as direct:
+        Repository(direct).reset_schema()
+        proxy = LatencyProxy(direct.dsn)
+
+    print(f"{'mode':<10}{'0 ms':>12}{f'{args.rtt_ms:g} ms':>12}{'round trips':>14}")
+    check = not args.no_check_connections
+    with Database(proxy.proxied_dsn(), check_connections=check) as db:
+        for pipeline in (False, True):
+            repo = Repository(db, pipeline=pipeline)
+            per_turn = []
+            for rtt in (0.0, args.rtt_ms):
+                proxy.delay = rtt / 2000
+                play(repo, 5, args.seed)  # warm the pool and prepared statements
+                per_turn.append(play(repo, args.turns, args.seed))
+            trips = (per_turn[1] - per_turn[0]) / args.rtt_ms if args.rtt_ms else 0.0
+            print(
+                f"{'pipeline' if pipeline else 'plain':<10}"
+                f"{per_turn[0]:>9.2f} ms{per_turn[1]:>9.2f} ms{trips:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
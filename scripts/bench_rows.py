@@ -0,0 +1,68 @@
+"""Compare trusted and validated row decoding on Repository hot reads.
+
+Usage (needs a reachable DATABASE_URL; the schema is reset):
+
+    python scripts/bench_rows.py --players 8 --repeat 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from monopoly.db import Database, Repository
+from monopoly.domain import GameEngine
+
+
+def timed(label: str, repeat: int, fn) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    per_call = (time.perf_counter() - started) / repeat * 1e6
+    print(f"  {label:<22} {per_call:9.1f} us/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    with Database() as db:
+        repo = Repository(db)
+        repo.reset_schema()
+        engine = GameEngine.new_game_with_defaults(
+            repo, [f"Bot {i}" for i in range(args.players)], 1_000_000
+        )
+        owner = repo.list_players(engine.game_id)[0]
+        for space in engine.board:
+            if space is not None and space.purchase_cost:
+                engine.buy_property(owner, space)
+
+        results = {}
+        for trusted in (False, True):
+            label = "trusted" if trusted else "validated"
+            print(f"{label}:")
+            reader = Repository(db, trusted_rows=trusted)
+            with reader.unit_of_work():
+                results[label] = (
+                    timed(
+                        "list_players",
+                        args.repeat,
+                        lambda: reader.list_players(engine.game_id),
+                    ),
+                    timed(
+                        "properties_by_owner",
+                        args.repeat,
+                        lambda: reader.properties_by_owner(engine.game_id, owner.id),
+                    ),
+                )
+        for idx, name in enumerate(("list_players", "properties_by_owner")):
+            speedup = results["validated"][idx] / results["trusted"][idx]
+            print(f"{name}: {speedup:.2f}x faster with trusted rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+"""Benchmark engine and repository hot paths and compare with a baseline.
+
+Usage (the postgres backend needs a reachable DATABASE_URL and resets the
+schema):
+
+    python scripts/bench_suite.py --backend memory,sqlite,postgres --output bench.json
+    python scripts/bench_suite.py --baseline scripts/bench_baseline.json
+    python scripts/bench_suite.py --save-baseline scripts/bench_baseline.json
+
+Every case runs with fixed seeds on boards of each ``--sizes`` entry (the
+default board tiled to that many spaces) and reports operations per second,
+p50/p99 latency and round trips per operation: statements sent on Postgres,
+repository calls in memory and on SQLite (a temporary WAL-mode file).
+Full-game simulation plays the default board
+only, where games end, and reports per turn. With ``--baseline``, a case
+whose rate or p50 moved by more than ``--tolerance`` or whose round trips
+changed is listed, and any regression makes the script exit with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from monopoly.cli.main import show_status
+from monopoly.db import (
+    Database,
+    InMemoryRepository,
+    Instrumentation,
+    Repository,
+    SqliteDatabase,
+    SqliteRepository,
+)
+from monopoly.db.base import GameRepository
+from monopoly.domain import GameEngine
+from monopoly.models import SpaceType
+from monopoly.sim.board import tiled_board
+from monopoly.sim.simulator import SimulationConfig, build_policies, play_game
+
+PLAYERS = 4
+RICH = 1_000_000_000
+# Extra runs per case made through Instrumentation to count round trips;
+# the timed runs always use the bare repository.
+COUNTED_RUNS = 20
+CASES = (
+    "load_board",
+    "roll_and_resolve",
+    "buy_property",
+    "sell_all_properties",
+    "next_turn",
+    "show_status",
+    "simulate",
+)
+
+
+@dataclass
+class Result:
+    case: str
+    backend: str
+    size: int
+    unit: str
+    latencies: List[float]
+    round_trips: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = sorted(self.latencies)
+        total = sum(samples)
+        return {
+            "case": self.case,
+            "backend": self.backend,
+            "size": self.size,
+            "unit": self.unit,
+            "samples": len(samples),
+            "rate_per_sec": round(len(samples) / total, 1) if total else 0.0,
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 4),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 4),
+            "round_trips_per_op": round(self.round_trips, 2),
+        }
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    return f"{result['backend']}/{result['case']}/{result['size']}"
+
+
+class Bench:
+    """Runs every case against one backend."""
+
+    def __init__(
+        self,
+        backend: str,
+        repo: GameRepository,
+        db: Optional[Database | SqliteDatabase],
+        seed: int,
+        turns: int,
+        repeat: int,
+        games: int,
+    ) -> None:
+        self.backend = backend
+        self.repo = repo
+        self.db = db
+        self.seed = seed
+        self.turns = turns
+        self.repeat = repeat
+        self.games = games
+
+    def new_engine(self, size: int) -> GameEngine:
+        return GameEngine.new_game_with_defaults(
+            self.repo,
+            [f"Bot {i}" for i in range(PLAYERS)],
+            RICH,
+            rng=random.Random(self.seed + size),
+            record_history=False,
+            board=tiled_board(size),
+        )
+
+    def measure(
+        self,
+        case: str,
+        size: int,
+        engine: GameEngine,
+        op: Callable[[], Any],
+        runs: int,
+        setup: Callable[[], Any] = lambda: None,
+    ) -> Result:
+        """Time ``runs`` calls of ``op``, then count round trips on a few more.
+
+        ``setup`` runs untimed and uncounted before every call.
+        """
+        latencies = []
+        for _ in range(runs):
+            setup()
+            started = time.perf_counter()
+            op()
+            latencies.append(time.perf_counter() - started)
+
+        instrumentation = Instrumentation()
+        if isinstance(self.db, Database):
+            instrumentation.attach(self.db)
+        bare, counted, trips = engine.repo, min(runs, COUNTED_RUNS), 0
+        try:
+            for _ in range(counted):
+                setup()
+                before = instrumentation.statements
+                engine.repo = instrumentation.wrap(bare)
+                try:
+                    op()
+                finally:
+                    engine.repo = bare
+                trips += instrumentation.statements - before
+        finally:
+            if isinstance(self.db, Database):
+                instrumentation.detach(self.db)
+        self.repo.delete_game(engine.game_id)
+        return Result(case, self.backend, size, "call", latencies, trips / counted)
+
+    def load_board(self, size: int) -> Result:
+        layout = tiled_board(size)
+        game = self.repo.create_game(status="active")
+        engine = GameEngine(self.repo, game.id)
+
+        def clear() -> None:
+            # A fresh game per run, so every run inserts the whole board.
+            self.repo.delete_game(engine.game_id)
+            engine.game_id = self.repo.create_game(status="active").id
+
+        return self.measure(
+            "load_board",
+            size,
+            engine,
+            lambda: engine.load_board(layout),
+            self.repeat,
+            clear,
+        )
+
+    def roll_and_resolve(self, size: int) -> Result:
+        engine = self.new_engine(size)
+        current = [engine.get_current_player()]
+
+        def rotate() -> None:
+            current[0] = engine.next_turn()
+
+        return self.measure(
+            "roll_and_resolve",
+            size,
+            engine,
+            lambda: engine.roll_and_resolve(current[0]),
+            self.turns,
+            rotate,
+        )
+
+    def buy_property(self, size: int) -> Result:
+        engine = self.new_engine(size)
+        player = engine.get_current_player()
+        spaces = cycle_properties(engine)
+        space = [next(spaces)]
+
+        def sell_back() -> None:
+            engine.sell_property(player, space[0])
+            space[0] = next(spaces)
+
+        # The first setup sells a property nobody owns, which is a no-op.
+        return self.measure(
+            "buy_property",
+            size,
+            engine,
+            lambda: engine.buy_property(player, space[0]),
+            self.turns,
+            sell_back,
+        )
+
+    def sell_all_properties(self, size: int) -> Result:
+        engine = self.new_engine(size)
+        player = engine.get_current_player()
+        holdings = [s for s in engine.board if s and s.type == SpaceType.PROPERTY][:50]
+
+        def buy_all() -> None:
+            for space in holdings:
+                engine.buy_property(player, space)
+
+        return self.measure(
+            "sell_all_properties",
+            size,
+            engine,
+            lambda: engine.sell_all_properties(player.id),
+            self.repeat,
+            buy_all,
+        )
+
+    def next_turn(self, size: int) -> Result:
+        engine = self.new_engine(size)
+        return self.measure("next_turn", size, engine, engine.next_turn, self.turns)
+
+    def show_status(self, size: int) -> Result:
+        engine = self.new_engine(size)
+
+        def draw() -> None:
+            with redirect_stdout(io.StringIO()):
+                show_status(engine)
+
+        # Drop the cached status so every run reads the board again.
+        return self.measure(
+            "show_status", size, engine, draw, self.repeat, engine.invalidate_status
+        )
+
+    def simulate(self) -> Result:
+        """Bot games on the default board; one sample per turn of each game."""
+        config = SimulationConfig(games=self.games, players=PLAYERS, seed=self.seed)
+        rng = config.batch_rng(0)
+        policies = build_policies(config.seat_policies(), rng)
+        latencies: List[float] = []
+        for _ in range(config.games):
+            started = time.perf_counter()
+            outcome = play_game(self.repo, config, policies, rng)
+            per_turn = (time.perf_counter() - started) / max(outcome.turns, 1)
+            latencies.extend([per_turn] * outcome.turns)
+
+        instrumentation = Instrumentation()
+        if isinstance(self.db, Database):
+            instrumentation.attach(self.db)
+        try:
+            wrapped = instrumentation.wrap(self.repo)
+            turns = sum(
+                play_game(wrapped, config, policies, rng).turns for _ in range(2)
+            )
+        finally:
+            if isinstance(self.db, Database):
+                instrumentation.detach(self.db)
+        return Result(
+            "simulate",
+            self.backend,
+            12,
+            "turn",
+            latencies,
+            instrumentation.statements / max(turns, 1),
+        )
+
+    def run(self, sizes: List[int], cases: List[str]) -> Iterator[Result]:
+        for case in cases:
+            if case == "simulate":
+                yield self.simulate()
+                continue
+            for size in sizes:
+                yield getattr(self, case)(size)
+
+
+def cycle_properties(engine: GameEngine) -> Iterator[Any]:
+    spaces = [s for s in engine.board if s and s.type == SpaceType.PROPERTY]
+    while True:
+        yield from spaces
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> int:
+    """Print how ``results`` differ from ``baseline``; returns regressions."""
+    known = {result_key(r): r for r in baseline.get("results", [])}
+    regressions = 0
+    for result in results:
+        base = known.get(result_key(result))
+        if base is None:
+            continue
+        notes = []
+        if result["round_trips_per_op"] > base["round_trips_per_op"]:
+            notes.append(
+                f"round trips {base['round_trips_per_op']} -> "
+                f"{result['round_trips_per_op']}"
+            )
+        if result["rate_per_sec"] < base["rate_per_sec"] * (1 - tolerance):
+            notes.append(f"rate {base['rate_per_sec']} -> {result['rate_per_sec']}/s")
+        if result["p50_ms"] > base["p50_ms"] * (1 + tolerance):
+            notes.append(f"p50 {base['p50_ms']} -> {result['p50_ms']} ms")
+        if notes:
+            regressions += 1
+            print(f"REGRESSION {result_key(result)}: {'; '.join(notes)}")
+        elif result["round_trips_per_op"] < base["round_trips_per_op"] or result[
+            "rate_per_sec"
+        ] > base["rate_per_sec"] * (1 + tolerance):
+            print(
+                f"improved   {result_key(result)}: "
+                f"{base['rate_per_sec']} -> {result['rate_per_sec']}/s, "
+                f"round trips {base['round_trips_per_op']} -> "
+                f"{result['round_trips_per_op']}"
+            )
+    return regressions
+
+
+def open_backend(
+    name: str,
+) -> tuple[GameRepository, Optional[Database | SqliteDatabase]]:
+    if name == "memory":
+        return InMemoryRepository(), None
+    if name == "sqlite":
+        scratch = tempfile.mkdtemp(prefix="monopoly-bench-")
+        atexit.register(shutil.rmtree, scratch, True)
+        sqlite_db = SqliteDatabase(os.path.join(scratch, "bench.db"))
+        return SqliteRepository(sqlite_db), sqlite_db
+    db = Database()
+    repo = Repository(db)
+    repo.reset_schema()
+    return repo, db
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backend", default="memory", help="Comma-separated: memory, sqlite, postgres."
+    )
+    parser.add_argument("--sizes", default="12,100,1000,10000")
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--turns", type=int, default=300, help="Runs per turn case.")
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Runs of the board-sized cases."
+    )
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    parser.add_argument("--baseline", help="Compare with this results file.")
+    parser.add_argument("--save-baseline", help="Write results here as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    cases = args.cases.split(",")
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results: List[Dict[str, Any]] = []
+    print(
+        f"{'backend':<9}{'case':<21}{'size':>6}{'rate/s':>12}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'trips':>8}"
+    )
+    for backend in args.backend.split(","):
+        repo, db = open_backend(backend)
+        try:
+            bench = Bench(
+                backend, repo, db, args.seed, args.turns, args.repeat, args.games
+            )
+            for result in bench.run(sizes, cases):
+                row = result.to_dict()
+                results.append(row)
+                print(
+                    f"{backend:<9}{row['case']:<21}{row['size']:>6}"
+                    f"{row['rate_per_sec']:>12,.1f}{row['p50_ms']:>10.3f}"
+                    f"{row['p99_ms']:>10.3f}{row['round_trips_per_op']:>8}"
+                )
+        finally:
+            if db is not None:
+                db.close()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "turns": args.turns,
+            "repeat": args.repeat,
+            "games": args.games,
+        },
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as fh:
+                json.dump(report, fh, indent=2)
+                fh.write("\n")
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = compare(results, json.load(fh), args.tolerance)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
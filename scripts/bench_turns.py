@@ -0,0 +1,67 @@
+"""Measure turn cost as the number of players in one game grows.
+
+Usage (the postgres backend needs a reachable DATABASE_URL and resets the
+schema):
+
+    python scripts/bench_turns.py --players 4,100,1000 --turns 2000
+    python scripts/bench_turns.py --backend postgres --turns 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from monopoly.db import Database, InMemoryRepository, Repository
+from monopoly.db.base import GameRepository
+from monopoly.domain import GameEngine
+
+
+def bench(repo: GameRepository, players: int, turns: int) -> tuple[float, float]:
+    """Microseconds per ``next_turn`` and per full roll-and-rotate turn."""
+    engine = GameEngine.new_game_with_defaults(
+        repo,
+        [f"Bot {i}" for i in range(players)],
+        1_000_000,
+        rng=random.Random(players),
+        record_history=False,
+    )
+    started = time.perf_counter()
+    for _ in range(turns):
+        engine.next_turn()
+    rotate = (time.perf_counter() - started) / turns * 1e6
+
+    player = engine.get_current_player()
+    started = time.perf_counter()
+    for _ in range(turns):
+        engine.roll_and_resolve(player)
+        player = engine.next_turn()
+    full = (time.perf_counter() - started) / turns * 1e6
+    repo.delete_game(engine.game_id)
+    return rotate, full
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=["memory", "postgres"], default="memory")
+    parser.add_argument("--players", default="4,10,100,1000")
+    parser.add_argument("--turns", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = Database() if args.backend == "postgres" else None
+    repo: GameRepository = Repository(db) if db else InMemoryRepository()
+    if db:
+        repo.reset_schema()
+    print(f"{'players':>8} {'next_turn':>14} {'full turn':>14}")
+    try:
+        for count in (int(p) for p in args.players.split(",")):
+            rotate, full = bench(repo, count, args.turns)
+            print(f"{count:>8} {rotate:>11.1f} us {full:>11.1f} us")
+    finally:
+        if db:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import json
+import sqlite3
 import sys
+import time
 from typing import List, Optional
 
+from monopoly.db.aio import AsyncDatabase, AsyncRepository, AsyncRepositoryAdapter
+from monopoly.db.base import GameRepository
 from monopoly.db.connection import Database
+from monopoly.db.instrument import Instrumentation, PeriodicDump
+from monopoly.db.ledger import BufferedLedger
+from monopoly.db.memory import InMemoryRepository
+from monopoly.db.migrate import format_checks
+from monopoly.db.portable import export_game, import_game
 from monopoly.db.repository import Repository
-from monopoly.domain.game_engine import GameEngine, IMPROVEMENT_COST
-from monopoly.models import BoardSpace, Player, SpaceType
+from monopoly.db.sharding import ShardMap, shard_dsns_from_env
+from monopoly.db.sqlite import SqliteDatabase, SqliteRepository
+from monopoly.domain.game_engine import (
+    IMPROVEMENT_COST,
+    IMPROVEMENT_RENT_BONUS,
+    PASS_GO_BONUS,
+    SELLBACK_RATIO,
+    GameEngine,
+    HouseRules,
+)
+from monopoly.domain.history import rebuild_state
+from monopoly.models import BoardSpace, Player, SpaceDraft, SpaceType, Standing
+from monopoly.server import serve
+from monopoly.server.app import DEFAULT_HOST, DEFAULT_PORT
+from monopoly.sim.policies import policy_names
+from monopoly.sim.parallel import run_parallel
+from monopoly.sim.simulator import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_TURNS,
+    SimulationConfig,
+    format_stats,
+    simulate,
+)
 
 
 def print_banner() -> None:
@@ -102,7 +135,7 @@ def prompt_yes_no(prompt: str, default: str = "y") -> bool:
 
 
 def collect_players(
-    repo: Repository, game_id: int, starting_money: int
+    repo: GameRepository, game_id: int, starting_money: int
 ) -> List[Player]:
     players: list[Player] = []
     print("Enter player names (minimum 2). Leave blank to finish.")
@@ -123,22 +156,18 @@ def collect_players(
     return players
 
 
-def add_property_space(repo: Repository, game_id: int) -> BoardSpace:
-    sequence = repo.next_sequence_order(game_id)
+def add_property_space(sequence: int) -> SpaceDraft:
     name = input("Property name: ").strip() or f"Property {sequence}"
     cost = prompt_int("Purchase cost:", 100, minimum=1)
     rent = prompt_int("Base rent:", 20, minimum=1)
     desc = input("Short description: ").strip() or "User created property."
-    space = repo.add_space(
-        game_id,
-        sequence,
-        name,
-        SpaceType.PROPERTY,
-        desc,
-        cost,
-        rent,
-        0,
-        None,
+    space = SpaceDraft(
+        sequence_order=sequence,
+        name=name,
+        type=SpaceType.PROPERTY,
+        description=desc,
+        purchase_cost=cost,
+        base_rent=rent,
     )
     print(f"Added property '{space.name}' at position {sequence}.")
     return space
@@ -157,8 +186,7 @@ def select_event_type() -> SpaceType:
         return valid[int(choice) - 1]
 
 
-def add_non_property_space(repo: Repository, game_id: int) -> BoardSpace:
-    sequence = repo.next_sequence_order(game_id)
+def add_non_property_space(sequence: int) -> SpaceDraft:
     space_type = select_event_type()
     name = input("Space name: ").strip() or f"{space_type.value.title()} {sequence}"
     desc = input("Short description: ").strip()
@@ -170,22 +198,22 @@ def add_non_property_space(repo: Repository, game_id: int) -> BoardSpace:
         move_target = prompt_int(
             "Move target index (where Jail is on the board)", sequence
         )
-    space = repo.add_space(
-        game_id,
-        sequence,
-        name,
-        space_type,
-        desc,
-        None,
-        None,
-        event_amount,
-        move_target,
+    space = SpaceDraft(
+        sequence_order=sequence,
+        name=name,
+        type=space_type,
+        description=desc,
+        event_amount=event_amount,
+        move_target=move_target,
     )
     print(f"Added {space.type.value} space '{space.name}' at position {sequence}.")
     return space
 
 
-def manual_board_setup(repo: Repository, game_id: int) -> None:
+def manual_board_setup(repo: GameRepository, game_id: int) -> List[BoardSpace]:
+    """Stage spaces interactively and save the finished board in one batch."""
+    staged: list[SpaceDraft] = []
+    start = repo.next_sequence_order(game_id)
     non_property_count = 0
     while True:
         print("\nBoard Builder:")
@@ -194,59 +222,57 @@ def manual_board_setup(repo: Repository, game_id: int) -> None:
         print("3. Finish")
         choice = input("Select an option: ").strip()
         if choice == "1":
-            add_property_space(repo, game_id)
+            staged.append(add_property_space(start + len(staged)))
         elif choice == "2":
-            space = add_non_property_space(repo, game_id)
-            if space.type != SpaceType.PROPERTY:
-                non_property_count += 1
+            staged.append(add_non_property_space(start + len(staged)))
+            non_property_count += 1
         elif choice == "3":
-            board_size = repo.count_spaces(game_id)
-            if board_size == 0:
+            if start + len(staged) == 0:
                 print("You need at least one space before finishing.")
                 continue
             if non_property_count < 4:
                 print("Add at least 4 non-property spaces to satisfy requirements.")
                 continue
-            break
+            return repo.add_spaces(game_id, staged)
         else:
             print("Invalid option.")
 
 
-def show_status(repo: Repository, game_id: int) -> None:
-    game = repo.get_game(game_id)
-    current_id = game.current_turn_player_id if game else None
-    players = repo.list_players(game_id)
+def show_status(engine: GameEngine) -> None:
+    status = engine.board_status()
+    if status is None:
+        print("Game not found.")
+        return
+    current_id = status.game.current_turn_player_id
     print("\nPlayers:")
-    for player in players:
-        status = "ACTIVE" if player.is_active else "OUT"
+    for player in status.players:
+        state = "ACTIVE" if player.is_active else "OUT"
         turn_marker = " (current turn)" if player.id == current_id else ""
         print(
-            f"- {player.name}: ${player.money} | Pos {player.position} | {status}{turn_marker}"
+            f"- {player.name}: ${player.money} | Pos {player.position} | {state}{turn_marker}"
         )
 
-    spaces = repo.list_spaces(game_id)
+    print("\nStandings:")
+    print_standings(status.standings())
+
     print("\nBoard:")
-    for space in spaces:
+    for square in status.squares:
+        space = square.space
         owner_name = ""
         if space.type == SpaceType.PROPERTY:
-            ps = repo.get_property_state(game_id, space.id)
-            owner = repo.get_player(ps.owner_id) if ps and ps.owner_id else None
-            owner_name = f" | Owner: {owner.name if owner else 'Bank'} | Improves: {ps.improvement_count if ps else 0}"
+            owner_name = f" | Owner: {square.owner_name or 'Bank'} | Improves: {square.improvement_count}"
         print(f"{space.sequence_order}. {space.name} ({space.type.value}){owner_name}")
     print()
 
 
-def ensure_turn_pointer(repo: Repository, game_id: int) -> Player:
-    game = repo.get_game(game_id)
-    if game and game.current_turn_player_id:
-        player = repo.get_player(game.current_turn_player_id)
-        if player:
-            return player
-    players = repo.list_players(game_id, active_only=True)
-    if not players:
-        raise RuntimeError("No active players available.")
-    repo.set_current_turn(game_id, players[0].id)
-    return players[0]
+def print_standings(standings: List[Standing], show_game: bool = False) -> None:
+    for standing in standings:
+        game = f"game {standing.game_id:<6} " if show_game else ""
+        out = "" if standing.is_active else " (out)"
+        print(
+            f"{standing.rank:>3}. {game}{standing.name:<16} ${standing.net_worth:<7} "
+            f"(cash ${standing.money} + holdings ${standing.holdings}){out}"
+        )
 
 
 def handle_property_decision(
@@ -273,7 +299,9 @@ def handle_property_decision(
             choice = input("Select an option: ").strip()
             if choice == "1":
                 if engine.improve_property(player, space):
-                    print(f"Improved {space.name} for ${IMPROVEMENT_COST}.")
+                    print(
+                        f"Improved {space.name} for ${engine.rules.improvement_cost}."
+                    )
                 else:
                     print("Cannot improve (not enough funds?).")
             elif choice == "2":
@@ -283,7 +311,7 @@ def handle_property_decision(
 
 def play_game(engine: GameEngine) -> None:
     repo = engine.repo
-    current_player = ensure_turn_pointer(repo, engine.game_id)
+    current_player = engine.ensure_turn_pointer()
 
     while True:
         print(f"\n--- {current_player.name}'s Turn ---")
@@ -297,7 +325,7 @@ def play_game(engine: GameEngine) -> None:
         if cmd in {"q", "quit"}:
             break
         if cmd in {"s", "status"}:
-            show_status(repo, engine.game_id)
+            show_status(engine)
             continue
         if cmd not in {"r", "roll", ""}:
             print("Invalid command.")
@@ -341,10 +369,10 @@ def play_game(engine: GameEngine) -> None:
         current_player = next_player
 
 
-def start_new_game(repo: Repository) -> None:
+def start_new_game(repo: GameRepository) -> None:
     reset = prompt_yes_no("Reset database schema? (drops existing games)", default="n")
     if reset:
-        repo.db.apply_schema()
+        repo.reset_schema()
     starting_money = prompt_int("Starting money per player", default=1500, minimum=1)
     try:
         game = repo.create_game(status="setup")
@@ -357,14 +385,15 @@ def start_new_game(repo: Repository) -> None:
         engine.load_default_board()
     else:
         manual_board_setup(repo, game.id)
+        engine.invalidate_board()
     repo.update_game_status(game.id, "active")
     if players:
-        repo.set_current_turn(game.id, players[0].id)
+        engine.set_current_player(players[0].id)
     print(f"Game {game.id} ready. Starting...")
     play_game(engine)
 
 
-def load_game(repo: Repository) -> None:
+def load_game(repo: GameRepository) -> None:
     game_id = prompt_int("Enter game ID to load", minimum=1)
     game = repo.get_game(game_id)
     if not game:
@@ -380,15 +409,524 @@ def load_game(repo: Repository) -> None:
     play_game(engine)
 
 
-def main() -> None:
-    print_banner()
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="monopoly", description=__doc__)
+    parser.add_argument(
+        "--backend",
+        choices=["postgres", "sqlite", "memory"],
+        default="postgres",
+        help="Storage backend; 'sqlite' keeps games in a local file without a "
+        "server, 'memory' needs no database but forgets games on exit.",
+    )
+    parser.add_argument(
+        "--sqlite-path",
+        metavar="PATH",
+        help="SQLite database file (default: $MONOPOLY_SQLITE_PATH or monopoly.db).",
+    )
+    parser.add_argument(
+        "--buffered-ledger",
+        action="store_true",
+        help="Write Postgres ledger rows in COPY batches instead of one "
+        "INSERT per money change (flushed on exit).",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Send each Postgres unit of work in pipeline mode with prepared "
+        "statements, so writes share round trips.",
+    )
+    parser.add_argument(
+        "--instrument",
+        metavar="PATH",
+        help="Record per-operation query counts and latencies during play and "
+        "dump them to PATH (Prometheus text for .prom, JSON otherwise).",
+    )
+    commands = parser.add_subparsers(dest="command")
+    sim = commands.add_parser(
+        "simulate", help="Play complete bot-driven games and print summary stats."
+    )
+    sim.add_argument("--games", type=int, default=100)
+    sim.add_argument("--players", type=int, default=4)
+    sim.add_argument("--starting-money", type=int, default=1500)
+    sim.add_argument(
+        "--policies",
+        default="aggressive,cautious",
+        help="Comma-separated bot policies assigned to seats round-robin "
+        f"({', '.join(policy_names())}).",
+    )
+    sim.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    sim.add_argument("--pass-go-bonus", type=int, default=PASS_GO_BONUS)
+    sim.add_argument("--improvement-cost", type=int, default=IMPROVEMENT_COST)
+    sim.add_argument(
+        "--improvement-rent-bonus", type=int, default=IMPROVEMENT_RENT_BONUS
+    )
+    sim.add_argument("--sellback-ratio", type=float, default=SELLBACK_RATIO)
+    sim.add_argument(
+        "--seed", type=int, default=None, help="Seed for reproducible runs."
+    )
+    sim.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; 0 uses every core, 1 runs in-process.",
+    )
+    sim.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    sim.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Run games in lockstep on NumPy arrays (needs monopoly[sim]).",
+    )
+    sim.add_argument("--json", action="store_true", help="Print stats as JSON.")
+
+    analyze = commands.add_parser(
+        "analyze",
+        help="Landing probabilities and property ROI for a board (needs monopoly[sim]).",
+    )
+    analyze.add_argument(
+        "--game-id",
+        type=int,
+        default=None,
+        help="Analyze the board stored for this game instead of the default board.",
+    )
+    analyze.add_argument("--players", type=int, default=4)
+    analyze.add_argument(
+        "--improvements",
+        type=int,
+        default=0,
+        help="Assume every property carries this many improvements.",
+    )
+
+    migrate = commands.add_parser(
+        "migrate", help="Apply pending Postgres schema migrations, keeping data."
+    )
+    migrate.add_argument(
+        "--check",
+        action="store_true",
+        help="Also EXPLAIN the hot queries and verify they use their indexes.",
+    )
+
+    replay_cmd = commands.add_parser(
+        "replay", help="Rebuild a stored game at any turn from its event log."
+    )
+    replay_cmd.add_argument("--game-id", type=int, required=True)
+    replay_cmd.add_argument(
+        "--turn", type=int, default=None, help="Turn to rebuild (default: latest)."
+    )
+
+    serve = commands.add_parser(
+        "serve", help="Host many games over a line-based TCP protocol."
+    )
+    serve.add_argument("--host", default=DEFAULT_HOST)
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument(
+        "--seed", type=int, default=None, help="Seed dice per game for replays."
+    )
+    serve.add_argument(
+        "--reset-schema",
+        action="store_true",
+        help="Drop and recreate the Postgres tables before serving.",
+    )
+
+    script = commands.add_parser(
+        "script",
+        help="Play commands from a file or stdin without prompts; prints JSON lines.",
+    )
+    script.add_argument(
+        "file", nargs="?", default="-", help="Command script ('-' reads stdin)."
+    )
+    script.add_argument(
+        "--seed", type=int, default=None, help="Seed dice per game for replays."
+    )
+    script.add_argument(
+        "--stop-on-error", action="store_true", help="Stop at the first failed command."
+    )
+    script.add_argument(
+        "--summary",
+        action="store_true",
+        help="Finish with one JSON line of command counts and latencies.",
+    )
+
+    export_cmd = commands.add_parser(
+        "export", help="Write a stored game, with its history, as JSON."
+    )
+    export_cmd.add_argument("game_id", type=int)
+    export_cmd.add_argument(
+        "-o", "--output", default="-", help="File to write ('-' for stdout)."
+    )
+
+    import_cmd = commands.add_parser(
+        "import", help="Load a game written by 'export' into the chosen backend."
+    )
+    import_cmd.add_argument("file", help="Export file ('-' reads stdin).")
+
+    games_cmd = commands.add_parser(
+        "games", help="List stored games and totals (across every shard)."
+    )
+    games_cmd.add_argument("--status", default=None, help="Only games in this status.")
+    games_cmd.add_argument("--limit", type=int, default=20)
+
+    leaderboard_cmd = commands.add_parser(
+        "leaderboard", help="Richest players by net worth, across games or in one."
+    )
+    leaderboard_cmd.add_argument(
+        "--game-id", type=int, default=None, help="Standings of this game only."
+    )
+    leaderboard_cmd.add_argument("--limit", type=int, default=10)
+    leaderboard_cmd.add_argument("--json", action="store_true", help="Print as JSON.")
+    return parser
+
+
+def run_simulation(args: argparse.Namespace) -> None:
+    config = SimulationConfig(
+        games=args.games,
+        players=args.players,
+        starting_money=args.starting_money,
+        policies=[p.strip() for p in args.policies.split(",") if p.strip()],
+        max_turns=args.max_turns,
+        rules=HouseRules(
+            pass_go_bonus=args.pass_go_bonus,
+            improvement_cost=args.improvement_cost,
+            improvement_rent_bonus=args.improvement_rent_bonus,
+            sellback_ratio=args.sellback_ratio,
+        ),
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+    try:
+        if args.vectorized:
+            try:
+                from monopoly.sim.vectorized import simulate_vectorized
+            except ImportError as exc:
+                print(f"Vectorized simulation needs NumPy: {exc}")
+                sys.exit(2)
+            stats = simulate_vectorized(config)
+        elif args.workers == 1:
+            stats = simulate(config)
+        else:
+            stats = run_parallel(config, workers=args.workers or None)
+    except ValueError as exc:
+        print(f"Simulation error: {exc}")
+        sys.exit(2)
+    if args.json:
+        print(json.dumps(stats.to_dict(), indent=2))
+    else:
+        print(format_stats(stats))
+
+
+def open_repository(
+    backend: str,
+    buffered_ledger: bool = False,
+    pipeline: bool = False,
+    sqlite_path: Optional[str] = None,
+) -> tuple[GameRepository, Optional[Database | SqliteDatabase | ShardMap]]:
+    if backend == "memory":
+        return InMemoryRepository(), None
+    if backend == "sqlite":
+        try:
+            sqlite_db = SqliteDatabase(sqlite_path)
+        except sqlite3.Error as exc:
+            print(f"Database error: {exc}")
+            sys.exit(1)
+        return SqliteRepository(sqlite_db), sqlite_db
     try:
+        shards = ShardMap.from_env()
+        if shards is not None:
+            return shards.repository(buffered_ledger, pipeline), shards
         db = Database()
     except ValueError as exc:
         print(f"Database error: {exc}")
         sys.exit(1)
+    ledger = BufferedLedger(db) if buffered_ledger else None
+    return Repository(db, ledger=ledger, pipeline=pipeline), db
+
+
+def run_analysis(args: argparse.Namespace) -> None:
+    try:
+        from monopoly.sim.markov import analyze_board, format_analysis
+    except ImportError as exc:
+        print(f"Board analysis needs NumPy: {exc}")
+        sys.exit(2)
+    board: Optional[List[BoardSpace]] = None
+    if args.game_id is not None:
+        repo, db = open_repository(args.backend, sqlite_path=args.sqlite_path)
+        board = repo.list_spaces(args.game_id)
+        if db is not None:
+            db.close()
+        if not board:
+            print(f"Game {args.game_id} has no board.")
+            sys.exit(1)
+    try:
+        analysis = analyze_board(board, args.players, args.improvements)
+    except ValueError as exc:
+        print(f"Analysis error: {exc}")
+        sys.exit(2)
+    print(format_analysis(analysis))
+
 
-    repo = Repository(db)
+def attach_instrumentation(
+    instrumentation: Instrumentation, db: Optional[Database | SqliteDatabase | ShardMap]
+) -> None:
+    """Count Postgres statements; other backends only get per-call timings."""
+    if isinstance(db, Database):
+        instrumentation.attach(db)
+    elif isinstance(db, ShardMap):
+        for shard in db.databases:
+            instrumentation.attach(shard)
+
+
+def run_migrations(args: argparse.Namespace) -> None:
+    try:
+        shards = ShardMap.from_env()
+        if shards is not None:
+            migrate_shards(shards, args.check)
+            return
+        db = Database()
+    except ValueError as exc:
+        print(f"Database error: {exc}")
+        sys.exit(1)
+    with db:
+        applied = db.migrate()
+        for migration in applied:
+            print(f"Applied {migration.version:04d}_{migration.name}")
+        if not applied:
+            print("Schema is up to date.")
+        if args.check:
+            results = db.check_indexes()
+            print(format_checks(results))
+            if not all(result.ok for result in results):
+                sys.exit(1)
+
+
+def migrate_shards(shards: ShardMap, check: bool) -> None:
+    """Migrate every shard in ``DATABASE_SHARD_URLS`` and offset its ids."""
+    with shards:
+        for index, applied in enumerate(shards.migrate()):
+            for migration in applied:
+                print(
+                    f"Shard {index}: applied {migration.version:04d}_{migration.name}"
+                )
+            if not applied:
+                print(f"Shard {index}: schema is up to date.")
+        if check:
+            ok = True
+            for index, db in enumerate(shards.databases):
+                results = db.check_indexes()
+                print(f"Shard {index}:")
+                print(format_checks(results))
+                ok = ok and all(result.ok for result in results)
+            if not ok:
+                sys.exit(1)
+
+
+def run_games(args: argparse.Namespace) -> None:
+    repo, db = open_repository(args.backend, sqlite_path=args.sqlite_path)
+    try:
+        games = repo.list_games(args.status, args.limit)
+        stats = repo.game_stats()
+    finally:
+        if db is not None:
+            db.close()
+    for game in games:
+        print(f"{game.id:>8}  {game.status:<10} {game.created_at:%Y-%m-%d %H:%M}")
+    by_status = ", ".join(
+        f"{count} {status}" for status, count in sorted(stats.games_by_status.items())
+    )
+    print(f"{stats.games} games ({by_status or 'none'})")
+    print(
+        f"{stats.active_players}/{stats.players} players active, "
+        f"${stats.money_in_play} in play, {stats.transactions} ledger rows"
+    )
+
+
+def run_leaderboard(args: argparse.Namespace) -> None:
+    repo, db = open_repository(args.backend, sqlite_path=args.sqlite_path)
+    try:
+        if args.game_id is not None:
+            standings = repo.standings(args.game_id)[: args.limit]
+        else:
+            standings = repo.leaderboard(args.limit)
+    finally:
+        if db is not None:
+            db.close()
+    if args.json:
+        print(json.dumps([s.model_dump() for s in standings]))
+    elif not standings:
+        print("No players yet.")
+    else:
+        print_standings(standings, show_game=args.game_id is None)
+
+
+def run_replay(args: argparse.Namespace) -> None:
+    repo, db = open_repository(args.backend, sqlite_path=args.sqlite_path)
+    started = time.perf_counter()
+    try:
+        state = rebuild_state(repo, args.game_id, args.turn)
+    except ValueError as exc:
+        print(f"Replay error: {exc}")
+        sys.exit(1)
+    finally:
+        if db is not None:
+            db.close()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"Game {state.game_id} at turn {state.turn} ({state.status}):")
+    for player in sorted(state.players.values(), key=lambda p: p.turn_order):
+        marker = "*" if player.id == state.current_player_id else " "
+        status = "active" if player.is_active else "out"
+        owned = sum(1 for h in state.properties.values() if h.owner_id == player.id)
+        print(
+            f"{marker} {player.name:<16} ${player.money:<7} "
+            f"pos {player.position:<3} {owned} properties ({status})"
+        )
+    print(f"Rebuilt in {elapsed_ms:.1f} ms")
+
+
+def run_export(args: argparse.Namespace) -> None:
+    repo, db = open_repository(args.backend, sqlite_path=args.sqlite_path)
+    try:
+        data = export_game(repo, args.game_id)
+    except ValueError as exc:
+        print(f"Export error: {exc}")
+        sys.exit(1)
+    finally:
+        if db is not None:
+            db.close()
+    if args.output == "-":
+        json.dump(data, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as fh:
+            json.dump(data, fh)
+        print(f"Exported game {args.game_id} to {args.output}")
+
+
+def run_import(args: argparse.Namespace) -> None:
+    try:
+        if args.file == "-":
+            data = json.load(sys.stdin)
+        else:
+            with open(args.file) as fh:
+                data = json.load(fh)
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"Cannot read export: {exc}")
+        sys.exit(1)
+    repo, db = open_repository(args.backend, sqlite_path=args.sqlite_path)
+    try:
+        game_id = import_game(repo, data)
+    except (KeyError, ValueError) as exc:
+        print(f"Import error: {exc}")
+        sys.exit(1)
+    finally:
+        if db is not None:
+            db.close()
+    print(f"Imported as game {game_id}")
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    if args.backend == "sqlite":
+        print("The server needs the 'postgres' or 'memory' backend.")
+        sys.exit(2)
+    if args.backend == "postgres" and shard_dsns_from_env():
+        # The server's async repository talks to a single database.
+        print("The server does not support DATABASE_SHARD_URLS; unset it to serve.")
+        sys.exit(2)
+    if args.backend == "memory":
+        await serve(
+            AsyncRepositoryAdapter(InMemoryRepository()),
+            args.host,
+            args.port,
+            seed=args.seed,
+        )
+        return
+    try:
+        db = AsyncDatabase()
+    except ValueError as exc:
+        print(f"Database error: {exc}")
+        sys.exit(1)
+    async with db:
+        repo = AsyncRepository(db)
+        if args.reset_schema:
+            await repo.reset_schema()
+        await serve(repo, args.host, args.port, seed=args.seed)
+
+
+def run_script(args: argparse.Namespace) -> None:
+    from monopoly.cli.script import ScriptRunner
+
+    repo, db = open_repository(
+        args.backend, args.buffered_ledger, args.pipeline, args.sqlite_path
+    )
+    instrumentation: Optional[Instrumentation] = None
+    if args.instrument:
+        instrumentation = Instrumentation()
+        attach_instrumentation(instrumentation, db)
+        repo = instrumentation.wrap(repo)
+    runner = ScriptRunner(repo, seed=args.seed)
+    try:
+        if args.file == "-":
+            errors = runner.run(sys.stdin, sys.stdout, args.stop_on_error)
+        else:
+            with open(args.file) as fh:
+                errors = runner.run(fh, sys.stdout, args.stop_on_error)
+    finally:
+        if instrumentation is not None:
+            instrumentation.dump(args.instrument)
+        if db is not None:
+            db.close()
+    if args.summary:
+        print(json.dumps({"summary": runner.metrics.to_dict()}))
+    if errors:
+        sys.exit(1)
+
+
+def run_server(args: argparse.Namespace) -> None:
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.command == "simulate":
+        run_simulation(args)
+        return
+    if args.command == "analyze":
+        run_analysis(args)
+        return
+    if args.command == "migrate":
+        run_migrations(args)
+        return
+    if args.command == "replay":
+        run_replay(args)
+        return
+    if args.command == "serve":
+        run_server(args)
+        return
+    if args.command == "script":
+        run_script(args)
+        return
+    if args.command == "export":
+        run_export(args)
+        return
+    if args.command == "import":
+        run_import(args)
+        return
+    if args.command == "games":
+        run_games(args)
+        return
+    if args.command == "leaderboard":
+        run_leaderboard(args)
+        return
+    print_banner()
+    repo, db = open_repository(
+        args.backend, args.buffered_ledger, args.pipeline, args.sqlite_path
+    )
+    dumper: Optional[PeriodicDump] = None
+    if args.instrument:
+        instrumentation = Instrumentation()
+        attach_instrumentation(instrumentation, db)
+        repo = instrumentation.wrap(repo)
+        dumper = PeriodicDump(instrumentation, args.instrument).start()
 
     while True:
         print("\nMain Menu")
@@ -405,6 +943,10 @@ def main() -> None:
             print_rules()
         elif choice == "4":
             print("Goodbye!")
+            if dumper is not None:
+                dumper.stop()
+            if db is not None:
+                db.close()
             sys.exit(0)
         else:
             print("Invalid selection.")
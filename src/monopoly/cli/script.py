@@ -0,0 +1,147 @@
+"""Scripted, non-interactive play: one command per line, one JSON line back.
+
+Scripts run the game server's commands (see ``monopoly.server.app``) through
+the server's own dispatcher, plus a few setup commands::
+
+    seed <n>                                   seed dice for later games
+    board default | tiled <size> | <path>      board for later ``new`` games
+    new <starting_money> <name> <name> [...]   create a game and play it
+    load <game_id>                             play an existing game
+    roll                                       current player rolls and moves
+    buy | improve | sell                       act on the space just landed on
+    end                                        finish the turn
+    status                                     players, owners and turn pointer
+
+``<path>`` is a JSON list of ``DEFAULT_BOARD``-style spaces. Blank lines and
+lines starting with ``#`` are skipped. Every other line prints one JSON
+object with the line number, command, ``ok``, the time it took in ``ms``
+and either ``result`` or ``error``, so recorded sessions can be replayed in
+bulk and timed end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, TextIO
+
+from monopoly.db.aio import AsyncRepositoryAdapter
+from monopoly.db.base import GameRepository
+from monopoly.domain.async_engine import AsyncGameEngine
+from monopoly.domain.game_engine import DEFAULT_BOARD, HouseRules
+from monopoly.server.app import CommandError, GameServer, Session, Table
+from monopoly.server.metrics import GameMetrics
+from monopoly.sim.board import normalize_board, tiled_board
+
+
+def read_board(path: str) -> List[Mapping[str, Any]]:
+    """Spaces from a JSON board file, for the ``board`` command."""
+    try:
+        with open(path) as fh:
+            layout = json.load(fh)
+    except OSError as exc:
+        raise CommandError(f"Cannot read board: {exc}") from exc
+    if not isinstance(layout, list):
+        raise CommandError("Board file must hold a JSON list of spaces.")
+    return layout
+
+
+class ScriptRunner(GameServer):
+    """Plays script commands against one repository, one game at a time.
+
+    Game commands are the server's; the blocking ``repo`` is served through
+    ``AsyncRepositoryAdapter`` and driven by one event loop per ``run``.
+    Commands run one at a time on that loop, so a call that blocks on the
+    database holds up nothing else; board files are read off the loop.
+    """
+
+    unbound_commands = GameServer.unbound_commands | {"seed", "board", "load"}
+    no_game_message = "Create or load a game first."
+
+    def __init__(
+        self,
+        repo: GameRepository,
+        rules: Optional[HouseRules] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__(AsyncRepositoryAdapter(repo), rules, seed)
+        self.session = Session()
+        self.metrics = GameMetrics()
+        self._games = 0
+
+    def _rng(self, game_id: int) -> random.Random:
+        # Seeded by game count rather than id, so a script replays the same
+        # dice whatever ids the database hands out.
+        self._games += 1
+        if self.seed is None:
+            return random.Random()
+        return random.Random(f"monopoly-script:{self.seed}:{self._games}")
+
+    def run(
+        self, lines: Iterable[str], out: TextIO, stop_on_error: bool = False
+    ) -> int:
+        """Execute every command in ``lines``; returns the number that failed."""
+        return asyncio.run(self._run(lines, out, stop_on_error))
+
+    async def _run(self, lines: Iterable[str], out: TextIO, stop_on_error: bool) -> int:
+        for number, line in enumerate(lines, start=1):
+            text = line.strip()
+            if not text or text.startswith("#"):
+                continue
+            command = text.split()[0].lower()
+            started = time.perf_counter()
+            ok, result = await self.execute(self.session, text)
+            elapsed = time.perf_counter() - started
+            self.metrics.record(command, elapsed, ok)
+            if ok and command == "roll":
+                self.metrics.turns += 1
+            record: Dict[str, Any] = {
+                "line": number,
+                "command": command,
+                "ok": ok,
+                "ms": round(elapsed * 1000, 3),
+                "result" if ok else "error": result,
+            }
+            out.write(json.dumps(record, default=str) + "\n")
+            if not ok and stop_on_error:
+                break
+        return self.metrics.errors
+
+    async def _cmd_seed(self, session: Session, args: List[str]) -> Dict[str, Any]:
+        if len(args) != 1 or not args[0].lstrip("-").isdigit():
+            raise CommandError("Usage: seed <n>")
+        self.seed, self._games = int(args[0]), 0
+        return {"seed": self.seed}
+
+    async def _cmd_board(self, session: Session, args: List[str]) -> Dict[str, Any]:
+        if args == ["default"]:
+            layout: Sequence[Mapping[str, Any]] = DEFAULT_BOARD
+        elif len(args) == 2 and args[0] == "tiled" and args[1].isdigit():
+            layout = tiled_board(int(args[1]))
+        elif len(args) == 1:
+            layout = await asyncio.to_thread(read_board, args[0])
+        else:
+            raise CommandError("Usage: board default | tiled <size> | <path>")
+        try:
+            normalize_board(layout)
+        except (KeyError, TypeError) as exc:
+            raise CommandError(f"Invalid board: {exc}") from exc
+        self.board = layout
+        return {"spaces": len(layout)}
+
+    async def _cmd_load(self, session: Session, args: List[str]) -> Dict[str, Any]:
+        if len(args) != 1 or not args[0].isdigit():
+            raise CommandError("Usage: load <game_id>")
+        game_id = int(args[0])
+        if await self.repo.get_game(game_id) is None:
+            raise CommandError(f"Game {game_id} not found.")
+        # A fresh table: the game may have moved on outside this script.
+        table = self.tables[game_id] = Table(
+            AsyncGameEngine(self.repo, game_id, self.rules, self._rng(game_id))
+        )
+        await table.engine.ensure_game_ready()
+        current = await table.engine.ensure_turn_pointer()
+        session.game_id, session.player_id = game_id, None
+        return {"game_id": game_id, "current_player": current.model_dump()}
@@ -0,0 +1,12 @@
+"""Context shared by the game engines and the storage layer."""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Optional
+
+# Name of the outermost engine operation running in this context, so storage
+# instrumentation can attribute queries to it (see monopoly.db.instrument).
+current_operation: ContextVar[Optional[str]] = ContextVar(
+    "monopoly_engine_operation", default=None
+)
@@ -1,6 +1,33 @@
 """Database helpers."""
 
-from .connection import Database
+from .aio import AsyncDatabase, AsyncRepository, AsyncRepositoryAdapter
+from .base import GameRepository
+from .connection import Database, PoolStats, ReplicaStats
+from .instrument import Instrumentation, QueryBudgetExceeded
+from .ledger import BufferedLedger
+from .memory import InMemoryRepository
+from .portable import export_game, import_game
 from .repository import Repository
+from .sharding import ShardMap, ShardedRepository
+from .sqlite import SqliteDatabase, SqliteRepository
 
-__all__ = ["Database", "Repository"]
+__all__ = [
+    "AsyncDatabase",
+    "AsyncRepository",
+    "AsyncRepositoryAdapter",
+    "BufferedLedger",
+    "Database",
+    "GameRepository",
+    "InMemoryRepository",
+    "Instrumentation",
+    "PoolStats",
+    "QueryBudgetExceeded",
+    "ReplicaStats",
+    "Repository",
+    "ShardMap",
+    "ShardedRepository",
+    "SqliteDatabase",
+    "SqliteRepository",
+    "export_game",
+    "import_game",
+]
@@ -0,0 +1,631 @@
+"""asyncio counterparts of ``Database`` and ``Repository``."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import psycopg
+from psycopg import AsyncCursor, sql
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
+from pydantic import BaseModel
+
+from monopoly.db.base import GameRepository
+from monopoly.db.connection import (
+    DEFAULT_POOL_MAX_IDLE,
+    DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_POOL_MIN_SIZE,
+    DEFAULT_POOL_TIMEOUT,
+    DEFAULT_RECONNECT_TIMEOUT,
+    SCHEMA_PATH,
+)
+from monopoly.db.migrate import (
+    CREATE_MIGRATIONS_TABLE,
+    MIGRATION_LOCK_ID,
+    Migration,
+    load_migrations,
+)
+from monopoly.db.repository import (
+    ADJUST_MONEY_SQL,
+    BOARD_STATUS_QUERY,
+    CREDIT_PLAYER_SQL,
+    DELETE_GAME_SQL,
+    ELIMINATE_PLAYER_SQL,
+    INCREMENT_IMPROVEMENT_SQL,
+    INSERT_EVENT_SQL,
+    INSERT_GAME_SQL,
+    INSERT_PLAYER_SQL,
+    INSERT_SPACES_SQL,
+    INSERT_TRANSACTION_SQL,
+    LAST_EVENT_TURN_SQL,
+    LIQUIDATE_PROPERTIES_SQL,
+    LIST_ACTIVE_PLAYERS_SQL,
+    LIST_PLAYERS_SQL,
+    LIST_PROPERTY_STATES_SQL,
+    PROPERTIES_BY_OWNER_SQL,
+    PROPERTY_STATE_COLUMNS,
+    RELEASE_PROPERTIES_SQL,
+    RESET_TURN_ORDERS_SQL,
+    SAVE_SNAPSHOT_SQL,
+    SELECT_GAME_SQL,
+    SELECT_PLAYER_SQL,
+    SELECT_PROPERTY_STATE_SQL,
+    SELECT_SPACES_SQL,
+    SET_CURRENT_TURN_SQL,
+    SPACE_COLUMNS,
+    STANDINGS_SQL,
+    UPDATE_ACTIVE_SQL,
+    UPDATE_GAME_STATUS_SQL,
+    UPDATE_POSITION_SQL,
+    BoardStatusDecoder,
+    event_rows,
+    events_query,
+    latest_snapshot_query,
+    property_owner_update,
+    ranked,
+    space_params,
+)
+from monopoly.db.rows import model_row, row_maker
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    GameSession,
+    GameSnapshot,
+    Player,
+    PropertyState,
+    SpaceDraft,
+    Standing,
+    TurnEvent,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class AsyncGameRepository(Protocol):
+    """Awaitable subset of ``GameRepository`` used by ``AsyncGameEngine``."""
+
+    def unit_of_work(self) -> Any: ...
+
+    def primary_reads(self) -> Any: ...
+
+    async def end_turn(self, game_id: int) -> None: ...
+
+    async def reset_schema(self) -> None: ...
+
+    async def create_game(self, status: str = "setup") -> GameSession: ...
+
+    async def get_game(self, game_id: int) -> Optional[GameSession]: ...
+
+    async def board_status(self, game_id: int) -> Optional[BoardStatus]: ...
+
+    async def update_game_status(self, game_id: int, status: str) -> None: ...
+
+    async def set_current_turn(self, game_id: int, player_id: int) -> None: ...
+
+    async def add_player(
+        self, game_id: int, name: str, starting_money: int, turn_order: int
+    ) -> Player: ...
+
+    async def list_players(
+        self, game_id: int, active_only: bool = False
+    ) -> List[Player]: ...
+
+    async def get_player(self, player_id: int) -> Optional[Player]: ...
+
+    async def update_player_position(self, player_id: int, position: int) -> None: ...
+
+    async def update_player_active(self, player_id: int, is_active: bool) -> None: ...
+
+    async def adjust_money(
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
+    ) -> Player: ...
+
+    async def standings(self, game_id: int) -> List[Standing]: ...
+
+    async def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]: ...
+
+    async def list_spaces(self, game_id: int) -> List[BoardSpace]: ...
+
+    async def get_property_state(
+        self, game_id: int, space_id: int
+    ) -> Optional[PropertyState]: ...
+
+    async def set_property_owner(
+        self,
+        game_id: int,
+        space_id: int,
+        owner_id: Optional[int],
+        improvement_count: Optional[int] = None,
+    ) -> None: ...
+
+    async def increment_improvement(
+        self, game_id: int, space_id: int
+    ) -> PropertyState: ...
+
+    async def properties_by_owner(
+        self, game_id: int, owner_id: int
+    ) -> List[tuple[BoardSpace, PropertyState]]: ...
+
+    async def release_properties_to_bank(self, game_id: int, owner_id: int) -> None: ...
+
+    async def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]: ...
+
+    async def eliminate_player(self, game_id: int, player_id: int) -> None: ...
+
+    async def reset_turn_orders(self, game_id: int) -> None: ...
+
+    async def transfer_money(
+        self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
+    ) -> None: ...
+
+    async def list_property_states(self, game_id: int) -> List[PropertyState]: ...
+
+    async def append_events(
+        self, game_id: int, events: Sequence[TurnEvent]
+    ) -> None: ...
+
+    async def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]: ...
+
+    async def last_event_turn(self, game_id: int) -> Optional[int]: ...
+
+    async def save_snapshot(
+        self, game_id: int, turn: int, state: Dict[str, Any]
+    ) -> None: ...
+
+    async def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]: ...
+
+
+class AsyncDatabase:
+    """``Database`` on an ``AsyncConnectionPool``.
+
+    Connections and transactions follow the same rules as the blocking
+    version: inside ``transaction()`` every ``connection()`` call in the
+    current task reuses the transaction's connection.
+    """
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        max_idle: float = DEFAULT_POOL_MAX_IDLE,
+        timeout: float = DEFAULT_POOL_TIMEOUT,
+        reconnect_timeout: float = DEFAULT_RECONNECT_TIMEOUT,
+        check_connections: bool = True,
+    ) -> None:
+        resolved_dsn = dsn or os.getenv("DATABASE_URL")
+        if not resolved_dsn:
+            raise ValueError(
+                "DATABASE_URL environment variable is required for database access."
+            )
+        if min_size < 0 or max_size < max(min_size, 1):
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size.")
+        self.dsn: str = resolved_dsn
+        self.pool: AsyncConnectionPool = AsyncConnectionPool(
+            self.dsn,
+            min_size=min_size,
+            max_size=max_size,
+            max_idle=max_idle,
+            timeout=timeout,
+            reconnect_timeout=reconnect_timeout,
+            check=AsyncConnectionPool.check_connection if check_connections else None,
+            kwargs={"autocommit": True},
+            open=False,
+        )
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._opened = False
+        self._closed = False
+        self._active: ContextVar[Optional[psycopg.AsyncConnection]] = ContextVar(
+            f"monopoly_async_db_active_{id(self)}", default=None
+        )
+
+    async def _ensure_open(self) -> None:
+        if self._opened:
+            return
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._closed:
+                raise RuntimeError(
+                    "AsyncDatabase is closed; create a new one to reconnect."
+                )
+            if not self._opened:
+                await self.pool.open()
+                self._opened = True
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        active = self._active.get()
+        if active is not None:
+            yield active
+            return
+        await self._ensure_open()
+        async with self.pool.connection() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        active = self._active.get()
+        if active is not None:
+            yield active
+            return
+        await self._ensure_open()
+        async with self.pool.connection() as conn, conn.transaction():
+            token = self._active.set(conn)
+            try:
+                yield conn
+            finally:
+                self._active.reset(token)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._opened:
+            await self.pool.close()
+            self._opened = False
+
+    async def __aenter__(self) -> "AsyncDatabase":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def apply_schema(self) -> None:
+        schema_sql = SCHEMA_PATH.read_text()
+        async with self.connection() as conn, conn.cursor() as cur:
+            await cur.execute(sql.SQL(schema_sql))  # type: ignore[arg-type]
+        await self.migrate()
+
+    async def migrate(self) -> List[Migration]:
+        """Async counterpart of ``Database.migrate``."""
+        async with self.connection() as conn, conn.cursor() as cur:
+            await cur.execute(CREATE_MIGRATIONS_TABLE)
+            await cur.execute("SELECT version FROM schema_migrations;")
+            done = {row[0] for row in await cur.fetchall()}
+        applied: list[Migration] = []
+        for migration in load_migrations():
+            if migration.version in done:
+                continue
+            async with self.transaction() as conn, conn.cursor() as cur:
+                await cur.execute(
+                    "SELECT pg_advisory_xact_lock(%s);", (MIGRATION_LOCK_ID,)
+                )
+                await cur.execute(
+                    "SELECT 1 FROM schema_migrations WHERE version = %s;",
+                    (migration.version,),
+                )
+                if await cur.fetchone():
+                    continue
+                await cur.execute(sql.SQL(migration.sql))  # type: ignore[arg-type]
+                backfill = migration.backfill()
+                if backfill is not None:
+                    await cur.execute(*backfill)
+                await cur.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s);",
+                    (migration.version, migration.name),
+                )
+            applied.append(migration)
+        return applied
+
+
+class AsyncRepository:
+    """Non-blocking ``Repository`` with the same SQL and row decoding."""
+
+    def __init__(self, db: AsyncDatabase, trusted_rows: bool = True) -> None:
+        self.db = db
+        self.trusted_rows = trusted_rows
+        self._owned_space = row_maker(BoardSpace, SPACE_COLUMNS, trusted_rows)
+        self._owned_state = row_maker(
+            PropertyState, PROPERTY_STATE_COLUMNS, trusted_rows
+        )
+        self._board_status = BoardStatusDecoder(trusted_rows)
+
+    @asynccontextmanager
+    async def _cursor(self, model: Type[M]) -> AsyncIterator[AsyncCursor[M]]:
+        async with self.db.connection() as conn:
+            async with conn.cursor(
+                row_factory=model_row(model, self.trusted_rows)
+            ) as cur:
+                yield cur
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        async with self.db.transaction():
+            yield
+
+    @asynccontextmanager
+    async def primary_reads(self) -> AsyncIterator[None]:
+        """Every read already goes to the primary; see ``Repository``."""
+        yield
+
+    async def end_turn(self, game_id: int) -> None:
+        """Ledger rows are written in the turn's own statements."""
+
+    async def reset_schema(self) -> None:
+        await self.db.apply_schema()
+
+    async def create_game(self, status: str = "setup") -> GameSession:
+        async with self._cursor(GameSession) as cur:
+            await cur.execute(INSERT_GAME_SQL, (status,))
+            return await cur.fetchone()
+
+    async def get_game(self, game_id: int) -> Optional[GameSession]:
+        async with self._cursor(GameSession) as cur:
+            await cur.execute(SELECT_GAME_SQL, (game_id,))
+            return await cur.fetchone()
+
+    async def board_status(self, game_id: int) -> Optional[BoardStatus]:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(BOARD_STATUS_QUERY, (game_id,))
+            row = await cur.fetchone()
+        return self._board_status(row) if row is not None else None
+
+    async def delete_game(self, game_id: int) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(DELETE_GAME_SQL, (game_id,))
+
+    async def update_game_status(self, game_id: int, status: str) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(UPDATE_GAME_STATUS_SQL, (status, game_id))
+
+    async def set_current_turn(self, game_id: int, player_id: int) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(SET_CURRENT_TURN_SQL, (player_id, game_id))
+
+    async def add_player(
+        self, game_id: int, name: str, starting_money: int, turn_order: int
+    ) -> Player:
+        async with self.db.connection() as conn:
+            async with conn.cursor(row_factory=model_row(Player, trusted=False)) as cur:
+                await cur.execute(
+                    INSERT_PLAYER_SQL, (game_id, name, starting_money, turn_order)
+                )
+                return await cur.fetchone()
+
+    async def list_players(
+        self, game_id: int, active_only: bool = False
+    ) -> List[Player]:
+        query = LIST_ACTIVE_PLAYERS_SQL if active_only else LIST_PLAYERS_SQL
+        async with self._cursor(Player) as cur:
+            await cur.execute(query, (game_id,))
+            return await cur.fetchall()
+
+    async def get_player(self, player_id: int) -> Optional[Player]:
+        async with self._cursor(Player) as cur:
+            await cur.execute(SELECT_PLAYER_SQL, (player_id,))
+            return await cur.fetchone()
+
+    async def update_player_position(self, player_id: int, position: int) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(UPDATE_POSITION_SQL, (position, player_id))
+
+    async def update_player_active(self, player_id: int, is_active: bool) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(UPDATE_ACTIVE_SQL, (is_active, player_id))
+
+    async def adjust_money(
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
+    ) -> Player:
+        async with self._cursor(Player) as cur:
+            await cur.execute(ADJUST_MONEY_SQL, (delta, holdings_delta, player_id))
+            row = await cur.fetchone()
+            await cur.execute(
+                INSERT_TRANSACTION_SQL, (game_id, player_id, delta, description)
+            )
+            return row
+
+    async def standings(self, game_id: int) -> List[Standing]:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(STANDINGS_SQL, (game_id,))
+            return ranked(await cur.fetchall())
+
+    async def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]:
+        if not drafts:
+            return []
+        async with self._cursor(BoardSpace) as cur:
+            await cur.execute(INSERT_SPACES_SQL, space_params(game_id, drafts))
+            return await cur.fetchall()
+
+    async def list_spaces(self, game_id: int) -> List[BoardSpace]:
+        async with self._cursor(BoardSpace) as cur:
+            await cur.execute(SELECT_SPACES_SQL, (game_id,))
+            return await cur.fetchall()
+
+    async def get_property_state(
+        self, game_id: int, space_id: int
+    ) -> Optional[PropertyState]:
+        async with self._cursor(PropertyState) as cur:
+            await cur.execute(SELECT_PROPERTY_STATE_SQL, (game_id, space_id))
+            return await cur.fetchone()
+
+    async def set_property_owner(
+        self,
+        game_id: int,
+        space_id: int,
+        owner_id: Optional[int],
+        improvement_count: Optional[int] = None,
+    ) -> None:
+        update_sql, params = property_owner_update(
+            game_id, space_id, owner_id, improvement_count
+        )
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(update_sql, params)
+
+    async def increment_improvement(self, game_id: int, space_id: int) -> PropertyState:
+        async with self._cursor(PropertyState) as cur:
+            await cur.execute(INCREMENT_IMPROVEMENT_SQL, (game_id, space_id))
+            return await cur.fetchone()
+
+    async def properties_by_owner(
+        self, game_id: int, owner_id: int
+    ) -> List[tuple[BoardSpace, PropertyState]]:
+        split = len(SPACE_COLUMNS)
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(PROPERTIES_BY_OWNER_SQL, (game_id, owner_id))
+            return [
+                (self._owned_space(row[:split]), self._owned_state(row[split:]))
+                for row in await cur.fetchall()
+            ]
+
+    async def release_properties_to_bank(self, game_id: int, owner_id: int) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                RELEASE_PROPERTIES_SQL, {"game_id": game_id, "owner_id": owner_id}
+            )
+
+    async def reset_turn_orders(self, game_id: int) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(RESET_TURN_ORDERS_SQL, {"game_id": game_id})
+
+    async def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                LIQUIDATE_PROPERTIES_SQL,
+                {
+                    "game_id": game_id,
+                    "owner_id": owner_id,
+                    "sellback_ratio": sellback_ratio,
+                    "improvement_value": improvement_value,
+                },
+            )
+            return [(space_id, value) for space_id, value in await cur.fetchall()]
+
+    async def eliminate_player(self, game_id: int, player_id: int) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                ELIMINATE_PLAYER_SQL, {"game_id": game_id, "player_id": player_id}
+            )
+
+    async def transfer_money(
+        self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
+    ) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            for player_id, delta, note in (
+                (payer_id, -amount, f"Paid {amount} for {description}"),
+                (payee_id, amount, f"Received {amount} for {description}"),
+            ):
+                await cur.execute(CREDIT_PLAYER_SQL, (delta, player_id))
+                await cur.execute(
+                    INSERT_TRANSACTION_SQL, (game_id, player_id, delta, note)
+                )
+
+    async def list_property_states(self, game_id: int) -> List[PropertyState]:
+        async with self._cursor(PropertyState) as cur:
+            await cur.execute(LIST_PROPERTY_STATES_SQL, (game_id,))
+            return await cur.fetchall()
+
+    async def append_events(self, game_id: int, events: Sequence[TurnEvent]) -> None:
+        if not events:
+            return
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.executemany(INSERT_EVENT_SQL, event_rows(game_id, events))
+
+    async def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]:
+        query, params = events_query(game_id, after_turn, upto_turn)
+        async with self._cursor(TurnEvent) as cur:
+            await cur.execute(query, params)
+            return await cur.fetchall()
+
+    async def last_event_turn(self, game_id: int) -> Optional[int]:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(LAST_EVENT_TURN_SQL, (game_id,))
+            row = await cur.fetchone()
+            return row[0] if row else None
+
+    async def save_snapshot(
+        self, game_id: int, turn: int, state: Dict[str, Any]
+    ) -> None:
+        async with self.db.connection() as conn, conn.cursor() as cur:
+            await cur.execute(SAVE_SNAPSHOT_SQL, (game_id, turn, Jsonb(state)))
+
+    async def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]:
+        query, params = latest_snapshot_query(game_id, upto_turn)
+        async with self._cursor(GameSnapshot) as cur:
+            await cur.execute(query, params)
+            return await cur.fetchone()
+
+
+class AsyncRepositoryAdapter:
+    """Expose a blocking ``GameRepository`` through the async interface.
+
+    Calls run inline on the event loop and block it while they run. That
+    suits backends that never block, such as ``InMemoryRepository``, and a
+    loop with a single task, such as ``monopoly.cli.script.ScriptRunner``,
+    which plays one command at a time over any backend. Do not serve
+    concurrent sessions (``monopoly.server``) over a blocking database this
+    way: one slow query would stall every game.
+    """
+
+    def __init__(self, repo: GameRepository) -> None:
+        self.repo = repo
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        with self.repo.unit_of_work():
+            yield
+
+    @asynccontextmanager
+    async def primary_reads(self) -> AsyncIterator[None]:
+        with self.repo.primary_reads():
+            yield
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self.repo, name)
+
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+
+        setattr(self, name, call)
+        return call
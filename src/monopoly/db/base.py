@@ -0,0 +1,200 @@
+"""Storage interface shared by every repository backend."""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    GameSession,
+    GameSnapshot,
+    GameStats,
+    Player,
+    PropertyState,
+    SpaceDraft,
+    SpaceType,
+    Standing,
+    Transaction,
+    TurnEvent,
+)
+
+
+class GameRepository(Protocol):
+    """Method set the game engine and CLI rely on.
+
+    ``Repository`` implements it on PostgreSQL and ``InMemoryRepository`` on
+    plain dicts; anything else that satisfies it can drive a ``GameEngine``.
+    """
+
+    def unit_of_work(self) -> ContextManager[None]: ...
+
+    def primary_reads(self) -> ContextManager[None]:
+        """Reads in the block see every committed write (no replica lag)."""
+        ...
+
+    def end_turn(self, game_id: int) -> None:
+        """Called by the engine as a turn ends; backends may flush buffers."""
+        ...
+
+    def reset_schema(self) -> None: ...
+
+    def create_game(self, status: str = "setup") -> GameSession: ...
+
+    def get_game(self, game_id: int) -> Optional[GameSession]: ...
+
+    def board_status(self, game_id: int) -> Optional[BoardStatus]: ...
+
+    def delete_game(self, game_id: int) -> None: ...
+
+    def list_games(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[GameSession]:
+        """Newest-first games, optionally only those in ``status``."""
+        ...
+
+    def game_stats(self) -> GameStats: ...
+
+    def update_game_status(self, game_id: int, status: str) -> None: ...
+
+    def set_current_turn(self, game_id: int, player_id: int) -> None: ...
+
+    def add_player(
+        self, game_id: int, name: str, starting_money: int, turn_order: int
+    ) -> Player: ...
+
+    def list_players(self, game_id: int, active_only: bool = False) -> List[Player]: ...
+
+    def get_player(self, player_id: int) -> Optional[Player]: ...
+
+    def update_player_position(self, player_id: int, position: int) -> None: ...
+
+    def update_player_active(self, player_id: int, is_active: bool) -> None: ...
+
+    def adjust_money(
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
+    ) -> Player:
+        """Add ``delta`` to the player's cash (logged) and ``holdings_delta``
+        to the sellback value of what they own (not logged)."""
+        ...
+
+    def set_holdings(self, player_id: int, holdings: int) -> None: ...
+
+    def standings(self, game_id: int) -> List[Standing]:
+        """The game's players by net worth, richest first."""
+        ...
+
+    def leaderboard(self, limit: int = 10) -> List[Standing]:
+        """The richest players across every game."""
+        ...
+
+    def set_money(self, player_id: int, amount: int) -> Player: ...
+
+    def add_space(
+        self,
+        game_id: int,
+        sequence_order: int,
+        name: str,
+        type_: SpaceType | str,
+        description: str | None = None,
+        purchase_cost: int | None = None,
+        base_rent: int | None = None,
+        event_amount: int = 0,
+        move_target: int | None = None,
+    ) -> BoardSpace: ...
+
+    def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]: ...
+
+    def list_spaces(self, game_id: int) -> List[BoardSpace]: ...
+
+    def get_space_by_order(
+        self, game_id: int, sequence_order: int
+    ) -> Optional[BoardSpace]: ...
+
+    def get_space_by_id(self, space_id: int) -> Optional[BoardSpace]: ...
+
+    def get_property_state(
+        self, game_id: int, space_id: int
+    ) -> Optional[PropertyState]: ...
+
+    def set_property_owner(
+        self,
+        game_id: int,
+        space_id: int,
+        owner_id: Optional[int],
+        improvement_count: Optional[int] = None,
+    ) -> None: ...
+
+    def increment_improvement(self, game_id: int, space_id: int) -> PropertyState: ...
+
+    def properties_by_owner(
+        self, game_id: int, owner_id: int
+    ) -> List[tuple[BoardSpace, PropertyState]]: ...
+
+    def release_properties_to_bank(self, game_id: int, owner_id: int) -> None: ...
+
+    def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]: ...
+
+    def eliminate_player(self, game_id: int, player_id: int) -> None: ...
+
+    def count_spaces(self, game_id: int) -> int: ...
+
+    def next_sequence_order(self, game_id: int) -> int: ...
+
+    def reset_turn_orders(self, game_id: int) -> None: ...
+
+    def transfer_money(
+        self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
+    ) -> None: ...
+
+    def remove_player(self, player_id: int) -> None: ...
+
+    def list_transactions(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Transaction]:
+        """Newest-first ledger rows for a game."""
+        ...
+
+    def append_transactions(
+        self, game_id: int, entries: Sequence[Tuple[Optional[int], int, str]]
+    ) -> None:
+        """Add ``(player_id, amount, description)`` ledger rows as given."""
+        ...
+
+    def list_property_states(self, game_id: int) -> List[PropertyState]: ...
+
+    def append_events(self, game_id: int, events: Sequence[TurnEvent]) -> None: ...
+
+    def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]: ...
+
+    def last_event_turn(self, game_id: int) -> Optional[int]: ...
+
+    def save_snapshot(self, game_id: int, turn: int, state: Dict[str, Any]) -> None: ...
+
+    def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]: ...
@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import os
-from contextlib import contextmanager
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Type
 
 import psycopg
 from psycopg import sql
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+from psycopg.pq import TransactionStatus
+from psycopg_pool import ConnectionPool
 from dotenv import load_dotenv
 
+from monopoly.db.migrate import (
+    CREATE_MIGRATIONS_TABLE,
+    HOT_QUERIES,
+    MIGRATION_LOCK_ID,
+    IndexCheck,
+    IndexCheckResult,
+    Migration,
+    load_migrations,
+    plan_indexes,
+)
+
 
 SCHEMA_PATH = Path(__file__).with_name("schema.sql")
 ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
@@ -19,26 +37,445 @@ ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
 # running via CLI without exporting DATABASE_URL manually.
 load_dotenv(ENV_PATH)
 
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 10
+DEFAULT_POOL_MAX_IDLE = 300.0
+DEFAULT_POOL_TIMEOUT = 30.0
+DEFAULT_RECONNECT_TIMEOUT = 300.0
+# Replica reads give up on a replica after this long and skip it for
+# DEFAULT_REPLICA_RETRY seconds before trying it again.
+DEFAULT_REPLICA_TIMEOUT = 2.0
+DEFAULT_REPLICA_RETRY = 5.0
+# After a context writes, its reads stay on the primary this long; it should
+# exceed the usual replication lag.
+DEFAULT_READ_YOUR_WRITES = 2.0
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time counters for the connection pool."""
+
+    min_size: int
+    max_size: int
+    size: int
+    available: int
+    checkouts: int
+    waits: int
+    waiting_now: int
+    wait_ms: int
+    connections_created: int
+    connection_errors: int
+    connections_lost: int
+    bad_returns: int
+
+    @classmethod
+    def of(cls, pool: ConnectionPool) -> "PoolStats":
+        stats = pool.get_stats()
+        return cls(
+            min_size=stats.get("pool_min", pool.min_size),
+            max_size=stats.get("pool_max", pool.max_size),
+            size=stats.get("pool_size", 0),
+            available=stats.get("pool_available", 0),
+            checkouts=stats.get("requests_num", 0),
+            waits=stats.get("requests_queued", 0),
+            waiting_now=stats.get("requests_waiting", 0),
+            wait_ms=stats.get("requests_wait_ms", 0),
+            connections_created=stats.get("connections_num", 0),
+            connection_errors=stats.get("connections_errors", 0),
+            connections_lost=stats.get("connections_lost", 0),
+            bad_returns=stats.get("returns_bad", 0),
+        )
+
+
+@dataclass
+class Replica:
+    """A read replica's pool and health."""
+
+    dsn: str
+    pool: ConnectionPool
+    opened: bool = False
+    down_until: float = 0.0
+    reads: int = 0
+    failures: int = 0
+
+    @property
+    def name(self) -> str:
+        """The DSN without its password, for logs and stats."""
+        params = conninfo_to_dict(self.dsn)
+        params.pop("password", None)
+        return make_conninfo(**params)
+
+    def healthy(self, now: float) -> bool:
+        return self.down_until <= now
+
+
+@dataclass(frozen=True)
+class ReplicaStats:
+    name: str
+    healthy: bool
+    reads: int
+    failures: int
+    pool: Optional[PoolStats]
+
+
+def replica_dsns_from_env() -> List[str]:
+    """Replica DSNs from ``DATABASE_REPLICA_URLS`` (comma-separated)."""
+    value = os.getenv("DATABASE_REPLICA_URLS", "")
+    return [dsn.strip() for dsn in value.split(",") if dsn.strip()]
+
 
 class Database:
-    """Thin wrapper to manage connections and schema creation."""
+    """Thin wrapper to manage pooled connections and schema creation.
+
+    Outside a transaction every ``connection()`` call checks out an autocommit
+    connection. Inside ``transaction()`` the same connection is handed to every
+    caller in the current context so a whole unit of work commits once.
 
-    def __init__(self, dsn: str | None = None) -> None:
+    ``replica_dsns`` (default: ``DATABASE_REPLICA_URLS``) adds read replicas.
+    Writes and transactions always use the primary; ``read_connection()``
+    spreads reads that tolerate replica lag over the healthy replicas.
+    """
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        max_idle: float = DEFAULT_POOL_MAX_IDLE,
+        timeout: float = DEFAULT_POOL_TIMEOUT,
+        reconnect_timeout: float = DEFAULT_RECONNECT_TIMEOUT,
+        check_connections: bool = True,
+        replica_dsns: Optional[Sequence[str]] = None,
+        replica_timeout: float = DEFAULT_REPLICA_TIMEOUT,
+        replica_retry: float = DEFAULT_REPLICA_RETRY,
+        read_your_writes: float = DEFAULT_READ_YOUR_WRITES,
+    ) -> None:
         resolved_dsn = dsn or os.getenv("DATABASE_URL")
         if not resolved_dsn:
             raise ValueError(
                 "DATABASE_URL environment variable is required for database access."
             )
+        if min_size < 0 or max_size < max(min_size, 1):
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size.")
         self.dsn: str = resolved_dsn
 
+        def make_pool(dsn: str) -> ConnectionPool:
+            # Pools are opened lazily so constructing a Database never blocks
+            # on the network; the first checkout starts the pool workers.
+            return ConnectionPool(
+                dsn,
+                min_size=min_size,
+                max_size=max_size,
+                max_idle=max_idle,
+                timeout=timeout,
+                reconnect_timeout=reconnect_timeout,
+                check=self._check_connection if check_connections else None,
+                kwargs={"autocommit": True},
+                open=False,
+            )
+
+        self.pool: ConnectionPool = make_pool(self.dsn)
+        if replica_dsns is None:
+            replica_dsns = replica_dsns_from_env()
+        self.replicas: List[Replica] = [
+            Replica(dsn, make_pool(dsn)) for dsn in replica_dsns
+        ]
+        self.replica_timeout = replica_timeout
+        self.replica_retry = replica_retry
+        self.read_your_writes = read_your_writes
+        self._open_lock = threading.Lock()
+        self._opened = False
+        self._closed = False
+        self._next_replica = 0
+        self._active: ContextVar[Optional[psycopg.Connection]] = ContextVar(
+            f"monopoly_db_active_{id(self)}", default=None
+        )
+        self._wrote_at: ContextVar[Optional[float]] = ContextVar(
+            f"monopoly_db_wrote_at_{id(self)}", default=None
+        )
+        self._primary_reads: ContextVar[bool] = ContextVar(
+            f"monopoly_db_primary_reads_{id(self)}", default=False
+        )
+        self._close_hooks: List[Callable[[], object]] = []
+        # Class used for every cursor; monopoly.db.instrument swaps in one
+        # that counts statements.
+        self.cursor_factory: Type[psycopg.Cursor[Any]] = psycopg.Cursor
+
+    def _check_connection(self, conn: psycopg.Connection) -> None:
+        # The liveness check is a round trip of its own; run it through the
+        # current cursor class so instrumentation counts it every time.
+        conn.cursor_factory = self.cursor_factory
+        ConnectionPool.check_connection(conn)
+
+    def _ensure_open(self) -> None:
+        if self._opened:
+            return
+        with self._open_lock:
+            self._check_not_closed()
+            if not self._opened:
+                self.pool.open()
+                self._opened = True
+
+    def _check_not_closed(self) -> None:
+        # psycopg pools cannot be reopened, so neither can a closed Database.
+        if self._closed:
+            raise RuntimeError("Database is closed; create a new one to reconnect.")
+
     @contextmanager
     def connection(self) -> Iterator[psycopg.Connection]:
-        with psycopg.connect(self.dsn, autocommit=True) as conn:
+        """Primary connection; anything run on it counts as a write."""
+        active = self._active.get()
+        if active is not None:
+            yield active
+            return
+        try:
+            with self._primary() as conn:
+                yield conn
+        finally:
+            # Autocommit statements are visible as soon as they run, so even
+            # a failed block may have written something.
+            self._note_write()
+
+    @contextmanager
+    def _primary(self) -> Iterator[psycopg.Connection]:
+        self._ensure_open()
+        with self.pool.connection() as conn:
+            conn.cursor_factory = self.cursor_factory
+            yield conn
+
+    def _note_write(self) -> None:
+        if self.replicas:
+            self._wrote_at.set(time.monotonic())
+
+    def _reads_on_primary(self) -> bool:
+        if self._primary_reads.get():
+            return True
+        wrote_at = self._wrote_at.get()
+        return wrote_at is not None and (
+            time.monotonic() - wrote_at < self.read_your_writes
+        )
+
+    @contextmanager
+    def primary_reads(self) -> Iterator[None]:
+        """Send every read in the enclosed block to the primary."""
+        token = self._primary_reads.set(True)
+        try:
+            yield
+        finally:
+            self._primary_reads.reset(token)
+
+    @contextmanager
+    def read_connection(self) -> Iterator[psycopg.Connection]:
+        """Connection for a read that can tolerate replica lag.
+
+        Reads stay on the primary inside a transaction, inside
+        ``primary_reads()`` and for ``read_your_writes`` seconds after this
+        context last wrote. Otherwise each read takes the next healthy
+        replica in turn. A replica that cannot hand out a connection within
+        ``replica_timeout``, or whose connection breaks, is skipped for
+        ``replica_retry`` seconds; with none left reads use the primary.
+        """
+        active = self._active.get()
+        if active is not None:
+            yield active
+            return
+        if not self.replicas or self._reads_on_primary():
+            with self._primary() as conn:
+                yield conn
+            return
+        self._check_not_closed()
+        for replica in self._replica_order():
+            stack = ExitStack()
+            try:
+                if not replica.opened:
+                    replica.pool.open()
+                    replica.opened = True
+                conn = stack.enter_context(
+                    replica.pool.connection(timeout=self.replica_timeout)
+                )
+            except psycopg.OperationalError:
+                self._mark_down(replica)
+                continue
+            with stack:
+                conn.cursor_factory = self.cursor_factory
+                replica.reads += 1
+                try:
+                    yield conn
+                except psycopg.OperationalError:
+                    if conn.broken:
+                        self._mark_down(replica)
+                    raise
+            return
+        with self._primary() as conn:
             yield conn
 
+    def _replica_order(self) -> List[Replica]:
+        """Healthy replicas, starting one further along on every call."""
+        with self._open_lock:
+            start = self._next_replica
+            self._next_replica = (start + 1) % len(self.replicas)
+        now = time.monotonic()
+        rotated = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in rotated if replica.healthy(now)]
+
+    def _mark_down(self, replica: Replica) -> None:
+        replica.failures += 1
+        replica.down_until = time.monotonic() + self.replica_retry
+
+    @contextmanager
+    def transaction(self, pipeline: bool = False) -> Iterator[psycopg.Connection]:
+        """Run the enclosed repository calls on one connection and commit once.
+
+        Nested calls join the outermost transaction, so engine operations that
+        call each other (e.g. bankruptcy inside a turn) stay atomic together.
+        With ``pipeline=True`` the transaction runs in psycopg pipeline mode:
+        statements nobody waits on are sent with the next read or the commit
+        instead of each paying its own round trip, and errors surface there.
+        """
+        active = self._active.get()
+        if active is not None:
+            yield active
+            return
+        self._ensure_open()
+        with self.pool.connection() as conn:
+            conn.cursor_factory = self.cursor_factory
+            with self._pipelined(conn) if pipeline else conn.transaction():
+                token = self._active.set(conn)
+                try:
+                    yield conn
+                finally:
+                    self._active.reset(token)
+        # Read-your-writes counts from the commit: replicas cannot have
+        # replayed anything before it, however long the transaction ran.
+        self._note_write()
+
+    @contextmanager
+    def _pipelined(self, conn: psycopg.Connection) -> Iterator[None]:
+        # conn.transaction() syncs the pipeline after BEGIN and before COMMIT
+        # to report errors early; queueing them by hand lets BEGIN travel with
+        # the first read and COMMIT with the last writes. A failed statement
+        # raises at the next read or at the final sync either way.
+        try:
+            with conn.pipeline():
+                conn.execute("BEGIN")
+                yield
+                conn.execute("COMMIT")
+        except BaseException:
+            if conn.info.transaction_status != TransactionStatus.IDLE:
+                conn.rollback()
+            raise
+
+    def in_transaction(self) -> bool:
+        return self._active.get() is not None
+
+    def pool_stats(self) -> PoolStats:
+        return PoolStats.of(self.pool)
+
+    def replica_stats(self) -> List[ReplicaStats]:
+        now = time.monotonic()
+        return [
+            ReplicaStats(
+                name=replica.name,
+                healthy=replica.healthy(now),
+                reads=replica.reads,
+                failures=replica.failures,
+                pool=PoolStats.of(replica.pool) if replica.opened else None,
+            )
+            for replica in self.replicas
+        ]
+
+    def resize_pool(self, min_size: int, max_size: Optional[int] = None) -> None:
+        self.pool.resize(min_size, max_size)
+
+    def add_close_hook(self, hook: Callable[[], object]) -> None:
+        """Run ``hook`` on ``close()`` while connections are still available."""
+        self._close_hooks.append(hook)
+
+    def close(self) -> None:
+        """Run the close hooks and close every pool; later use raises."""
+        if self._closed:
+            return
+        for hook in self._close_hooks:
+            hook()
+        with self._open_lock:
+            self._closed = True
+            if self._opened:
+                self.pool.close()
+                self._opened = False
+            for replica in self.replicas:
+                if replica.opened:
+                    replica.pool.close()
+                    replica.opened = False
+
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def apply_schema(self) -> None:
+        """Drop every table and rebuild the latest schema (development only)."""
         schema_sql = SCHEMA_PATH.read_text()
         with self.connection() as conn:
             with conn.cursor() as cur:
                 # schema_sql is trusted file content; ignore literal string restriction for type checker.
                 cur.execute(sql.SQL(schema_sql))  # type: ignore[arg-type]
+        self.migrate()
+
+    def applied_migrations(self) -> List[int]:
+        with self.connection() as conn, conn.cursor() as cur:
+            cur.execute(CREATE_MIGRATIONS_TABLE)
+            cur.execute("SELECT version FROM schema_migrations ORDER BY version;")
+            return [row[0] for row in cur.fetchall()]
+
+    def migrate(self) -> List[Migration]:
+        """Apply pending migrations in order, each in its own transaction.
+
+        Existing data is kept. Safe to call on every start-up and from several
+        processes at once: an advisory lock serializes concurrent migrators.
+        """
+        applied: list[Migration] = []
+        done = set(self.applied_migrations())
+        for migration in load_migrations():
+            if migration.version in done:
+                continue
+            with self.transaction() as conn, conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_xact_lock(%s);", (MIGRATION_LOCK_ID,))
+                cur.execute(
+                    "SELECT 1 FROM schema_migrations WHERE version = %s;",
+                    (migration.version,),
+                )
+                if cur.fetchone():
+                    continue
+                cur.execute(sql.SQL(migration.sql))  # type: ignore[arg-type]
+                backfill = migration.backfill()
+                if backfill is not None:
+                    cur.execute(*backfill)
+                cur.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s);",
+                    (migration.version, migration.name),
+                )
+            applied.append(migration)
+        return applied
+
+    def check_indexes(
+        self, checks: Optional[List[IndexCheck]] = None
+    ) -> List[IndexCheckResult]:
+        """EXPLAIN each hot query and report which indexes its plan uses.
+
+        Sequential scans are disabled for the check so the result shows
+        whether an index *can* serve the query even on a small database,
+        where the planner would otherwise prefer scanning a few pages.
+        """
+        results: list[IndexCheckResult] = []
+        with self.transaction() as conn, conn.cursor() as cur:
+            cur.execute("SET LOCAL enable_seqscan = off;")
+            for check in checks or HOT_QUERIES:
+                cur.execute(
+                    "EXPLAIN (FORMAT JSON) " + check.query,  # type: ignore[operator]
+                    check.params,
+                )
+                row = cur.fetchone()
+                used = plan_indexes(row[0] if row else [])
+                results.append(IndexCheckResult(check, tuple(used)))
+        return results
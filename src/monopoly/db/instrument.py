@@ -0,0 +1,467 @@
+"""Query counts, latency histograms and round-trip budgets for storage calls.
+
+Wrap a repository to see what each engine operation costs::
+
+    instrumentation = Instrumentation(turn_budget=30)
+    instrumentation.attach(db)  # count Postgres statements (round trips)
+    repo = instrumentation.wrap(Repository(db))
+    engine = GameEngine(repo, game_id)
+
+Every repository call is recorded under the engine operation that made it
+(``roll_and_resolve``, ``next_turn``, ...; ``other`` outside one) with its
+call count, round trips, rows returned and a latency histogram. With a
+``Database`` attached a round trip is a statement sent through a cursor;
+the ``BEGIN``/``COMMIT`` of a plain transaction are not counted, and in
+``Repository(pipeline=True)`` several statements share one trip, so there
+the count is an upper bound. Without a database, e.g. on
+``InMemoryRepository``, each repository call counts as one, the least any
+remote backend would need.
+``snapshot()`` returns everything as plain data, ``dump()`` writes it as JSON
+or Prometheus text and ``PeriodicDump`` does that on a timer. With budgets
+set, an operation or turn that needs more round trips raises
+``QueryBudgetExceeded``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+import psycopg
+
+from monopoly.context import current_operation
+from monopoly.db.base import GameRepository
+from monopoly.db.connection import Database
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    1000.0,
+)
+
+OUTSIDE_OPERATION = "other"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """An operation or turn needed more round trips than its budget allows."""
+
+
+@dataclass
+class LatencyHistogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    counts: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    total_seconds: float = 0.0
+    samples: int = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self.total_seconds += seconds
+        self.samples += 1
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bucket bound (ms) below which ``fraction`` of samples fall."""
+        if not self.samples:
+            return 0.0
+        target = fraction * self.samples
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        mean = self.total_seconds / self.samples if self.samples else 0.0
+        return {
+            "count": self.samples,
+            "mean_ms": round(mean * 1000, 4),
+            "p50_ms": self.quantile(0.5),
+            "p99_ms": self.quantile(0.99),
+            "buckets_ms": dict(
+                zip([*map(str, LATENCY_BUCKETS_MS), "+Inf"], self.counts)
+            ),
+        }
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    errors: int = 0
+    round_trips: int = 0
+    rows: int = 0
+    max_round_trips: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record(self, seconds: float, round_trips: int, rows: int, ok: bool) -> None:
+        self.calls += 1
+        self.errors += 0 if ok else 1
+        self.round_trips += round_trips
+        self.rows += rows
+        self.max_round_trips = max(self.max_round_trips, round_trips)
+        self.latency.observe(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "round_trips": self.round_trips,
+            "max_round_trips": self.max_round_trips,
+            "rows": self.rows,
+            "latency": self.latency.to_dict(),
+        }
+
+
+def _row_count(result: Any) -> int:
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+class Instrumentation:
+    """Collects per-operation and per-method storage statistics.
+
+    ``operation_budgets`` maps engine operation names to the most round
+    trips one call may take; ``turn_budget`` caps the round trips between two
+    ``end_turn`` calls, i.e. one full turn of ``GameEngine``.
+
+    Budgets are checked once the operation's unit of work has committed, so
+    ``QueryBudgetExceeded`` reports a slow turn without rolling it back.
+    """
+
+    def __init__(
+        self,
+        turn_budget: Optional[int] = None,
+        operation_budgets: Optional[Dict[str, int]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.turn_budget = turn_budget
+        self.operation_budgets = dict(operation_budgets or {})
+        self.clock = clock
+        self.attached = False
+        self._lock = threading.Lock()
+        self._span: ContextVar[bool] = ContextVar(
+            f"monopoly_instrument_span_{id(self)}", default=False
+        )
+        # Turn budget breach noticed inside a span, raised when it closes.
+        self._overrun: ContextVar[Optional[str]] = ContextVar(
+            f"monopoly_instrument_overrun_{id(self)}", default=None
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.statements = 0
+            self.statement_latency = LatencyHistogram()
+            self.operations: Dict[str, CallStats] = {}
+            self.methods: Dict[Tuple[str, str], CallStats] = {}
+            self.turns = CallStats()
+            self._turn_started = (self.statements, self.clock())
+
+    # Database side: every statement sent is one round trip.
+    def attach(self, db: Database) -> None:
+        db.cursor_factory = counting_cursor(self)
+        self.attached = True
+
+    def detach(self, db: Database) -> None:
+        db.cursor_factory = psycopg.Cursor
+        self.attached = False
+
+    def statement(self, seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self.statements += 1
+            if seconds is not None:
+                self.statement_latency.observe(seconds)
+
+    # Repository side.
+    def wrap(self, repo: GameRepository) -> GameRepository:
+        return cast(GameRepository, InstrumentedRepository(repo, self))
+
+    def _stats(self, table: Dict[Any, CallStats], key: Any) -> CallStats:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = CallStats()
+        return stats
+
+    def record_method(
+        self, method: str, seconds: float, round_trips: int, rows: int, ok: bool
+    ) -> None:
+        operation = current_operation.get() or OUTSIDE_OPERATION
+        with self._lock:
+            self._stats(self.methods, (operation, method)).record(
+                seconds, round_trips, rows, ok
+            )
+
+    @contextmanager
+    def operation_span(self) -> Iterator[None]:
+        """Time the outermost unit of work and check budgets once it exits."""
+        if self._span.get():
+            yield
+            return
+        token = self._span.set(True)
+        overrun = self._overrun.set(None)
+        started, statements = self.clock(), self.statements
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            turn_overrun = self._overrun.get()
+            self._overrun.reset(overrun)
+            self._span.reset(token)
+            name = current_operation.get() or OUTSIDE_OPERATION
+            used = self.statements - statements
+            with self._lock:
+                self._stats(self.operations, name).record(
+                    self.clock() - started, used, 0, ok
+                )
+        if not ok:
+            return
+        budget = self.operation_budgets.get(name)
+        if budget is not None and used > budget:
+            raise QueryBudgetExceeded(
+                f"{name} took {used} round trips; budget is {budget}."
+            )
+        if turn_overrun is not None:
+            raise QueryBudgetExceeded(turn_overrun)
+
+    def end_turn(self) -> None:
+        now = self.clock()
+        with self._lock:
+            statements, started = self._turn_started
+            used = self.statements - statements
+            self.turns.record(now - started, used, 0, True)
+            self._turn_started = (self.statements, now)
+        if self.turn_budget is None or used <= self.turn_budget:
+            return
+        message = f"Turn took {used} round trips; budget is {self.turn_budget}."
+        if not self._span.get():
+            raise QueryBudgetExceeded(message)
+        self._overrun.set(message)
+
+    # Reporting.
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            operations: Dict[str, Any] = {
+                name: {**stats.to_dict(), "methods": {}}
+                for name, stats in sorted(self.operations.items())
+            }
+            for (operation, method), stats in sorted(self.methods.items()):
+                entry = operations.setdefault(
+                    operation, {**CallStats().to_dict(), "methods": {}}
+                )
+                entry["methods"][method] = stats.to_dict()
+            return {
+                "statements": self.statements,
+                "statement_latency": self.statement_latency.to_dict(),
+                "turns": {**self.turns.to_dict(), "budget": self.turn_budget},
+                "operations": operations,
+            }
+
+    def to_prometheus(self) -> str:
+        """The snapshot in the Prometheus text exposition format."""
+        lines = [
+            "# TYPE monopoly_statements_total counter",
+            f"monopoly_statements_total {self.statements}",
+            "# TYPE monopoly_turns_total counter",
+            f"monopoly_turns_total {self.turns.calls}",
+            f"monopoly_turn_round_trips_max {self.turns.max_round_trips}",
+        ]
+        with self._lock:
+            series = [
+                ("monopoly_operation", {"operation": name}, stats)
+                for name, stats in sorted(self.operations.items())
+            ] + [
+                ("monopoly_repository", {"operation": op, "method": method}, stats)
+                for (op, method), stats in sorted(self.methods.items())
+            ]
+        for prefix, labels, stats in series:
+            base = ",".join(f'{key}="{value}"' for key, value in labels.items())
+            lines.append(f"{prefix}_calls_total{{{base}}} {stats.calls}")
+            lines.append(f"{prefix}_errors_total{{{base}}} {stats.errors}")
+            lines.append(f"{prefix}_round_trips_total{{{base}}} {stats.round_trips}")
+            lines.append(f"{prefix}_rows_total{{{base}}} {stats.rows}")
+            cumulative = 0
+            bounds = [*(str(b / 1000) for b in LATENCY_BUCKETS_MS), "+Inf"]
+            for bound, count in zip(bounds, stats.latency.counts):
+                cumulative += count
+                lines.append(
+                    f'{prefix}_seconds_bucket{{{base},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f"{prefix}_seconds_sum{{{base}}} {stats.latency.total_seconds:.6f}"
+            )
+            lines.append(f"{prefix}_seconds_count{{{base}}} {stats.latency.samples}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: os.PathLike[str] | str) -> None:
+        """Write the snapshot to ``path``; ``.prom``/``.txt`` get Prometheus text.
+
+        The file is replaced atomically so readers never see half a dump.
+        """
+        target = Path(path)
+        if target.suffix in (".prom", ".txt"):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.snapshot(), indent=2)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(text)
+        os.replace(tmp, target)
+
+
+def counting_cursor(instrumentation: Instrumentation) -> Type[psycopg.Cursor[Any]]:
+    """Cursor class that reports every statement it sends."""
+
+    class CountingCursor(psycopg.Cursor):  # type: ignore[type-arg]
+        def execute(self, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return super().execute(*args, **kwargs)
+            finally:
+                instrumentation.statement(time.perf_counter() - started)
+
+        def executemany(self, *args: Any, **kwargs: Any) -> None:
+            started = time.perf_counter()
+            try:
+                super().executemany(*args, **kwargs)
+            finally:
+                instrumentation.statement(time.perf_counter() - started)
+
+        @contextmanager
+        def copy(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+            started = time.perf_counter()
+            try:
+                with super().copy(*args, **kwargs) as copy:
+                    yield copy
+            finally:
+                instrumentation.statement(time.perf_counter() - started)
+
+    return CountingCursor
+
+
+class InstrumentedRepository:
+    """Proxy that records every call made to ``repo``."""
+
+    def __init__(self, repo: GameRepository, instrumentation: Instrumentation) -> None:
+        self.repo = repo
+        self.instrumentation = instrumentation
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        with self.instrumentation.operation_span(), self.repo.unit_of_work():
+            yield
+
+    def primary_reads(self) -> ContextManager[None]:
+        return self.repo.primary_reads()
+
+    def end_turn(self, game_id: int) -> None:
+        self._call("end_turn", self.repo.end_turn, game_id)
+        self.instrumentation.end_turn()
+
+    def _call(
+        self, name: str, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        instrumentation = self.instrumentation
+        started, statements = instrumentation.clock(), instrumentation.statements
+        ok = False
+        try:
+            result = method(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            if not instrumentation.attached:
+                instrumentation.statement()
+            instrumentation.record_method(
+                name,
+                instrumentation.clock() - started,
+                instrumentation.statements - statements,
+                _row_count(result) if ok else 0,
+                ok,
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.repo, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._call(name, attr, *args, **kwargs)
+
+        return call
+
+
+class PeriodicDump:
+    """Background thread that dumps ``instrumentation`` every ``interval`` s."""
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        path: os.PathLike[str] | str,
+        interval: float = 10.0,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        self.instrumentation = instrumentation
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="monopoly-instrument-dump", daemon=True
+        )
+
+    def start(self) -> "PeriodicDump":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.instrumentation.dump(self.path)
+
+    def stop(self) -> None:
+        """Stop the timer and write a final dump."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.instrumentation.dump(self.path)
+
+    def __enter__(self) -> "PeriodicDump":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
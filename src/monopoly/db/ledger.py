@@ -0,0 +1,157 @@
+"""Write-behind buffer for the ``transactions`` audit ledger."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from monopoly.db.connection import Database
+
+DEFAULT_LEDGER_MAX_ROWS = 1000
+DEFAULT_LEDGER_MAX_DELAY = 2.0
+
+LedgerRow = Tuple[int, int, int, str]
+
+COPY_TRANSACTIONS = (
+    "COPY transactions (game_id, player_id, amount, description) FROM STDIN"
+)
+
+
+class BufferedLedger:
+    """Collect ledger rows in memory and write them with ``COPY``.
+
+    Nothing reads the ledger during play, so ``Repository(db, ledger=...)``
+    appends here instead of inserting a row next to every money update.
+    Once the unit of work that produced them commits, rows are flushed if
+    ``max_rows`` rows are waiting or the oldest has waited ``max_delay``
+    seconds. They are also flushed when the ``Database`` is closed, when the
+    interpreter exits, and before ``list_transactions`` reads the table.
+
+    Durability is the trade-off: a crash loses at most the unflushed rows.
+    ``flush_on_turn_end=True`` limits that to the current turn, and
+    ``max_rows=1`` flushes after every commit. Rows written inside a unit of
+    work that rolls back are discarded with it. Buffered rows get their
+    ``created_at`` when they are flushed, not when the money moved.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        max_rows: int = DEFAULT_LEDGER_MAX_ROWS,
+        max_delay: float = DEFAULT_LEDGER_MAX_DELAY,
+        flush_on_turn_end: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1.")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative.")
+        self.db = db
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.flush_on_turn_end = flush_on_turn_end
+        self.clock = clock
+        self.flushed = 0
+        self._rows: List[LedgerRow] = []
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+        self._flush_requested = False
+        # Rows of the unit of work running in this context, kept apart until
+        # it commits so a rollback can drop them.
+        self._pending: ContextVar[Optional[List[LedgerRow]]] = ContextVar(
+            f"monopoly_ledger_pending_{id(self)}", default=None
+        )
+        db.add_close_hook(self.flush)
+        atexit.register(self.flush)
+
+    def __len__(self) -> int:
+        pending = self._pending.get()
+        return len(self._rows) + (len(pending) if pending else 0)
+
+    def append(self, game_id: int, player_id: int, amount: int, desc: str) -> None:
+        row = (game_id, player_id, amount, desc)
+        pending = self._pending.get()
+        if pending is not None:
+            pending.append(row)
+            return
+        self._extend([row])
+        self.flush_if_due()
+
+    def _extend(self, rows: List[LedgerRow]) -> None:
+        with self._lock:
+            if not self._rows:
+                self._oldest = self.clock()
+            self._rows.extend(rows)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Hold rows appended inside until the enclosed block succeeds.
+
+        Nested calls join the outermost block; only it hands the rows over
+        and, outside any database transaction, flushes when due.
+        """
+        if self._pending.get() is not None:
+            yield
+            return
+        rows: List[LedgerRow] = []
+        token = self._pending.set(rows)
+        try:
+            yield
+        finally:
+            self._pending.reset(token)
+        if rows:
+            self._extend(rows)
+        self.flush_if_due()
+
+    def request_flush(self) -> None:
+        """Flush now, or right after the current unit of work commits."""
+        if self._pending.get() is not None or self.db.in_transaction():
+            self._flush_requested = True
+        else:
+            self.flush()
+
+    def due(self) -> bool:
+        if not self._rows:
+            return False
+        if self._flush_requested or len(self._rows) >= self.max_rows:
+            return True
+        return (
+            self._oldest is not None and self.clock() - self._oldest >= self.max_delay
+        )
+
+    def flush_if_due(self) -> int:
+        # Flushing inside someone else's transaction would tie buffered rows
+        # from earlier, committed work to its outcome.
+        if self.db.in_transaction() or not self.due():
+            return 0
+        return self.flush()
+
+    def flush(self) -> int:
+        """Write every buffered row in one ``COPY``; returns the row count."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+            self._oldest = None
+            self._flush_requested = False
+        if not rows:
+            return 0
+        try:
+            with self.db.connection() as conn, conn.cursor() as cur:
+                with cur.copy(COPY_TRANSACTIONS) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+        except BaseException:
+            with self._lock:
+                self._rows[:0] = rows
+                self._oldest = self.clock()
+            raise
+        self.flushed += len(rows)
+        return len(rows)
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.flush)
@@ -0,0 +1,788 @@
+"""Pure-Python repository backend for headless play, simulation and tests."""
+
+from __future__ import annotations
+
+import warnings
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import count
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    GameSession,
+    GameSnapshot,
+    GameStats,
+    Player,
+    PropertyState,
+    SpaceDraft,
+    SpaceType,
+    SquareStatus,
+    Standing,
+    Transaction,
+    TurnEvent,
+)
+
+
+class InMemoryRepository:
+    """Dict-backed implementation of the ``Repository`` method set.
+
+    Every lookup the engine performs on a hot path is served from an index
+    (players by game, spaces by ``(game_id, sequence_order)``, property states
+    by space and by owner), so a turn never scans a table. Players are also
+    kept sorted by net worth, which serves ``leaderboard``. The transaction log
+    is kept whole; ``delete_game`` frees a finished game, which is how the
+    simulator bounds memory. Pass ``ledger_limit`` to keep only each game's
+    newest rows instead: the first row dropped raises a ``RuntimeWarning``
+    and ``dropped_transactions`` reports how many are gone.
+
+    Reads return copies so callers observe the same snapshot semantics as the
+    PostgreSQL repository. Changes apply immediately; inside ``unit_of_work``
+    each change also logs how to undo itself, and an exception leaving the
+    outermost unit replays that log backwards, so a failed engine operation
+    leaves nothing behind. Nested units join the outer one, as on SQLite.
+    ``reset_schema`` is not undone.
+    """
+
+    def __init__(self, ledger_limit: Optional[int] = None) -> None:
+        if ledger_limit is not None and ledger_limit < 1:
+            raise ValueError("ledger_limit must be at least 1.")
+        self.ledger_limit = ledger_limit
+        self._undo: Optional[List[Callable[[], None]]] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._game_ids = count(1)
+        self._player_ids = count(1)
+        self._space_ids = count(1)
+        self._state_ids = count(1)
+        self._transaction_ids = count(1)
+        self._games: Dict[int, GameSession] = {}
+        self._players: Dict[int, Player] = {}
+        self._players_by_game: Dict[int, List[int]] = {}
+        self._spaces: Dict[int, BoardSpace] = {}
+        self._space_by_order: Dict[Tuple[int, int], int] = {}
+        self._spaces_by_game: Dict[int, List[int]] = {}
+        self._states: Dict[int, PropertyState] = {}
+        self._states_by_owner: Dict[Tuple[int, int], Set[int]] = {}
+        self._transactions: Dict[int, Deque[Transaction]] = {}
+        self._dropped: Dict[int, int] = {}
+        self._events: Dict[int, List[TurnEvent]] = {}
+        self._event_turns: Dict[int, List[int]] = {}
+        self._event_ids = count(1)
+        self._snapshots: Dict[int, Dict[int, GameSnapshot]] = {}
+        self._holdings: Dict[int, int] = {}
+        # (-net_worth, player_id) for every player, kept sorted.
+        self._by_worth: List[Tuple[int, int]] = []
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        if self._undo is not None:
+            yield
+            return
+        self._undo = undo = []
+        try:
+            yield
+        except BaseException:
+            self._undo = None
+            for step in reversed(undo):
+                step()
+            raise
+        finally:
+            self._undo = None
+
+    @contextmanager
+    def primary_reads(self) -> Iterator[None]:
+        yield
+
+    def end_turn(self, game_id: int) -> None:
+        pass
+
+    def reset_schema(self) -> None:
+        self._reset()
+
+    def create_game(self, status: str = "setup") -> GameSession:
+        game = GameSession(
+            id=next(self._game_ids), status=status, created_at=datetime.now()
+        )
+        self._games[game.id] = game
+        self._players_by_game[game.id] = []
+        self._spaces_by_game[game.id] = []
+        self._transactions[game.id] = deque(maxlen=self.ledger_limit)
+        self._keep(lambda: self._forget_game(game.id))
+        return game.model_copy()
+
+    def get_game(self, game_id: int) -> Optional[GameSession]:
+        game = self._games.get(game_id)
+        return game.model_copy() if game else None
+
+    def board_status(self, game_id: int) -> Optional[BoardStatus]:
+        game = self.get_game(game_id)
+        if game is None:
+            return None
+        squares = []
+        for space in self.list_spaces(game_id):
+            state = self._states.get(space.id)
+            owner = (
+                self._players.get(state.owner_id) if state and state.owner_id else None
+            )
+            squares.append(
+                SquareStatus(
+                    space=space,
+                    owner_id=owner.id if owner else None,
+                    owner_name=owner.name if owner else None,
+                    improvement_count=state.improvement_count if state else 0,
+                )
+            )
+        players = self.list_players(game_id)
+        return BoardStatus(
+            game=game,
+            players=players,
+            squares=squares,
+            holdings={p.id: self._holdings[p.id] for p in players},
+        )
+
+    def delete_game(self, game_id: int) -> None:
+        if game_id not in self._games:
+            return
+        if self._undo is not None:
+            self._keep(self._game_restorer(game_id))
+        self._forget_game(game_id)
+
+    def _forget_game(self, game_id: int) -> None:
+        self._games.pop(game_id, None)
+        for player_id in self._players_by_game.pop(game_id, []):
+            self._unrank(player_id)
+            self._players.pop(player_id, None)
+            self._holdings.pop(player_id, None)
+        for space_id in self._spaces_by_game.pop(game_id, []):
+            space = self._spaces.pop(space_id)
+            self._space_by_order.pop((game_id, space.sequence_order), None)
+            self._states.pop(space_id, None)
+        for key in [k for k in self._states_by_owner if k[0] == game_id]:
+            del self._states_by_owner[key]
+        self._transactions.pop(game_id, None)
+        self._dropped.pop(game_id, None)
+        self._events.pop(game_id, None)
+        self._event_turns.pop(game_id, None)
+        self._snapshots.pop(game_id, None)
+
+    def list_games(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[GameSession]:
+        games = sorted(
+            (g for g in self._games.values() if status is None or g.status == status),
+            key=lambda g: (g.created_at, g.id),
+            reverse=True,
+        )
+        return [g.model_copy() for g in games[:limit]]
+
+    def game_stats(self) -> GameStats:
+        stats = GameStats()
+        for game in self._games.values():
+            stats.games_by_status[game.status] = (
+                stats.games_by_status.get(game.status, 0) + 1
+            )
+        for player in self._players.values():
+            stats.players += 1
+            if player.is_active:
+                stats.active_players += 1
+                stats.money_in_play += player.money
+        stats.transactions = sum(len(log) for log in self._transactions.values())
+        return stats
+
+    def update_game_status(self, game_id: int, status: str) -> None:
+        game = self._games.get(game_id)
+        if game:
+            self._keep_field(game, "status")
+            game.status = status
+
+    def set_current_turn(self, game_id: int, player_id: int) -> None:
+        game = self._games.get(game_id)
+        if game:
+            self._keep_field(game, "current_turn_player_id")
+            game.current_turn_player_id = player_id
+
+    def add_player(
+        self, game_id: int, name: str, starting_money: int, turn_order: int
+    ) -> Player:
+        self._require_game(game_id)
+        player = Player(
+            id=next(self._player_ids),
+            game_id=game_id,
+            name=name,
+            money=starting_money,
+            position=0,
+            is_active=True,
+            turn_order=turn_order,
+        )
+        self._players[player.id] = player
+        self._players_by_game[game_id].append(player.id)
+        self._holdings[player.id] = 0
+        insort(self._by_worth, (-starting_money, player.id))
+        self._keep(lambda: self._forget_player(player.id))
+        return player.model_copy()
+
+    def list_players(self, game_id: int, active_only: bool = False) -> List[Player]:
+        players = [self._players[pid] for pid in self._players_by_game.get(game_id, [])]
+        if active_only:
+            players = [p for p in players if p.is_active]
+        players.sort(key=lambda p: (p.turn_order, p.id))
+        return [p.model_copy() for p in players]
+
+    def get_player(self, player_id: int) -> Optional[Player]:
+        player = self._players.get(player_id)
+        return player.model_copy() if player else None
+
+    def update_player_position(self, player_id: int, position: int) -> None:
+        player = self._players.get(player_id)
+        if player:
+            self._keep_field(player, "position")
+            player.position = position
+
+    def update_player_active(self, player_id: int, is_active: bool) -> None:
+        player = self._players.get(player_id)
+        if player:
+            self._keep_field(player, "is_active")
+            player.is_active = is_active
+
+    def adjust_money(
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
+    ) -> Player:
+        player = self._players[player_id]
+        self._keep_worth(player_id)
+        self._unrank(player_id)
+        player.money += delta
+        self._holdings[player_id] += holdings_delta
+        self._rank(player_id)
+        self._record_transaction(game_id, player_id, delta, description)
+        return player.model_copy()
+
+    def set_money(self, player_id: int, amount: int) -> Player:
+        player = self._players[player_id]
+        self._keep_worth(player_id)
+        self._unrank(player_id)
+        player.money = amount
+        self._rank(player_id)
+        return player.model_copy()
+
+    def set_holdings(self, player_id: int, holdings: int) -> None:
+        if player_id in self._players:
+            self._keep_worth(player_id)
+            self._unrank(player_id)
+            self._holdings[player_id] = holdings
+            self._rank(player_id)
+
+    def standings(self, game_id: int) -> List[Standing]:
+        players = [self._players[pid] for pid in self._players_by_game.get(game_id, [])]
+        players.sort(key=lambda p: (-self._net_worth(p.id), p.id))
+        return [self._standing(rank, p) for rank, p in enumerate(players, start=1)]
+
+    def leaderboard(self, limit: int = 10) -> List[Standing]:
+        return [
+            self._standing(rank, self._players[player_id])
+            for rank, (_, player_id) in enumerate(self._by_worth[:limit], start=1)
+        ]
+
+    def add_space(
+        self,
+        game_id: int,
+        sequence_order: int,
+        name: str,
+        type_: SpaceType | str,
+        description: str | None = None,
+        purchase_cost: int | None = None,
+        base_rent: int | None = None,
+        event_amount: int = 0,
+        move_target: int | None = None,
+    ) -> BoardSpace:
+        self._require_game(game_id)
+        type_enum = type_ if isinstance(type_, SpaceType) else SpaceType(type_)
+        if (game_id, sequence_order) in self._space_by_order:
+            raise ValueError(
+                f"Space {sequence_order} already exists in game {game_id}."
+            )
+        space = BoardSpace(
+            id=next(self._space_ids),
+            game_id=game_id,
+            sequence_order=sequence_order,
+            name=name,
+            type=type_enum,
+            description=description,
+            purchase_cost=purchase_cost,
+            base_rent=base_rent,
+            event_amount=event_amount,
+            move_target=move_target,
+        )
+        self._spaces[space.id] = space
+        self._space_by_order[(game_id, sequence_order)] = space.id
+        self._spaces_by_game[game_id].append(space.id)
+        if type_enum == SpaceType.PROPERTY:
+            self._states[space.id] = PropertyState(
+                id=next(self._state_ids),
+                game_id=game_id,
+                space_id=space.id,
+                owner_id=None,
+                improvement_count=0,
+            )
+        self._keep(lambda: self._forget_space(space))
+        return space.model_copy()
+
+    def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]:
+        self._require_game(game_id)
+        staged = [SpaceDraft.model_validate(d) for d in drafts]
+        orders = [d.sequence_order for d in staged]
+        if len(set(orders)) != len(orders) or any(
+            (game_id, order) in self._space_by_order for order in orders
+        ):
+            raise ValueError(f"Duplicate space positions for game {game_id}.")
+        return [
+            self.add_space(
+                game_id,
+                d.sequence_order,
+                d.name,
+                d.type,
+                d.description,
+                d.purchase_cost,
+                d.base_rent,
+                d.event_amount,
+                d.move_target,
+            )
+            for d in staged
+        ]
+
+    def list_spaces(self, game_id: int) -> List[BoardSpace]:
+        spaces = [self._spaces[sid] for sid in self._spaces_by_game.get(game_id, [])]
+        spaces.sort(key=lambda s: s.sequence_order)
+        return [s.model_copy() for s in spaces]
+
+    def get_space_by_order(
+        self, game_id: int, sequence_order: int
+    ) -> Optional[BoardSpace]:
+        space_id = self._space_by_order.get((game_id, sequence_order))
+        return self._spaces[space_id].model_copy() if space_id is not None else None
+
+    def get_space_by_id(self, space_id: int) -> Optional[BoardSpace]:
+        space = self._spaces.get(space_id)
+        return space.model_copy() if space else None
+
+    def get_property_state(
+        self, game_id: int, space_id: int
+    ) -> Optional[PropertyState]:
+        state = self._states.get(space_id)
+        if not state or state.game_id != game_id:
+            return None
+        return state.model_copy()
+
+    def set_property_owner(
+        self,
+        game_id: int,
+        space_id: int,
+        owner_id: Optional[int],
+        improvement_count: Optional[int] = None,
+    ) -> None:
+        state = self._states.get(space_id)
+        if not state or state.game_id != game_id:
+            return
+        self._keep_state(state)
+        self._set_owner(state, owner_id)
+        if improvement_count is not None:
+            state.improvement_count = improvement_count
+
+    def increment_improvement(self, game_id: int, space_id: int) -> PropertyState:
+        state = self._states[space_id]
+        self._keep_state(state)
+        state.improvement_count += 1
+        return state.model_copy()
+
+    def properties_by_owner(
+        self, game_id: int, owner_id: int
+    ) -> List[tuple[BoardSpace, PropertyState]]:
+        space_ids = self._states_by_owner.get((game_id, owner_id), set())
+        spaces = sorted(
+            (self._spaces[sid] for sid in space_ids), key=lambda s: s.sequence_order
+        )
+        return [(s.model_copy(), self._states[s.id].model_copy()) for s in spaces]
+
+    def release_properties_to_bank(self, game_id: int, owner_id: int) -> None:
+        for space_id in list(self._states_by_owner.get((game_id, owner_id), ())):
+            state = self._states[space_id]
+            self._keep_state(state)
+            self._set_owner(state, None)
+            state.improvement_count = 0
+        self.set_holdings(owner_id, 0)
+
+    def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]:
+        sales: list[tuple[int, int]] = []
+        for space, state in self.properties_by_owner(game_id, owner_id):
+            sale_value = int((space.purchase_cost or 0) * sellback_ratio)
+            sale_value += state.improvement_count * improvement_value
+            self.set_property_owner(game_id, space.id, None, 0)
+            self.adjust_money(
+                game_id, owner_id, sale_value, f"Forced sale of {space.name}"
+            )
+            sales.append((space.id, sale_value))
+        if sales:
+            self.set_holdings(owner_id, 0)
+        return sales
+
+    def eliminate_player(self, game_id: int, player_id: int) -> None:
+        self.update_player_active(player_id, False)
+        self.release_properties_to_bank(game_id, player_id)
+        self.reset_turn_orders(game_id)
+
+    def count_spaces(self, game_id: int) -> int:
+        return len(self._spaces_by_game.get(game_id, []))
+
+    def next_sequence_order(self, game_id: int) -> int:
+        orders = [
+            self._spaces[sid].sequence_order
+            for sid in self._spaces_by_game.get(game_id, [])
+        ]
+        return max(orders) + 1 if orders else 0
+
+    def reset_turn_orders(self, game_id: int) -> None:
+        """Re-normalize turn order so active players stay in order without gaps."""
+        active = [
+            self._players[pid]
+            for pid in self._players_by_game.get(game_id, [])
+            if self._players[pid].is_active
+        ]
+        active.sort(key=lambda p: (p.turn_order, p.id))
+        for idx, player in enumerate(active):
+            self._keep_field(player, "turn_order")
+            player.turn_order = idx
+
+    def transfer_money(
+        self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
+    ) -> None:
+        self.adjust_money(
+            game_id, payer_id, -amount, f"Paid {amount} for {description}"
+        )
+        self.adjust_money(
+            game_id, payee_id, amount, f"Received {amount} for {description}"
+        )
+
+    def remove_player(self, player_id: int) -> None:
+        player = self._players.get(player_id)
+        if not player:
+            return
+        for space_id in list(
+            self._states_by_owner.get((player.game_id, player_id), ())
+        ):
+            state = self._states[space_id]
+            self._keep_state(state)
+            self._set_owner(state, None)
+        ledger = self._transactions.get(player.game_id)
+        if ledger is not None:
+            rows = list(ledger)
+
+            def restore() -> None:
+                ledger.clear()
+                ledger.extend(rows)
+
+            self._keep(restore)
+            ledger.clear()
+            ledger.extend(t for t in rows if t.player_id != player_id)
+        if self._undo is not None:
+            self._keep(self._player_restorer(player_id))
+        self._forget_player(player_id)
+
+    def list_transactions(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Transaction]:
+        ledger = self._transactions.get(game_id, deque())
+        rows = list(reversed(ledger))
+        if limit is not None:
+            rows = rows[:limit]
+        return [t.model_copy() for t in rows]
+
+    def dropped_transactions(self, game_id: int) -> int:
+        """Ledger rows of ``game_id`` discarded to stay within ``ledger_limit``."""
+        return self._dropped.get(game_id, 0)
+
+    def append_transactions(
+        self, game_id: int, entries: Sequence[Tuple[Optional[int], int, str]]
+    ) -> None:
+        for player_id, amount, description in entries:
+            self._record_transaction(game_id, player_id, amount, description)
+
+    def list_property_states(self, game_id: int) -> List[PropertyState]:
+        return [
+            self._states[sid].model_copy()
+            for sid in self._spaces_by_game.get(game_id, [])
+            if sid in self._states
+        ]
+
+    def append_events(self, game_id: int, events: Sequence[TurnEvent]) -> None:
+        self._require_game(game_id)
+        log = self._events.setdefault(game_id, [])
+        turns = self._event_turns.setdefault(game_id, [])
+        mark = len(log)
+
+        def truncate() -> None:
+            del log[mark:], turns[mark:]
+
+        self._keep(truncate)
+        for event in events:
+            if turns and event.turn < turns[-1]:
+                raise ValueError("Events must be appended in turn order.")
+            log.append(event.model_copy(update={"id": next(self._event_ids)}))
+            turns.append(event.turn)
+
+    def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]:
+        log = self._events.get(game_id, [])
+        turns = self._event_turns.get(game_id, [])
+        start = bisect_right(turns, after_turn)
+        stop = len(turns) if upto_turn is None else bisect_right(turns, upto_turn)
+        return [event.model_copy() for event in log[start:stop]]
+
+    def last_event_turn(self, game_id: int) -> Optional[int]:
+        turns = self._event_turns.get(game_id)
+        return turns[-1] if turns else None
+
+    def save_snapshot(self, game_id: int, turn: int, state: Dict[str, Any]) -> None:
+        self._require_game(game_id)
+        snapshots = self._snapshots.setdefault(game_id, {})
+        previous = snapshots.get(turn)
+
+        def restore() -> None:
+            if previous is None:
+                snapshots.pop(turn, None)
+            else:
+                snapshots[turn] = previous
+
+        self._keep(restore)
+        snapshots[turn] = GameSnapshot(
+            game_id=game_id, turn=turn, state=state, created_at=datetime.now()
+        )
+
+    def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]:
+        snapshots = self._snapshots.get(game_id, {})
+        turns = [t for t in snapshots if upto_turn is None or t <= upto_turn]
+        return snapshots[max(turns)].model_copy(deep=True) if turns else None
+
+    def _keep(self, undo: Callable[[], None]) -> None:
+        """Log ``undo`` for the running unit of work, if there is one."""
+        if self._undo is not None:
+            self._undo.append(undo)
+
+    def _keep_field(self, model: Any, field: str) -> None:
+        if self._undo is not None:
+            value = getattr(model, field)
+            self._undo.append(lambda: setattr(model, field, value))
+
+    def _keep_worth(self, player_id: int) -> None:
+        if self._undo is None:
+            return
+        player = self._players[player_id]
+        money, holdings = player.money, self._holdings[player_id]
+
+        def restore() -> None:
+            self._unrank(player_id)
+            player.money = money
+            self._holdings[player_id] = holdings
+            self._rank(player_id)
+
+        self._undo.append(restore)
+
+    def _keep_state(self, state: PropertyState) -> None:
+        if self._undo is None:
+            return
+        owner_id, improvement_count = state.owner_id, state.improvement_count
+
+        def restore() -> None:
+            self._set_owner(state, owner_id)
+            state.improvement_count = improvement_count
+
+        self._undo.append(restore)
+
+    def _ledger_restorer(
+        self, game_id: int, ledger: Deque[Transaction]
+    ) -> Callable[[], None]:
+        oldest = ledger[0] if ledger.maxlen and len(ledger) == ledger.maxlen else None
+        dropped = self._dropped.get(game_id)
+
+        def restore() -> None:
+            ledger.pop()
+            if oldest is not None:
+                ledger.appendleft(oldest)
+            if dropped is None:
+                self._dropped.pop(game_id, None)
+            else:
+                self._dropped[game_id] = dropped
+
+        return restore
+
+    def _forget_player(self, player_id: int) -> None:
+        player = self._players.get(player_id)
+        if player is None:
+            return
+        self._unrank(player_id)
+        del self._players[player_id]
+        self._holdings.pop(player_id, None)
+        self._players_by_game[player.game_id].remove(player_id)
+
+    def _player_restorer(self, player_id: int) -> Callable[[], None]:
+        player = self._players[player_id]
+        holdings = self._holdings[player_id]
+        seats = self._players_by_game[player.game_id]
+        seat = seats.index(player_id)
+
+        def restore() -> None:
+            self._players[player_id] = player
+            self._holdings[player_id] = holdings
+            seats.insert(seat, player_id)
+            self._rank(player_id)
+
+        return restore
+
+    def _forget_space(self, space: BoardSpace) -> None:
+        del self._spaces[space.id]
+        del self._space_by_order[(space.game_id, space.sequence_order)]
+        self._spaces_by_game[space.game_id].remove(space.id)
+        self._states.pop(space.id, None)
+
+    def _game_restorer(self, game_id: int) -> Callable[[], None]:
+        """Undo for ``delete_game``: puts every row of the game back."""
+        player_ids = self._players_by_game[game_id]
+        space_ids = self._spaces_by_game[game_id]
+        rows: List[Tuple[Dict[Any, Any], Dict[Any, Any]]] = [
+            (self._games, {game_id: self._games[game_id]}),
+            (self._players_by_game, {game_id: player_ids}),
+            (self._spaces_by_game, {game_id: space_ids}),
+            (self._players, {pid: self._players[pid] for pid in player_ids}),
+            (self._holdings, {pid: self._holdings[pid] for pid in player_ids}),
+            (self._spaces, {sid: self._spaces[sid] for sid in space_ids}),
+            (
+                self._space_by_order,
+                {(game_id, self._spaces[sid].sequence_order): sid for sid in space_ids},
+            ),
+            (
+                self._states,
+                {sid: self._states[sid] for sid in space_ids if sid in self._states},
+            ),
+            (
+                self._states_by_owner,
+                {k: v for k, v in self._states_by_owner.items() if k[0] == game_id},
+            ),
+        ]
+        for table in (
+            self._transactions,
+            self._dropped,
+            self._events,
+            self._event_turns,
+            self._snapshots,
+        ):
+            if game_id in table:
+                rows.append((table, {game_id: table[game_id]}))
+
+        def restore() -> None:
+            for table, entries in rows:
+                table.update(entries)
+            for player_id in player_ids:
+                self._rank(player_id)
+
+        return restore
+
+    def _net_worth(self, player_id: int) -> int:
+        return self._players[player_id].money + self._holdings[player_id]
+
+    def _rank(self, player_id: int) -> None:
+        insort(self._by_worth, (-self._net_worth(player_id), player_id))
+
+    def _unrank(self, player_id: int) -> None:
+        key = (-self._net_worth(player_id), player_id)
+        idx = bisect_left(self._by_worth, key)
+        if idx < len(self._by_worth) and self._by_worth[idx] == key:
+            del self._by_worth[idx]
+
+    def _standing(self, rank: int, player: Player) -> Standing:
+        holdings = self._holdings[player.id]
+        return Standing(
+            rank=rank,
+            game_id=player.game_id,
+            player_id=player.id,
+            name=player.name,
+            money=player.money,
+            holdings=holdings,
+            net_worth=player.money + holdings,
+            is_active=player.is_active,
+        )
+
+    def _require_game(self, game_id: int) -> None:
+        if game_id not in self._games:
+            raise KeyError(f"Game {game_id} does not exist.")
+
+    def _set_owner(self, state: PropertyState, owner_id: Optional[int]) -> None:
+        if state.owner_id is not None:
+            owned = self._states_by_owner.get((state.game_id, state.owner_id))
+            if owned is not None:
+                owned.discard(state.space_id)
+                if not owned:
+                    del self._states_by_owner[(state.game_id, state.owner_id)]
+        state.owner_id = owner_id
+        if owner_id is not None:
+            self._states_by_owner.setdefault((state.game_id, owner_id), set()).add(
+                state.space_id
+            )
+
+    def _record_transaction(
+        self, game_id: int, player_id: Optional[int], amount: int, description: str
+    ) -> None:
+        ledger = self._transactions.get(game_id)
+        if ledger is None:
+            return
+        if self._undo is not None:
+            self._keep(self._ledger_restorer(game_id, ledger))
+        if ledger.maxlen is not None and len(ledger) == ledger.maxlen:
+            dropped = self._dropped.get(game_id, 0)
+            if not dropped:
+                warnings.warn(
+                    f"Game {game_id} reached ledger_limit={ledger.maxlen}; "
+                    "its oldest transactions are being discarded.",
+                    RuntimeWarning,
+                    stacklevel=3,
+                )
+            self._dropped[game_id] = dropped + 1
+        ledger.append(
+            Transaction.model_construct(
+                id=next(self._transaction_ids),
+                game_id=game_id,
+                player_id=player_id,
+                amount=amount,
+                description=description,
+                created_at=datetime.now(),
+            )
+        )
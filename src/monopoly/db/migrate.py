@@ -0,0 +1,182 @@
+"""Versioned schema migrations and index usage checks."""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from monopoly.db.repository import (
+    LEADERBOARD_SQL,
+    LIST_ACTIVE_PLAYERS_SQL,
+    LIST_PLAYERS_SQL,
+    LIST_TRANSACTIONS_SQL,
+    PROPERTIES_BY_OWNER_SQL,
+    SELECT_PROPERTY_STATE_SQL,
+)
+from monopoly.defaults import IMPROVEMENT_COST, SELLBACK_RATIO
+
+MIGRATIONS_PATH = Path(__file__).with_name("migrations")
+
+# Key for pg_advisory_xact_lock so concurrent migrators apply each step once.
+MIGRATION_LOCK_ID = 0x6D6F6E6F
+
+CREATE_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+# Holdings (see migration 0004) of players created before the column: what
+# they own priced like ``HouseRules.sale_value``. ``SqliteDatabase`` runs the
+# same statement when it upgrades an old file.
+HOLDINGS_BACKFILL_SQL = """
+UPDATE players SET holdings = (
+    SELECT COALESCE(SUM(
+        CAST(FLOOR(COALESCE(s.purchase_cost, 0) * %(sellback_ratio)s) AS INTEGER)
+            + ps.improvement_count * %(improvement_value)s
+    ), 0)
+    FROM property_states ps
+    JOIN spaces s ON s.id = ps.space_id
+    WHERE ps.owner_id = players.id
+)
+WHERE id IN (SELECT owner_id FROM property_states WHERE owner_id IS NOT NULL);
+"""
+
+Backfill = Tuple[str, Dict[str, Any]]
+
+
+def holdings_backfill(
+    sellback_ratio: float = SELLBACK_RATIO,
+    improvement_value: int = int(IMPROVEMENT_COST * SELLBACK_RATIO),
+) -> Backfill:
+    """``HOLDINGS_BACKFILL_SQL`` and its parameters.
+
+    The defaults price holdings like ``HouseRules()``.
+    """
+    return HOLDINGS_BACKFILL_SQL, {
+        "sellback_ratio": sellback_ratio,
+        "improvement_value": improvement_value,
+    }
+
+
+# Data steps whose values come from Python, by migration version. Each runs
+# right after that migration's SQL, in the same transaction.
+BACKFILLS: Dict[int, Callable[[], Backfill]] = {4: holdings_backfill}
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text()
+
+    def backfill(self) -> Optional[Backfill]:
+        step = BACKFILLS.get(self.version)
+        return step() if step is not None else None
+
+
+def load_migrations(path: Path = MIGRATIONS_PATH) -> List[Migration]:
+    """Migrations in ``path`` named ``<version>_<name>.sql``, oldest first."""
+    migrations: list[Migration] = []
+    for file in path.glob("*.sql"):
+        match = _FILENAME.match(file.name)
+        if not match:
+            raise ValueError(
+                f"Migration file '{file.name}' is not <version>_<name>.sql"
+            )
+        migrations.append(Migration(int(match.group(1)), match.group(2), file))
+    migrations.sort(key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError("Duplicate migration versions.")
+    return migrations
+
+
+@dataclass(frozen=True)
+class IndexCheck:
+    """A hot repository query and the index it is expected to use."""
+
+    name: str
+    query: str
+    params: Tuple[Any, ...]
+    index: str
+
+
+@dataclass(frozen=True)
+class IndexCheckResult:
+    check: IndexCheck
+    indexes_used: Tuple[str, ...]
+
+    @property
+    def ok(self) -> bool:
+        return self.check.index in self.indexes_used
+
+
+# The statements ``Repository`` runs on its hot paths, so the checks cannot
+# drift from the real queries.
+HOT_QUERIES: Sequence[IndexCheck] = (
+    IndexCheck("list_players", LIST_PLAYERS_SQL, (1,), "idx_players_game_turn"),
+    IndexCheck(
+        "list_players(active_only)",
+        LIST_ACTIVE_PLAYERS_SQL,
+        (1,),
+        "idx_players_game_active_turn",
+    ),
+    IndexCheck(
+        "get_property_state",
+        SELECT_PROPERTY_STATE_SQL,
+        (1, 1),
+        "idx_property_states_space",
+    ),
+    IndexCheck(
+        "properties_by_owner",
+        PROPERTIES_BY_OWNER_SQL,
+        (1, 1),
+        "idx_property_states_game_owner",
+    ),
+    IndexCheck(
+        "list_transactions",
+        LIST_TRANSACTIONS_SQL + " LIMIT %s",
+        (1, 20),
+        "idx_transactions_game_id",
+    ),
+    IndexCheck("leaderboard", LEADERBOARD_SQL, (10,), "idx_players_net_worth"),
+)
+
+
+def plan_indexes(plan: Any) -> List[str]:
+    """Every index named anywhere in an ``EXPLAIN (FORMAT JSON)`` plan."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    found: list[str] = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            index = node.get("Index Name")
+            if index and index not in found:
+                found.append(index)
+            stack.extend(v for v in node.values() if isinstance(v, (list, dict)))
+    return found
+
+
+def format_checks(results: Sequence[IndexCheckResult]) -> str:
+    lines = []
+    for result in results:
+        used = ", ".join(result.indexes_used) or "sequential scan"
+        mark = "ok  " if result.ok else "FAIL"
+        lines.append(f"{mark} {result.check.name:<28} {used}")
+    return "\n".join(lines)
@@ -0,0 +1,29 @@
+-- Indexes for the per-game lookups the engine issues every turn.
+
+-- list_players(game_id) ORDER BY turn_order
+CREATE INDEX IF NOT EXISTS idx_players_game_turn
+    ON players (game_id, turn_order);
+
+-- list_players(game_id, active_only=True): active players only
+CREATE INDEX IF NOT EXISTS idx_players_game_active_turn
+    ON players (game_id, turn_order)
+    WHERE is_active;
+
+-- get_property_state / set_property_owner / increment_improvement, and the
+-- ON DELETE CASCADE from spaces. Each space has one state row, so no game_id
+-- prefix is needed.
+CREATE INDEX IF NOT EXISTS idx_property_states_space
+    ON property_states (space_id);
+
+-- properties_by_owner / release_properties_to_bank: owned properties only
+CREATE INDEX IF NOT EXISTS idx_property_states_game_owner
+    ON property_states (game_id, owner_id)
+    WHERE owner_id IS NOT NULL;
+
+-- list_transactions(game_id) ORDER BY id DESC
+CREATE INDEX IF NOT EXISTS idx_transactions_game_id
+    ON transactions (game_id, id);
+
+-- ON DELETE CASCADE from players (delete_game, remove_player)
+CREATE INDEX IF NOT EXISTS idx_transactions_player
+    ON transactions (player_id);
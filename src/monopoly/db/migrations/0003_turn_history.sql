@@ -0,0 +1,26 @@
+-- Event-sourced turn log and periodic full-state snapshots.
+
+CREATE TABLE IF NOT EXISTS turn_events (
+    id BIGSERIAL PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES game_sessions(id) ON DELETE CASCADE,
+    turn INTEGER NOT NULL,
+    kind VARCHAR(16) NOT NULL,
+    player_id INTEGER,
+    space_id INTEGER,
+    counterparty_id INTEGER,
+    amount INTEGER NOT NULL DEFAULT 0,
+    position INTEGER,
+    dice SMALLINT[]
+);
+
+-- Replay reads one game's events after a snapshot, in order.
+CREATE INDEX IF NOT EXISTS idx_turn_events_game_turn
+    ON turn_events (game_id, turn, id);
+
+CREATE TABLE IF NOT EXISTS game_snapshots (
+    game_id INTEGER NOT NULL REFERENCES game_sessions(id) ON DELETE CASCADE,
+    turn INTEGER NOT NULL,
+    state JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (game_id, turn)
+);
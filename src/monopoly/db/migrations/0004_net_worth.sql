@@ -0,0 +1,13 @@
+-- Net worth is money plus holdings: what a player's properties and
+-- improvements would fetch from the bank at the sellback ratio. The engine
+-- adjusts holdings in the same statement as money, so standings and the
+-- leaderboard read an index instead of pricing every property.
+ALTER TABLE players ADD COLUMN IF NOT EXISTS holdings INTEGER NOT NULL DEFAULT 0;
+
+-- What existing players already own is priced afterwards, in the same
+-- transaction, by HOLDINGS_BACKFILL_SQL in monopoly/db/migrate.py with the
+-- default HouseRules bound as parameters.
+
+-- leaderboard(): players of every game, richest first
+CREATE INDEX IF NOT EXISTS idx_players_net_worth
+    ON players ((money + holdings) DESC, id);
@@ -0,0 +1,150 @@
+"""Move whole games between backends as plain JSON documents."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from monopoly.db.base import GameRepository
+from monopoly.models import SpaceDraft, TurnEvent
+
+EXPORT_FORMAT = 1
+
+
+def export_game(repo: GameRepository, game_id: int) -> Dict[str, Any]:
+    """Everything stored for ``game_id``, with the ids of ``repo``.
+
+    Includes the ledger (oldest first), the event log, every snapshot and
+    each player's holdings, so an imported game keeps its history, replays
+    like the original and ranks the same.
+    """
+    game = repo.get_game(game_id)
+    if game is None:
+        raise ValueError(f"Game {game_id} not found.")
+    holdings = {s.player_id: s.holdings for s in repo.standings(game_id)}
+    snapshots = []
+    snapshot = repo.latest_snapshot(game_id)
+    while snapshot is not None:
+        snapshots.append(snapshot)
+        snapshot = repo.latest_snapshot(game_id, snapshot.turn - 1)
+    return {
+        "format": EXPORT_FORMAT,
+        "game": game.model_dump(mode="json"),
+        "players": [
+            {**p.model_dump(mode="json"), "holdings": holdings.get(p.id, 0)}
+            for p in repo.list_players(game_id)
+        ],
+        "spaces": [s.model_dump(mode="json") for s in repo.list_spaces(game_id)],
+        "property_states": [
+            s.model_dump(mode="json") for s in repo.list_property_states(game_id)
+        ],
+        "transactions": [
+            t.model_dump(mode="json") for t in reversed(repo.list_transactions(game_id))
+        ],
+        "events": [e.model_dump(mode="json") for e in repo.list_events(game_id)],
+        "snapshots": [
+            s.model_dump(mode="json", exclude={"created_at"})
+            for s in reversed(snapshots)
+        ],
+    }
+
+
+def import_game(repo: GameRepository, data: Mapping[str, Any]) -> int:
+    """Recreate an exported game in ``repo`` and return its new id.
+
+    The target hands out fresh ids; every reference (owners, turn pointer,
+    ledger, events, snapshots) is rewritten to match. Creation times are not
+    carried over. The import runs in one unit of work.
+    """
+    if data.get("format") != EXPORT_FORMAT:
+        raise ValueError(f"Unsupported export format: {data.get('format')!r}.")
+    with repo.unit_of_work():
+        game_id = repo.create_game(data["game"]["status"]).id
+        players: Dict[int, int] = {}
+        for p in data["players"]:
+            player = repo.add_player(game_id, p["name"], p["money"], p["turn_order"])
+            players[p["id"]] = player.id
+            if p["position"]:
+                repo.update_player_position(player.id, p["position"])
+            if not p["is_active"]:
+                repo.update_player_active(player.id, False)
+            if p.get("holdings"):
+                repo.set_holdings(player.id, p["holdings"])
+
+        drafts = [SpaceDraft.model_validate(s) for s in data["spaces"]]
+        by_order = {s.sequence_order: s.id for s in repo.add_spaces(game_id, drafts)}
+        spaces = {s["id"]: by_order[s["sequence_order"]] for s in data["spaces"]}
+
+        def player_id(old: Optional[int]) -> Optional[int]:
+            return players[old] if old is not None else None
+
+        def space_id(old: Optional[int]) -> Optional[int]:
+            return spaces[old] if old is not None else None
+
+        for state in data["property_states"]:
+            if state["owner_id"] is not None or state["improvement_count"]:
+                repo.set_property_owner(
+                    game_id,
+                    spaces[state["space_id"]],
+                    player_id(state["owner_id"]),
+                    state["improvement_count"],
+                )
+        current = data["game"]["current_turn_player_id"]
+        if current is not None:
+            repo.set_current_turn(game_id, players[current])
+
+        repo.append_transactions(
+            game_id,
+            [
+                (player_id(t["player_id"]), t["amount"], t["description"])
+                for t in data["transactions"]
+            ],
+        )
+        repo.append_events(
+            game_id,
+            [
+                TurnEvent.model_validate(
+                    {
+                        **e,
+                        "id": None,
+                        "game_id": game_id,
+                        "player_id": player_id(e["player_id"]),
+                        "space_id": space_id(e["space_id"]),
+                        "counterparty_id": player_id(e["counterparty_id"]),
+                    }
+                )
+                for e in data["events"]
+            ],
+        )
+        for snapshot in data["snapshots"]:
+            repo.save_snapshot(
+                game_id,
+                snapshot["turn"],
+                _remap_state(snapshot["state"], game_id, players, spaces),
+            )
+    return game_id
+
+
+def _remap_state(
+    state: Mapping[str, Any],
+    game_id: int,
+    players: Mapping[int, int],
+    spaces: Mapping[int, int],
+) -> Dict[str, Any]:
+    """Rewrite the ids inside a ``GameState.to_dict()`` snapshot."""
+    current = state["current_player_id"]
+    remapped_players: List[Dict[str, Any]] = [
+        {**p, "id": players[p["id"]]} for p in state["players"]
+    ]
+    return {
+        **state,
+        "game_id": game_id,
+        "current_player_id": players[current] if current is not None else None,
+        "players": remapped_players,
+        "properties": {
+            str(spaces[int(space)]): [
+                players[owner] if owner is not None else None,
+                improvements,
+            ]
+            for space, (owner, improvements) in state["properties"].items()
+        },
+    }
@@ -2,120 +2,656 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
-
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from psycopg import Connection, Cursor
 from psycopg.rows import dict_row
-
-from monopoly.models import BoardSpace, GameSession, Player, PropertyState, SpaceType
-from monopoly.db.connection import Database
+from psycopg.types.json import Jsonb
+from pydantic import BaseModel
+
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    GameSession,
+    GameSnapshot,
+    GameStats,
+    Player,
+    PropertyState,
+    SpaceDraft,
+    SpaceType,
+    SquareStatus,
+    Standing,
+    Transaction,
+    TurnEvent,
+)
+from monopoly.db.ledger import COPY_TRANSACTIONS, BufferedLedger
+from monopoly.db.rows import model_row, row_maker
+
+if TYPE_CHECKING:
+    from monopoly.db.connection import Database
+
+GAME_COLUMNS = ("id", "status", "current_turn_player_id", "created_at")
+PLAYER_COLUMNS = (
+    "id",
+    "game_id",
+    "name",
+    "money",
+    "position",
+    "is_active",
+    "turn_order",
+)
+PROPERTY_STATE_COLUMNS = ("id", "game_id", "space_id", "owner_id", "improvement_count")
+SPACE_COLUMNS = (
+    "id",
+    "game_id",
+    "sequence_order",
+    "name",
+    "type",
+    "description",
+    "purchase_cost",
+    "base_rent",
+    "event_amount",
+    "move_target",
+)
+SQUARE_COLUMNS = ("space", "owner_id", "owner_name", "improvement_count")
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _json_row(alias: str, columns: Sequence[str]) -> str:
+    return f"json_build_array({', '.join(f'{alias}.{c}' for c in columns)})"
+
+
+# One round trip for a whole status screen: the game row plus its players (with
+# their holdings) and squares (with owner names) aggregated into JSON arrays of
+# column values.
+BOARD_STATUS_QUERY = f"""
+SELECT {", ".join(f"g.{c}" for c in GAME_COLUMNS)},
+    (
+        SELECT json_agg(
+            json_build_array({_json_row("p", PLAYER_COLUMNS)}, p.holdings)
+            ORDER BY p.turn_order, p.id
+        )
+        FROM players p
+        WHERE p.game_id = g.id
+    ) AS players,
+    (
+        SELECT json_agg(
+            json_build_array(
+                {_json_row("s", SPACE_COLUMNS)},
+                ps.owner_id,
+                o.name,
+                COALESCE(ps.improvement_count, 0)
+            )
+            ORDER BY s.sequence_order
+        )
+        FROM spaces s
+        LEFT JOIN property_states ps ON ps.space_id = s.id
+        LEFT JOIN players o ON o.id = ps.owner_id
+        WHERE s.game_id = g.id
+    ) AS squares
+FROM game_sessions g
+WHERE g.id = %s;
+"""
+
+# Forced sale of everything a player owns: price each property, return it to
+# the bank, write one ledger row per sale and credit the total in one
+# statement. The price matches ``HouseRules.sale_value``.
+LIQUIDATE_PROPERTIES_SQL = """
+WITH owned AS (
+    SELECT ps.id, ps.space_id, s.name, s.sequence_order,
+        FLOOR(COALESCE(s.purchase_cost, 0) * %(sellback_ratio)s)::integer
+            + ps.improvement_count * %(improvement_value)s AS sale_value
+    FROM property_states ps
+    JOIN spaces s ON s.id = ps.space_id
+    WHERE ps.game_id = %(game_id)s AND ps.owner_id = %(owner_id)s
+    FOR UPDATE OF ps
+), released AS (
+    UPDATE property_states ps
+    SET owner_id = NULL, improvement_count = 0
+    FROM owned
+    WHERE ps.id = owned.id
+), ledger AS (
+    INSERT INTO transactions (game_id, player_id, amount, description)
+    SELECT %(game_id)s, %(owner_id)s, sale_value, 'Forced sale of ' || name
+    FROM owned
+    ORDER BY sequence_order
+), credited AS (
+    UPDATE players
+    SET money = money + (SELECT SUM(sale_value) FROM owned), holdings = 0
+    WHERE id = %(owner_id)s AND EXISTS (SELECT 1 FROM owned)
+)
+SELECT space_id, sale_value FROM owned ORDER BY sequence_order;
+"""
+
+# Renumber active players 0..n-1 in their current order, touching only the
+# rows whose position changes.
+RESET_TURN_ORDERS_SQL = """
+WITH ranked AS (
+    SELECT id, row_number() OVER (ORDER BY turn_order, id) - 1 AS turn_order
+    FROM players
+    WHERE game_id = %(game_id)s AND is_active
+)
+UPDATE players p
+SET turn_order = ranked.turn_order
+FROM ranked
+WHERE p.id = ranked.id AND p.turn_order <> ranked.turn_order;
+"""
+
+# Deactivate a player, return their properties to the bank and close the gap
+# in turn order in one statement. Every CTE sees the pre-statement snapshot, so
+# the renumbering excludes the eliminated player explicitly.
+ELIMINATE_PLAYER_SQL = """
+WITH eliminated AS (
+    UPDATE players SET is_active = FALSE, holdings = 0
+    WHERE id = %(player_id)s AND game_id = %(game_id)s
+), released AS (
+    UPDATE property_states
+    SET owner_id = NULL, improvement_count = 0
+    WHERE game_id = %(game_id)s AND owner_id = %(player_id)s
+), ranked AS (
+    SELECT id, row_number() OVER (ORDER BY turn_order, id) - 1 AS turn_order
+    FROM players
+    WHERE game_id = %(game_id)s AND is_active AND id <> %(player_id)s
+)
+UPDATE players p
+SET turn_order = ranked.turn_order
+FROM ranked
+WHERE p.id = ranked.id AND p.turn_order <> ranked.turn_order;
+"""
+
+RELEASE_PROPERTIES_SQL = """
+WITH released AS (
+    UPDATE property_states
+    SET owner_id = NULL, improvement_count = 0
+    WHERE game_id = %(game_id)s AND owner_id = %(owner_id)s
+)
+UPDATE players SET holdings = 0 WHERE id = %(owner_id)s;
+"""
+
+# Net worth rankings; ``leaderboard`` walks idx_players_net_worth.
+STANDING_COLUMNS = (
+    "game_id, id, name, money, holdings, money + holdings AS net_worth, is_active"
+)
+STANDINGS_SQL = f"""
+SELECT {STANDING_COLUMNS} FROM players
+WHERE game_id = %s
+ORDER BY money + holdings DESC, id;
+"""
+LEADERBOARD_SQL = f"""
+SELECT {STANDING_COLUMNS} FROM players
+ORDER BY money + holdings DESC, id
+LIMIT %s;
+"""
+
+
+def ranked(rows: Sequence[Sequence[Any]]) -> List[Standing]:
+    """``Standing`` per ``STANDING_COLUMNS`` row, ranked in row order."""
+    return [
+        Standing(
+            rank=rank,
+            game_id=game_id,
+            player_id=player_id,
+            name=name,
+            money=money,
+            holdings=holdings,
+            net_worth=net_worth,
+            is_active=bool(is_active),
+        )
+        for rank, (
+            game_id,
+            player_id,
+            name,
+            money,
+            holdings,
+            net_worth,
+            is_active,
+        ) in enumerate(rows, start=1)
+    ]
+
+
+# Admin totals; plain enough SQL for the SQLite backend to share.
+GAME_STATUS_COUNTS_SQL = "SELECT status, COUNT(*) FROM game_sessions GROUP BY status;"
+GAME_TOTALS_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM players),
+    (SELECT COUNT(*) FROM players WHERE is_active),
+    (SELECT COALESCE(SUM(money), 0) FROM players WHERE is_active),
+    (SELECT COUNT(*) FROM transactions);
+"""
+
+# Statements shared with ``monopoly.db.aio.AsyncRepository``.
+INSERT_GAME_SQL = "INSERT INTO game_sessions (status) VALUES (%s) RETURNING *;"
+SELECT_GAME_SQL = "SELECT * FROM game_sessions WHERE id = %s;"
+DELETE_GAME_SQL = "DELETE FROM game_sessions WHERE id = %s;"
+UPDATE_GAME_STATUS_SQL = "UPDATE game_sessions SET status = %s WHERE id = %s;"
+SET_CURRENT_TURN_SQL = (
+    "UPDATE game_sessions SET current_turn_player_id = %s WHERE id = %s;"
+)
+
+INSERT_PLAYER_SQL = """
+INSERT INTO players (game_id, name, money, turn_order)
+VALUES (%s, %s, %s, %s) RETURNING *;
+"""
+LIST_PLAYERS_SQL = "SELECT * FROM players WHERE game_id = %s ORDER BY turn_order ASC;"
+LIST_ACTIVE_PLAYERS_SQL = (
+    "SELECT * FROM players WHERE game_id = %s AND is_active = TRUE "
+    "ORDER BY turn_order ASC;"
+)
+SELECT_PLAYER_SQL = "SELECT * FROM players WHERE id = %s;"
+UPDATE_POSITION_SQL = "UPDATE players SET position = %s WHERE id = %s;"
+UPDATE_ACTIVE_SQL = "UPDATE players SET is_active = %s WHERE id = %s;"
+ADJUST_MONEY_SQL = (
+    "UPDATE players SET money = money + %s, holdings = holdings + %s "
+    "WHERE id = %s RETURNING *;"
+)
+CREDIT_PLAYER_SQL = "UPDATE players SET money = money + %s WHERE id = %s;"
+INSERT_TRANSACTION_SQL = """
+INSERT INTO transactions (game_id, player_id, amount, description)
+VALUES (%s, %s, %s, %s);
+"""
+
+# A whole board and its property states in one statement; see ``space_params``.
+INSERT_SPACES_SQL = """
+WITH new_spaces AS (
+    INSERT INTO spaces (
+        game_id, sequence_order, name, type, description,
+        purchase_cost, base_rent, event_amount, move_target
+    )
+    SELECT %s, d.*
+    FROM unnest(
+        %s::integer[], %s::text[], %s::text[], %s::text[],
+        %s::integer[], %s::integer[], %s::integer[], %s::integer[]
+    ) AS d
+    RETURNING *
+), new_states AS (
+    INSERT INTO property_states (game_id, space_id, owner_id, improvement_count)
+    SELECT game_id, id, NULL, 0 FROM new_spaces WHERE type = %s
+)
+SELECT * FROM new_spaces ORDER BY sequence_order;
+"""
+SELECT_SPACES_SQL = (
+    "SELECT * FROM spaces WHERE game_id = %s ORDER BY sequence_order ASC;"
+)
+LIST_TRANSACTIONS_SQL = "SELECT * FROM transactions WHERE game_id = %s ORDER BY id DESC"
+SELECT_PROPERTY_STATE_SQL = (
+    "SELECT * FROM property_states WHERE game_id = %s AND space_id = %s;"
+)
+INCREMENT_IMPROVEMENT_SQL = """
+UPDATE property_states
+SET improvement_count = improvement_count + 1
+WHERE game_id = %s AND space_id = %s
+RETURNING *;
+"""
+# Rows split at ``len(SPACE_COLUMNS)`` into a space and its property state.
+PROPERTIES_BY_OWNER_SQL = f"""
+SELECT {", ".join(f"s.{c}" for c in SPACE_COLUMNS)},
+    {", ".join(f"ps.{c}" for c in PROPERTY_STATE_COLUMNS)}
+FROM property_states ps
+JOIN spaces s ON ps.space_id = s.id
+WHERE ps.game_id = %s AND ps.owner_id = %s
+ORDER BY s.sequence_order;
+"""
+LAST_EVENT_TURN_SQL = "SELECT MAX(turn) FROM turn_events WHERE game_id = %s;"
+LIST_PROPERTY_STATES_SQL = (
+    "SELECT * FROM property_states WHERE game_id = %s ORDER BY space_id;"
+)
+SAVE_SNAPSHOT_SQL = """
+INSERT INTO game_snapshots (game_id, turn, state)
+VALUES (%s, %s, %s)
+ON CONFLICT (game_id, turn) DO UPDATE SET state = EXCLUDED.state;
+"""
+
+
+def space_params(game_id: int, drafts: Sequence[SpaceDraft]) -> Tuple[Any, ...]:
+    """``INSERT_SPACES_SQL`` parameters: one array per ``SpaceDraft`` field."""
+    rows = [SpaceDraft.model_validate(d).model_dump(mode="json") for d in drafts]
+    columns = [[row[field] for row in rows] for field in SpaceDraft.model_fields]
+    return (game_id, *columns, SpaceType.PROPERTY.value)
+
+
+def property_owner_update(
+    game_id: int,
+    space_id: int,
+    owner_id: Optional[int],
+    improvement_count: Optional[int] = None,
+) -> Tuple[str, Tuple[Any, ...]]:
+    """SQL and parameters for ``set_property_owner``."""
+    update_sql = "UPDATE property_states SET owner_id = %s"
+    params: list[object] = [owner_id]
+    if improvement_count is not None:
+        update_sql += ", improvement_count = %s"
+        params.append(improvement_count)
+    update_sql += " WHERE game_id = %s AND space_id = %s;"
+    params.extend([game_id, space_id])
+    return update_sql, tuple(params)
+
+
+def event_rows(game_id: int, events: Sequence[TurnEvent]) -> List[Tuple[Any, ...]]:
+    """``INSERT_EVENT_SQL`` parameters, one tuple per event."""
+    return [
+        (
+            game_id,
+            e.turn,
+            e.kind.value,
+            e.player_id,
+            e.space_id,
+            e.counterparty_id,
+            e.amount,
+            e.position,
+            e.dice,
+        )
+        for e in events
+    ]
+
+
+def events_query(
+    game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+) -> Tuple[str, Tuple[Any, ...]]:
+    """SQL and parameters for ``list_events``."""
+    query = "SELECT * FROM turn_events WHERE game_id = %s AND turn > %s"
+    params: list[object] = [game_id, after_turn]
+    if upto_turn is not None:
+        query += " AND turn <= %s"
+        params.append(upto_turn)
+    return query + " ORDER BY turn, id;", tuple(params)
+
+
+def latest_snapshot_query(
+    game_id: int, upto_turn: Optional[int] = None
+) -> Tuple[str, Tuple[Any, ...]]:
+    """SQL and parameters for ``latest_snapshot``."""
+    query = "SELECT * FROM game_snapshots WHERE game_id = %s"
+    params: list[object] = [game_id]
+    if upto_turn is not None:
+        query += " AND turn <= %s"
+        params.append(upto_turn)
+    return query + " ORDER BY turn DESC LIMIT 1;", tuple(params)
+
+
+INSERT_EVENT_SQL = """
+INSERT INTO turn_events (
+    game_id, turn, kind, player_id, space_id, counterparty_id, amount, position, dice
+)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);
+"""
+
+
+class BoardStatusDecoder:
+    """Turn a ``BOARD_STATUS_QUERY`` row into a ``BoardStatus``."""
+
+    def __init__(self, trusted: bool = True) -> None:
+        self.game = row_maker(GameSession, GAME_COLUMNS, trusted)
+        self.player = row_maker(Player, PLAYER_COLUMNS, trusted)
+        self.space = row_maker(BoardSpace, SPACE_COLUMNS, trusted)
+        self.square = row_maker(SquareStatus, SQUARE_COLUMNS, trusted)
+
+    def __call__(self, row: Sequence[Any]) -> BoardStatus:
+        split = len(GAME_COLUMNS)
+        players, squares = row[split:]
+        return BoardStatus(
+            game=self.game(row[:split]),
+            players=[self.player(values) for values, _ in players or ()],
+            holdings={values[0]: holdings for values, holdings in players or ()},
+            squares=[
+                self.square((self.space(space), *ownership))
+                for space, *ownership in squares or ()
+            ],
+        )
 
 
 class Repository:
-    """Simple repository that wraps SQL operations."""
+    """Simple repository that wraps SQL operations.
+
+    Rows read back from the schema are decoded with the trusted row factories
+    in ``monopoly.db.rows``; pass ``trusted_rows=False`` to validate every row
+    with pydantic instead. Rows created from user input are always validated.
+
+    By default every money change inserts its ledger row in the same
+    statement batch. Pass a ``BufferedLedger`` to write ledger rows behind
+    the game instead, in ``COPY`` batches.
+
+    With ``pipeline=True`` each unit of work runs in psycopg pipeline mode
+    and the per-turn statements are prepared on first use. Writes nobody
+    reads back (position, ownership, rent transfers, ledger rows, events)
+    then travel with the next read or the commit, so a turn costs about one
+    round trip per read instead of one per statement.
+    """
 
-    def __init__(self, db: Database) -> None:
+    def __init__(
+        self,
+        db: Database,
+        trusted_rows: bool = True,
+        ledger: Optional[BufferedLedger] = None,
+        pipeline: bool = False,
+    ) -> None:
         self.db = db
+        self.trusted_rows = trusted_rows
+        self.ledger = ledger
+        self.pipeline = pipeline
+        # ``None`` leaves psycopg's default: prepare after a few executions.
+        self._prepare: Optional[bool] = True if pipeline else None
+        self._owned_space = row_maker(BoardSpace, SPACE_COLUMNS, trusted_rows)
+        self._owned_state = row_maker(
+            PropertyState, PROPERTY_STATE_COLUMNS, trusted_rows
+        )
+        self._board_status = BoardStatusDecoder(trusted_rows)
+
+    @contextmanager
+    def _cursor(self, model: Type[M]) -> Iterator[Cursor[M]]:
+        """Cursor on the current connection whose rows are ``model`` instances."""
+        with self.db.connection() as conn:
+            with conn.cursor(row_factory=model_row(model, self.trusted_rows)) as cur:
+                yield cur
+
+    @contextmanager
+    def _read_cursor(self, model: Type[M]) -> Iterator[Cursor[M]]:
+        """Like ``_cursor`` but for reads a replica may serve."""
+        with self.db.read_connection() as conn:
+            with conn.cursor(row_factory=model_row(model, self.trusted_rows)) as cur:
+                yield cur
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group the enclosed calls into a single database transaction."""
+        if self.ledger is None:
+            with self.db.transaction(self.pipeline):
+                yield
+            return
+        with self.ledger.transaction(), self.db.transaction(self.pipeline):
+            yield
+
+    def primary_reads(self) -> ContextManager[None]:
+        """Keep reads in the block off the replicas."""
+        return self.db.primary_reads()
+
+    def flush_ledger(self) -> None:
+        """Write buffered ledger rows now, or once the current unit commits."""
+        if self.ledger is not None:
+            self.ledger.request_flush()
+
+    def end_turn(self, game_id: int) -> None:
+        if self.ledger is not None and self.ledger.flush_on_turn_end:
+            self.ledger.request_flush()
+
+    def reset_schema(self) -> None:
+        self.db.apply_schema()
 
     def create_game(self, status: str = "setup") -> GameSession:
         with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                "INSERT INTO game_sessions (status) VALUES (%s) RETURNING *;",
-                (status,),
-            )
+            cur.execute(INSERT_GAME_SQL, (status,))
             row = cur.fetchone()
             return GameSession.model_validate(row)
 
     def get_game(self, game_id: int) -> Optional[GameSession]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute("SELECT * FROM game_sessions WHERE id = %s;", (game_id,))
+        with self._read_cursor(GameSession) as cur:
+            cur.execute(SELECT_GAME_SQL, (game_id,))
+            return cur.fetchone()
+
+    def board_status(self, game_id: int) -> Optional[BoardStatus]:
+        """Players, spaces, owners and improvements of a game in one query."""
+        with self.db.read_connection() as conn, conn.cursor() as cur:
+            cur.execute(BOARD_STATUS_QUERY, (game_id,))
             row = cur.fetchone()
-            return GameSession.model_validate(row) if row else None
+        return self._board_status(row) if row is not None else None
+
+    def delete_game(self, game_id: int) -> None:
+        with self.db.connection() as conn, conn.cursor() as cur:
+            cur.execute(DELETE_GAME_SQL, (game_id,))
+
+    def list_games(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[GameSession]:
+        query = "SELECT * FROM game_sessions"
+        params: list[object] = []
+        if status is not None:
+            query += " WHERE status = %s"
+            params.append(status)
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        with self._read_cursor(GameSession) as cur:
+            cur.execute(query + ";", tuple(params))
+            return cur.fetchall()
+
+    def game_stats(self) -> GameStats:
+        self.flush_ledger()
+        with self.db.read_connection() as conn, conn.cursor() as cur:
+            cur.execute(GAME_STATUS_COUNTS_SQL)
+            by_status = dict(cur.fetchall())
+            cur.execute(GAME_TOTALS_SQL)
+            row = cur.fetchone()
+        players, active, money, transactions = row if row else (0, 0, 0, 0)
+        return GameStats(
+            games_by_status=by_status,
+            players=players,
+            active_players=active,
+            money_in_play=money,
+            transactions=transactions,
+        )
 
     def update_game_status(self, game_id: int, status: str) -> None:
         with self.db.connection() as conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE game_sessions SET status = %s WHERE id = %s;", (status, game_id)
-            )
+            cur.execute(UPDATE_GAME_STATUS_SQL, (status, game_id))
 
     def set_current_turn(self, game_id: int, player_id: int) -> None:
         with self.db.connection() as conn, conn.cursor() as cur:
             cur.execute(
-                "UPDATE game_sessions SET current_turn_player_id = %s WHERE id = %s;",
+                SET_CURRENT_TURN_SQL,
                 (player_id, game_id),
+                prepare=self._prepare,
             )
 
     def add_player(
         self, game_id: int, name: str, starting_money: int, turn_order: int
     ) -> Player:
         with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                """
-                INSERT INTO players (game_id, name, money, turn_order)
-                VALUES (%s, %s, %s, %s) RETURNING *;
-                """,
-                (game_id, name, starting_money, turn_order),
-            )
+            cur.execute(INSERT_PLAYER_SQL, (game_id, name, starting_money, turn_order))
             row = cur.fetchone()
             return Player.model_validate(row)
 
     def list_players(self, game_id: int, active_only: bool = False) -> List[Player]:
-        where_clause = "WHERE game_id = %s"
-        params: list[object] = [game_id]
-        if active_only:
-            where_clause += " AND is_active = TRUE"
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                f"SELECT * FROM players {where_clause} ORDER BY turn_order ASC;",
-                tuple(params),
-            )
-            rows = cur.fetchall()
-            return [Player.model_validate(r) for r in rows]
+        query = LIST_ACTIVE_PLAYERS_SQL if active_only else LIST_PLAYERS_SQL
+        with self._read_cursor(Player) as cur:
+            cur.execute(query, (game_id,))
+            return cur.fetchall()
 
     def get_player(self, player_id: int) -> Optional[Player]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute("SELECT * FROM players WHERE id = %s;", (player_id,))
-            row = cur.fetchone()
-            return Player.model_validate(row) if row else None
+        with self._read_cursor(Player) as cur:
+            cur.execute(
+                SELECT_PLAYER_SQL,
+                (player_id,),
+                prepare=self._prepare,
+            )
+            return cur.fetchone()
 
     def update_player_position(self, player_id: int, position: int) -> None:
         with self.db.connection() as conn, conn.cursor() as cur:
             cur.execute(
-                "UPDATE players SET position = %s WHERE id = %s;", (position, player_id)
+                UPDATE_POSITION_SQL,
+                (position, player_id),
+                prepare=self._prepare,
             )
 
     def update_player_active(self, player_id: int, is_active: bool) -> None:
         with self.db.connection() as conn, conn.cursor() as cur:
-            cur.execute(
-                "UPDATE players SET is_active = %s WHERE id = %s;",
-                (is_active, player_id),
-            )
+            cur.execute(UPDATE_ACTIVE_SQL, (is_active, player_id))
 
     def adjust_money(
-        self, game_id: int, player_id: int, delta: int, description: str
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
     ) -> Player:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        with self._cursor(Player) as cur:
             cur.execute(
-                "UPDATE players SET money = money + %s WHERE id = %s RETURNING *;",
-                (delta, player_id),
+                ADJUST_MONEY_SQL,
+                (delta, holdings_delta, player_id),
+                prepare=self._prepare,
             )
-            row = cur.fetchone()
+            # Queue the ledger row before reading the update back, so in
+            # pipeline mode both share one round trip.
+            self._log_money(cur.connection, game_id, player_id, delta, description)
+            return cur.fetchone()
+
+    def set_holdings(self, player_id: int, holdings: int) -> None:
+        with self.db.connection() as conn, conn.cursor() as cur:
             cur.execute(
-                """
-                INSERT INTO transactions (game_id, player_id, amount, description)
-                VALUES (%s, %s, %s, %s);
-                """,
+                "UPDATE players SET holdings = %s WHERE id = %s;",
+                (holdings, player_id),
+            )
+
+    def standings(self, game_id: int) -> List[Standing]:
+        with self.db.read_connection() as conn, conn.cursor() as cur:
+            cur.execute(STANDINGS_SQL, (game_id,))
+            return ranked(cur.fetchall())
+
+    def leaderboard(self, limit: int = 10) -> List[Standing]:
+        with self.db.read_connection() as conn, conn.cursor() as cur:
+            cur.execute(LEADERBOARD_SQL, (limit,))
+            return ranked(cur.fetchall())
+
+    def _log_money(
+        self,
+        conn: Connection,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+    ) -> None:
+        if self.ledger is not None:
+            self.ledger.append(game_id, player_id, delta, description)
+            return
+        with conn.cursor() as cur:
+            cur.execute(
+                INSERT_TRANSACTION_SQL,
                 (game_id, player_id, delta, description),
+                prepare=self._prepare,
             )
-            return Player.model_validate(row)
 
     def set_money(self, player_id: int, amount: int) -> Player:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        with self._cursor(Player) as cur:
             cur.execute(
                 "UPDATE players SET money = %s WHERE id = %s RETURNING *;",
                 (amount, player_id),
             )
-            row = cur.fetchone()
-            return Player.model_validate(row)
+            return cur.fetchone()
 
     def add_space(
         self,
@@ -165,42 +701,46 @@ class Repository:
                 )
             return space
 
+    def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]:
+        """Insert a whole board, with property states, in one round trip."""
+        if not drafts:
+            return []
+        with self._cursor(BoardSpace) as cur:
+            cur.execute(INSERT_SPACES_SQL, space_params(game_id, drafts))
+            return cur.fetchall()
+
     def list_spaces(self, game_id: int) -> List[BoardSpace]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                "SELECT * FROM spaces WHERE game_id = %s ORDER BY sequence_order ASC;",
-                (game_id,),
-            )
-            rows = cur.fetchall()
-            return [BoardSpace.model_validate(r) for r in rows]
+        with self._read_cursor(BoardSpace) as cur:
+            cur.execute(SELECT_SPACES_SQL, (game_id,))
+            return cur.fetchall()
 
     def get_space_by_order(
         self, game_id: int, sequence_order: int
     ) -> Optional[BoardSpace]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        with self._read_cursor(BoardSpace) as cur:
             cur.execute(
                 "SELECT * FROM spaces WHERE game_id = %s AND sequence_order = %s;",
                 (game_id, sequence_order),
             )
-            row = cur.fetchone()
-            return BoardSpace.model_validate(row) if row else None
+            return cur.fetchone()
 
     def get_space_by_id(self, space_id: int) -> Optional[BoardSpace]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        with self._read_cursor(BoardSpace) as cur:
             cur.execute("SELECT * FROM spaces WHERE id = %s;", (space_id,))
-            row = cur.fetchone()
-            return BoardSpace.model_validate(row) if row else None
+            return cur.fetchone()
 
     def get_property_state(
         self, game_id: int, space_id: int
     ) -> Optional[PropertyState]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        with self._read_cursor(PropertyState) as cur:
             cur.execute(
-                "SELECT * FROM property_states WHERE game_id = %s AND space_id = %s;",
+                SELECT_PROPERTY_STATE_SQL,
                 (game_id, space_id),
+                prepare=self._prepare,
             )
-            row = cur.fetchone()
-            return PropertyState.model_validate(row) if row else None
+            return cur.fetchone()
 
     def set_property_owner(
         self,
@@ -209,103 +749,40 @@ class Repository:
         owner_id: Optional[int],
         improvement_count: Optional[int] = None,
     ) -> None:
-        update_sql = "UPDATE property_states SET owner_id = %s"
-        params: list[object] = [owner_id]
-        if improvement_count is not None:
-            update_sql += ", improvement_count = %s"
-            params.append(improvement_count)
-        update_sql += " WHERE game_id = %s AND space_id = %s;"
-        params.extend([game_id, space_id])
-
+        update_sql, params = property_owner_update(
+            game_id, space_id, owner_id, improvement_count
+        )
         with self.db.connection() as conn, conn.cursor() as cur:
-            cur.execute(update_sql, tuple(params))
+            cur.execute(update_sql, params, prepare=self._prepare)
 
     def increment_improvement(self, game_id: int, space_id: int) -> PropertyState:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        with self._cursor(PropertyState) as cur:
             cur.execute(
-                """
-                UPDATE property_states
-                SET improvement_count = improvement_count + 1
-                WHERE game_id = %s AND space_id = %s
-                RETURNING *;
-                """,
+                INCREMENT_IMPROVEMENT_SQL,
                 (game_id, space_id),
+                prepare=self._prepare,
             )
-            row = cur.fetchone()
-            return PropertyState.model_validate(row)
+            return cur.fetchone()
 
     def properties_by_owner(
         self, game_id: int, owner_id: int
     ) -> List[tuple[BoardSpace, PropertyState]]:
-        with self.db.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                """
-                SELECT
-                    ps.id AS ps_id,
-                    ps.game_id AS ps_game_id,
-                    ps.space_id AS ps_space_id,
-                    ps.owner_id,
-                    ps.improvement_count,
-                    s.id AS space_id,
-                    s.game_id AS space_game_id,
-                    s.sequence_order,
-                    s.name,
-                    s.type,
-                    s.description,
-                    s.purchase_cost,
-                    s.base_rent,
-                    s.event_amount,
-                    s.move_target
-                FROM property_states ps
-                JOIN spaces s ON ps.space_id = s.id
-                WHERE ps.game_id = %s AND ps.owner_id = %s
-                ORDER BY s.sequence_order;
-                """,
-                (game_id, owner_id),
-            )
-            rows = cur.fetchall()
-            results: list[tuple[BoardSpace, PropertyState]] = []
-            for row in rows:
-                ps_row = {
-                    "id": row["ps_id"],
-                    "game_id": row["ps_game_id"],
-                    "space_id": row["ps_space_id"],
-                    "owner_id": row["owner_id"],
-                    "improvement_count": row["improvement_count"],
-                }
-                space_row = {
-                    "id": row["space_id"],
-                    "game_id": row["space_game_id"],
-                    "sequence_order": row["sequence_order"],
-                    "name": row["name"],
-                    "type": row["type"],
-                    "description": row["description"],
-                    "purchase_cost": row["purchase_cost"],
-                    "base_rent": row["base_rent"],
-                    "event_amount": row["event_amount"],
-                    "move_target": row["move_target"],
-                }
-                results.append(
-                    (
-                        BoardSpace.model_validate(space_row),
-                        PropertyState.model_validate(ps_row),
-                    )
-                )
-            return results
+        split = len(SPACE_COLUMNS)
+        with self.db.read_connection() as conn, conn.cursor() as cur:
+            cur.execute(PROPERTIES_BY_OWNER_SQL, (game_id, owner_id))
+            return [
+                (self._owned_space(row[:split]), self._owned_state(row[split:]))
+                for row in cur.fetchall()
+            ]
 
     def release_properties_to_bank(self, game_id: int, owner_id: int) -> None:
         with self.db.connection() as conn, conn.cursor() as cur:
             cur.execute(
-                """
-                UPDATE property_states
-                SET owner_id = NULL, improvement_count = 0
-                WHERE game_id = %s AND owner_id = %s;
-                """,
-                (game_id, owner_id),
+                RELEASE_PROPERTIES_SQL, {"game_id": game_id, "owner_id": owner_id}
             )
 
     def count_spaces(self, game_id: int) -> int:
-        with self.db.connection() as conn, conn.cursor() as cur:
+        with self.db.read_connection() as conn, conn.cursor() as cur:
             cur.execute("SELECT COUNT(*) FROM spaces WHERE game_id = %s;", (game_id,))
             row = cur.fetchone()
             count = row[0] if row else 0
@@ -323,24 +800,124 @@ class Repository:
 
     def reset_turn_orders(self, game_id: int) -> None:
         """Re-normalize turn order so active players stay in order without gaps."""
-        players = self.list_players(game_id, active_only=True)
-        for idx, player in enumerate(players):
-            with self.db.connection() as conn, conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE players SET turn_order = %s WHERE id = %s;",
-                    (idx, player.id),
-                )
+        with self.db.connection() as conn, conn.cursor() as cur:
+            cur.execute(RESET_TURN_ORDERS_SQL, {"game_id": game_id})
+
+    def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]:
+        """Sell every property ``owner_id`` holds back to the bank at once.
+
+        Returns ``(space_id, sale_value)`` per property in board order; the
+        owner is credited the total and each sale gets its own ledger row.
+        """
+        with self.db.connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                LIQUIDATE_PROPERTIES_SQL,
+                {
+                    "game_id": game_id,
+                    "owner_id": owner_id,
+                    "sellback_ratio": sellback_ratio,
+                    "improvement_value": improvement_value,
+                },
+            )
+            return [(space_id, sale_value) for space_id, sale_value in cur.fetchall()]
+
+    def eliminate_player(self, game_id: int, player_id: int) -> None:
+        """Deactivate, release properties and renumber turns in one statement."""
+        with self.db.connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                ELIMINATE_PLAYER_SQL, {"game_id": game_id, "player_id": player_id}
+            )
 
     def transfer_money(
         self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
     ) -> None:
-        self.adjust_money(
-            game_id, payer_id, -amount, f"Paid {amount} for {description}"
-        )
-        self.adjust_money(
-            game_id, payee_id, amount, f"Received {amount} for {description}"
-        )
+        # Nothing reads the new balances back, so no statement here waits.
+        with self.db.connection() as conn:
+            for player_id, delta, note in (
+                (payer_id, -amount, f"Paid {amount} for {description}"),
+                (payee_id, amount, f"Received {amount} for {description}"),
+            ):
+                with conn.cursor() as cur:
+                    cur.execute(
+                        CREDIT_PLAYER_SQL,
+                        (delta, player_id),
+                        prepare=self._prepare,
+                    )
+                self._log_money(conn, game_id, player_id, delta, note)
 
     def remove_player(self, player_id: int) -> None:
         with self.db.connection() as conn, conn.cursor() as cur:
             cur.execute("DELETE FROM players WHERE id = %s;", (player_id,))
+
+    def list_transactions(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Transaction]:
+        self.flush_ledger()
+        query = LIST_TRANSACTIONS_SQL
+        params: list[object] = [game_id]
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        with self._read_cursor(Transaction) as cur:
+            cur.execute(query + ";", tuple(params))
+            return cur.fetchall()
+
+    def append_transactions(
+        self, game_id: int, entries: Sequence[Tuple[Optional[int], int, str]]
+    ) -> None:
+        if not entries:
+            return
+        with self.db.connection() as conn, conn.cursor() as cur:
+            with cur.copy(COPY_TRANSACTIONS) as copy:
+                for player_id, amount, description in entries:
+                    copy.write_row((game_id, player_id, amount, description))
+
+    def list_property_states(self, game_id: int) -> List[PropertyState]:
+        with self._read_cursor(PropertyState) as cur:
+            cur.execute(LIST_PROPERTY_STATES_SQL, (game_id,))
+            return cur.fetchall()
+
+    def append_events(self, game_id: int, events: Sequence[TurnEvent]) -> None:
+        if not events:
+            return
+        rows = event_rows(game_id, events)
+        with self.db.connection() as conn, conn.cursor() as cur:
+            if not self.pipeline:
+                cur.executemany(INSERT_EVENT_SQL, rows)
+                return
+            # executemany syncs the pipeline; single inserts ride along with
+            # the commit instead.
+            for row in rows:
+                cur.execute(INSERT_EVENT_SQL, row, prepare=True)
+
+    def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]:
+        query, params = events_query(game_id, after_turn, upto_turn)
+        with self._read_cursor(TurnEvent) as cur:
+            cur.execute(query, params)
+            return cur.fetchall()
+
+    def last_event_turn(self, game_id: int) -> Optional[int]:
+        with self.db.read_connection() as conn, conn.cursor() as cur:
+            cur.execute(LAST_EVENT_TURN_SQL, (game_id,))
+            row = cur.fetchone()
+            return row[0] if row else None
+
+    def save_snapshot(self, game_id: int, turn: int, state: Dict[str, Any]) -> None:
+        with self.db.connection() as conn, conn.cursor() as cur:
+            cur.execute(SAVE_SNAPSHOT_SQL, (game_id, turn, Jsonb(state)))
+
+    def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]:
+        query, params = latest_snapshot_query(game_id, upto_turn)
+        with self._read_cursor(GameSnapshot) as cur:
+            cur.execute(query, params)
+            return cur.fetchone()
@@ -0,0 +1,100 @@
+"""Row factories that turn rows from our own schema into models quickly."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Sequence, Type, TypeVar
+
+from psycopg import Cursor
+from psycopg.rows import RowFactory, RowMaker, no_result
+from pydantic import BaseModel
+
+from monopoly.models import BoardSpace, EventKind, SpaceType, TurnEvent
+
+M = TypeVar("M", bound=BaseModel)
+
+# Columns whose database representation differs from the model field type.
+_CONVERTERS: Dict[Type[BaseModel], Dict[str, Callable[[Any], Any]]] = {
+    BoardSpace: {"type": SpaceType},
+    TurnEvent: {"kind": EventKind},
+}
+
+
+class TrustedBuilder:
+    """Build ``model`` instances from a fixed column layout without validation.
+
+    Only use this for rows read back from tables this package created: the
+    column types are already guaranteed by the schema, so running pydantic
+    validation on every row is pure overhead. Data typed in by a user still
+    goes through ``model_validate``.
+
+    The instance is filled in the way pydantic 2's ``model_construct`` fills
+    it, without that method's per-field Python loop, which on the pinned
+    pydantic is slower than validating. That layout is not public API, so
+    ``pyproject.toml`` pins the pydantic minor version and
+    ``tests/test_rows.py`` checks every model built here against
+    ``model_validate``. Models with extra fields or private attributes are
+    refused.
+    """
+
+    def __init__(self, model: Type[M], names: Sequence[str]) -> None:
+        missing = set(model.model_fields) - set(names)
+        if missing:
+            raise ValueError(
+                f"{model.__name__} rows are missing columns: {sorted(missing)}"
+            )
+        if model.__private_attributes__ or model.model_config.get("extra") == "allow":
+            raise TypeError(
+                f"{model.__name__} has private attributes or extra fields; "
+                "decode its rows with model_validate."
+            )
+        self.model = model
+        self.names = tuple(names)
+        self.fields = frozenset(model.model_fields)
+        converters = _CONVERTERS.get(model, {})
+        self.converters = [
+            (name, converters[name]) for name in self.names if name in converters
+        ]
+
+    def __call__(self, values: Sequence[Any]) -> M:
+        data = dict(zip(self.names, values))
+        for name, convert in self.converters:
+            if data[name] is not None:
+                data[name] = convert(data[name])
+        if len(data) != len(self.fields):
+            data = {name: data[name] for name in self.fields}
+        obj = self.model.__new__(self.model)
+        object.__setattr__(obj, "__dict__", data)
+        object.__setattr__(obj, "__pydantic_fields_set__", set(self.fields))
+        object.__setattr__(obj, "__pydantic_extra__", None)
+        object.__setattr__(obj, "__pydantic_private__", None)
+        return obj
+
+
+def row_maker(
+    model: Type[M], names: Sequence[str], trusted: bool = True
+) -> RowMaker[M]:
+    """Turn value tuples laid out as ``names`` into ``model`` instances."""
+    if trusted:
+        return TrustedBuilder(model, names)
+    names = tuple(names)
+
+    def make_row(values: Sequence[Any]) -> M:
+        return model.model_validate(dict(zip(names, values)))
+
+    return make_row
+
+
+def model_row(model: Type[M], trusted: bool = True) -> RowFactory[M]:
+    """psycopg row factory producing ``model`` instances.
+
+    With ``trusted`` (the default) rows skip pydantic validation, see
+    ``TrustedBuilder``; otherwise every row goes through ``model_validate``.
+    """
+
+    def factory(cursor: Cursor[Any]) -> RowMaker[M]:
+        if cursor.description is None:
+            return no_result
+        names = [column.name for column in cursor.description]
+        return row_maker(model, names, trusted)
+
+    return factory
@@ -1,4 +1,7 @@
 -- Drop tables if they exist to start fresh (for development)
+DROP TABLE IF EXISTS schema_migrations CASCADE;
+DROP TABLE IF EXISTS game_snapshots CASCADE;
+DROP TABLE IF EXISTS turn_events CASCADE;
 DROP TABLE IF EXISTS transactions CASCADE;
 DROP TABLE IF EXISTS property_states CASCADE;
 DROP TABLE IF EXISTS spaces CASCADE;
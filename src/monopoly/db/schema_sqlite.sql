@@ -0,0 +1,110 @@
+-- SQLite translation of schema.sql plus every migration, for the embedded
+-- backend in monopoly.db.sqlite. Keep the two in step.
+--
+-- SERIAL becomes INTEGER PRIMARY KEY AUTOINCREMENT so ids are never reused,
+-- BOOLEAN is stored as 0/1, TIMESTAMP as ISO text and SMALLINT[]/JSONB as
+-- JSON text; the repository converts them back when it builds models.
+
+-- Game Sessions
+CREATE TABLE IF NOT EXISTS game_sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL DEFAULT 'waiting',
+    current_turn_player_id INTEGER,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Players
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER REFERENCES game_sessions(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    money INTEGER DEFAULT 1500,
+    position INTEGER DEFAULT 0,
+    is_active INTEGER DEFAULT 1,
+    turn_order INTEGER DEFAULT 0,
+    holdings INTEGER NOT NULL DEFAULT 0
+);
+
+-- Spaces (Board Layout)
+CREATE TABLE IF NOT EXISTS spaces (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER REFERENCES game_sessions(id) ON DELETE CASCADE,
+    sequence_order INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT,
+    purchase_cost INTEGER,
+    base_rent INTEGER,
+    event_amount INTEGER DEFAULT 0,
+    move_target INTEGER,
+    UNIQUE (game_id, sequence_order)
+);
+
+-- Property States (Ownership and Improvements)
+CREATE TABLE IF NOT EXISTS property_states (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER REFERENCES game_sessions(id) ON DELETE CASCADE,
+    space_id INTEGER REFERENCES spaces(id) ON DELETE CASCADE,
+    owner_id INTEGER REFERENCES players(id) ON DELETE SET NULL,
+    improvement_count INTEGER DEFAULT 0
+);
+
+-- Transaction log for money changes and auditing
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER REFERENCES game_sessions(id) ON DELETE CASCADE,
+    player_id INTEGER REFERENCES players(id) ON DELETE CASCADE,
+    amount INTEGER NOT NULL,
+    description TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Event-sourced turn log and periodic full-state snapshots.
+CREATE TABLE IF NOT EXISTS turn_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER NOT NULL REFERENCES game_sessions(id) ON DELETE CASCADE,
+    turn INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    player_id INTEGER,
+    space_id INTEGER,
+    counterparty_id INTEGER,
+    amount INTEGER NOT NULL DEFAULT 0,
+    position INTEGER,
+    dice TEXT
+);
+
+CREATE TABLE IF NOT EXISTS game_snapshots (
+    game_id INTEGER NOT NULL REFERENCES game_sessions(id) ON DELETE CASCADE,
+    turn INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (game_id, turn)
+);
+
+-- The per-game lookups the engine issues every turn (0002_hot_path_indexes).
+CREATE INDEX IF NOT EXISTS idx_players_game_turn
+    ON players (game_id, turn_order);
+
+CREATE INDEX IF NOT EXISTS idx_players_game_active_turn
+    ON players (game_id, turn_order)
+    WHERE is_active;
+
+CREATE INDEX IF NOT EXISTS idx_property_states_space
+    ON property_states (space_id);
+
+CREATE INDEX IF NOT EXISTS idx_property_states_game_owner
+    ON property_states (game_id, owner_id)
+    WHERE owner_id IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_transactions_game_id
+    ON transactions (game_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_player
+    ON transactions (player_id);
+
+CREATE INDEX IF NOT EXISTS idx_turn_events_game_turn
+    ON turn_events (game_id, turn, id);
+
+-- Leaderboard by net worth (0004_net_worth).
+CREATE INDEX IF NOT EXISTS idx_players_net_worth
+    ON players ((money + holdings) DESC, id);
@@ -0,0 +1,559 @@
+"""Spread games over several PostgreSQL databases, routed by id.
+
+Each shard's id sequences start at ``index + 1`` and step by the shard count,
+so every game, player and space id names its shard: ``(id - 1) % count``.
+Routing needs no lookup table, and ids stay unique across the whole fleet.
+Shards are identified by their position in the DSN list, which must
+therefore never be reordered; adding shards means moving games with
+``monopoly.db.portable`` into a freshly configured map.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from psycopg import sql
+
+from monopoly.db.base import GameRepository
+from monopoly.db.connection import Database
+from monopoly.db.ledger import BufferedLedger
+from monopoly.db.migrate import Migration
+from monopoly.db.repository import Repository
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    GameSession,
+    GameSnapshot,
+    GameStats,
+    Player,
+    PropertyState,
+    SpaceDraft,
+    SpaceType,
+    Standing,
+    Transaction,
+    TurnEvent,
+)
+
+T = TypeVar("T")
+
+# Tables whose ids are offset per shard. The first three route queries; the
+# rest are offset too so ids never collide when games move between shards.
+ROUTED_TABLES = ("game_sessions", "players", "spaces")
+SHARDED_TABLES = ROUTED_TABLES + ("property_states", "transactions", "turn_events")
+
+CREATE_SHARD_IDENTITY = """
+CREATE TABLE IF NOT EXISTS shard_identity (
+    singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+    shard_index INTEGER NOT NULL,
+    shard_count INTEGER NOT NULL
+);
+"""
+
+
+def shard_index(id_: int, shard_count: int) -> int:
+    """Shard holding the game, player or space with this id."""
+    return (id_ - 1) % shard_count
+
+
+def next_shard_id(current_max: int, index: int, shard_count: int) -> int:
+    """Smallest id above ``current_max`` that belongs to shard ``index``."""
+    return current_max + 1 + (index - current_max) % shard_count
+
+
+def shard_dsns_from_env() -> List[str]:
+    """Shard DSNs from ``DATABASE_SHARD_URLS`` (comma-separated, in order)."""
+    value = os.getenv("DATABASE_SHARD_URLS", "")
+    return [dsn.strip() for dsn in value.split(",") if dsn.strip()]
+
+
+def configure_shard(db: Database, index: int, shard_count: int) -> None:
+    """Offset ``db``'s id sequences so it hands out only shard ``index`` ids.
+
+    Records the shard's place in a ``shard_identity`` row and refuses to run
+    if that row names another place, or if the database already holds
+    games, players or spaces whose ids route elsewhere. Safe to repeat;
+    sequences already stepping by ``shard_count`` are left alone.
+    """
+    with db.transaction() as conn, conn.cursor() as cur:
+        cur.execute(CREATE_SHARD_IDENTITY)
+        cur.execute("SELECT shard_index, shard_count FROM shard_identity;")
+        recorded = cur.fetchone()
+        if recorded is not None and tuple(recorded) != (index, shard_count):
+            raise ValueError(
+                f"Database is shard {recorded[0]} of {recorded[1]}, not "
+                f"{index} of {shard_count}; keep shard DSNs in their original order."
+            )
+        for table in ROUTED_TABLES:
+            cur.execute(
+                sql.SQL("SELECT COUNT(*) FROM {} WHERE (id - 1) %% %s <> %s;").format(
+                    sql.Identifier(table)
+                ),
+                (shard_count, index),
+            )
+            row = cur.fetchone()
+            if row and row[0]:
+                raise ValueError(
+                    f"{table} holds {row[0]} rows whose ids belong to another "
+                    "shard; export and re-import those games first."
+                )
+        for table in SHARDED_TABLES:
+            cur.execute(
+                sql.SQL(
+                    "SELECT pg_get_serial_sequence(%s, 'id'), "
+                    "COALESCE(MAX(id), 0) FROM {};"
+                ).format(sql.Identifier(table)),
+                (table,),
+            )
+            sequence, current_max = cur.fetchone() or (None, 0)
+            if sequence is None:
+                continue
+            cur.execute(
+                "SELECT seqincrement FROM pg_sequence WHERE seqrelid = %s::regclass;",
+                (sequence,),
+            )
+            increment = cur.fetchone()
+            if recorded is not None and increment and increment[0] == shard_count:
+                continue
+            cur.execute(
+                sql.SQL("ALTER SEQUENCE {} INCREMENT BY {} RESTART WITH {};").format(
+                    # pg_get_serial_sequence returns an already quoted name.
+                    sql.SQL(sequence),
+                    sql.Literal(shard_count),
+                    sql.Literal(next_shard_id(current_max, index, shard_count)),
+                )
+            )
+        if recorded is None:
+            cur.execute(
+                "INSERT INTO shard_identity (shard_index, shard_count) VALUES (%s, %s);",
+                (index, shard_count),
+            )
+
+
+@dataclass
+class _ShardTransaction:
+    """The unit of work in progress and the one shard it has touched."""
+
+    stack: ExitStack
+    index: Optional[int] = None
+
+
+class ShardedRepository:
+    """``GameRepository`` that sends each call to the shard owning its ids.
+
+    ``shards`` are ordinary repositories, one per database, whose ids follow
+    ``shard_index``. New games go to the shards in turn. A unit of work
+    opens a transaction on the first shard it touches and stays there: a
+    game never spans shards, so touching a second one raises
+    ``RuntimeError`` instead of committing half the work.
+
+    ``list_games``, ``game_stats``, ``leaderboard`` and ``reset_schema`` ask
+    every shard at once on a thread pool and merge the answers.
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[GameRepository],
+        configure: Optional[Callable[[], None]] = None,
+    ) -> None:
+        if not shards:
+            raise ValueError("A sharded repository needs at least one shard.")
+        self.shards: List[GameRepository] = list(shards)
+        self._configure = configure
+        # Start placement at a random shard so many short-lived processes
+        # (CLI runs, scripts) do not all put their first game on shard 0.
+        self._placement = itertools.count(random.randrange(len(self.shards)))
+        self._placement_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._work: ContextVar[Optional[_ShardTransaction]] = ContextVar(
+            f"monopoly_shard_work_{id(self)}", default=None
+        )
+
+    def shard_of(self, id_: int) -> int:
+        return shard_index(id_, len(self.shards))
+
+    def _shard(self, index: int) -> GameRepository:
+        repo = self.shards[index]
+        work = self._work.get()
+        if work is None or work.index == index:
+            return repo
+        if work.index is not None:
+            raise RuntimeError(
+                f"Unit of work on shard {work.index} cannot touch shard {index}."
+            )
+        work.stack.enter_context(repo.unit_of_work())
+        work.index = index
+        return repo
+
+    def _route(self, id_: int) -> GameRepository:
+        return self._shard(self.shard_of(id_))
+
+    def _fan_out(self, call: Callable[[GameRepository], T]) -> List[T]:
+        """``call`` on every shard in parallel; results in shard order."""
+        if len(self.shards) == 1:
+            return [call(self.shards[0])]
+        if self._executor is None:
+            with self._placement_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=len(self.shards),
+                        thread_name_prefix="monopoly-shard",
+                    )
+        return list(self._executor.map(call, self.shards))
+
+    def close(self) -> None:
+        """Stop the fan-out threads; the shards' databases are closed by their owner."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """One transaction on whichever shard the enclosed calls route to."""
+        if self._work.get() is not None:
+            yield
+            return
+        with ExitStack() as stack:
+            token = self._work.set(_ShardTransaction(stack))
+            try:
+                yield
+            finally:
+                self._work.reset(token)
+
+    @contextmanager
+    def primary_reads(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for shard in self.shards:
+                stack.enter_context(shard.primary_reads())
+            yield
+
+    def end_turn(self, game_id: int) -> None:
+        self._route(game_id).end_turn(game_id)
+
+    def reset_schema(self) -> None:
+        self._fan_out(lambda shard: shard.reset_schema())
+        if self._configure is not None:
+            self._configure()
+
+    def create_game(self, status: str = "setup") -> GameSession:
+        work = self._work.get()
+        if work is not None and work.index is not None:
+            index = work.index
+        else:
+            with self._placement_lock:
+                index = next(self._placement) % len(self.shards)
+        game = self._shard(index).create_game(status)
+        if self.shard_of(game.id) != index:
+            raise RuntimeError(
+                f"Shard {index} handed out game id {game.id}, which routes to "
+                f"shard {self.shard_of(game.id)}; configure the shard map first."
+            )
+        return game
+
+    def get_game(self, game_id: int) -> Optional[GameSession]:
+        return self._route(game_id).get_game(game_id)
+
+    def board_status(self, game_id: int) -> Optional[BoardStatus]:
+        return self._route(game_id).board_status(game_id)
+
+    def delete_game(self, game_id: int) -> None:
+        self._route(game_id).delete_game(game_id)
+
+    def list_games(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[GameSession]:
+        parts = self._fan_out(lambda shard: shard.list_games(status, limit))
+        games = sorted(
+            itertools.chain.from_iterable(parts),
+            key=lambda g: (g.created_at, g.id),
+            reverse=True,
+        )
+        return games[:limit]
+
+    def game_stats(self) -> GameStats:
+        return GameStats.combine(self._fan_out(lambda shard: shard.game_stats()))
+
+    def shard_stats(self) -> List[GameStats]:
+        """``game_stats()`` of each shard, in shard order."""
+        return self._fan_out(lambda shard: shard.game_stats())
+
+    def update_game_status(self, game_id: int, status: str) -> None:
+        self._route(game_id).update_game_status(game_id, status)
+
+    def set_current_turn(self, game_id: int, player_id: int) -> None:
+        self._route(game_id).set_current_turn(game_id, player_id)
+
+    def add_player(
+        self, game_id: int, name: str, starting_money: int, turn_order: int
+    ) -> Player:
+        return self._route(game_id).add_player(
+            game_id, name, starting_money, turn_order
+        )
+
+    def list_players(self, game_id: int, active_only: bool = False) -> List[Player]:
+        return self._route(game_id).list_players(game_id, active_only)
+
+    def get_player(self, player_id: int) -> Optional[Player]:
+        return self._route(player_id).get_player(player_id)
+
+    def update_player_position(self, player_id: int, position: int) -> None:
+        self._route(player_id).update_player_position(player_id, position)
+
+    def update_player_active(self, player_id: int, is_active: bool) -> None:
+        self._route(player_id).update_player_active(player_id, is_active)
+
+    def adjust_money(
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
+    ) -> Player:
+        return self._route(game_id).adjust_money(
+            game_id, player_id, delta, description, holdings_delta
+        )
+
+    def set_holdings(self, player_id: int, holdings: int) -> None:
+        self._route(player_id).set_holdings(player_id, holdings)
+
+    def standings(self, game_id: int) -> List[Standing]:
+        return self._route(game_id).standings(game_id)
+
+    def leaderboard(self, limit: int = 10) -> List[Standing]:
+        parts = self._fan_out(lambda shard: shard.leaderboard(limit))
+        best = sorted(
+            itertools.chain.from_iterable(parts),
+            key=lambda s: (-s.net_worth, s.player_id),
+        )[:limit]
+        return [
+            standing.model_copy(update={"rank": rank})
+            for rank, standing in enumerate(best, start=1)
+        ]
+
+    def set_money(self, player_id: int, amount: int) -> Player:
+        return self._route(player_id).set_money(player_id, amount)
+
+    def add_space(
+        self,
+        game_id: int,
+        sequence_order: int,
+        name: str,
+        type_: SpaceType | str,
+        description: str | None = None,
+        purchase_cost: int | None = None,
+        base_rent: int | None = None,
+        event_amount: int = 0,
+        move_target: int | None = None,
+    ) -> BoardSpace:
+        return self._route(game_id).add_space(
+            game_id,
+            sequence_order,
+            name,
+            type_,
+            description,
+            purchase_cost,
+            base_rent,
+            event_amount,
+            move_target,
+        )
+
+    def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]:
+        return self._route(game_id).add_spaces(game_id, drafts)
+
+    def list_spaces(self, game_id: int) -> List[BoardSpace]:
+        return self._route(game_id).list_spaces(game_id)
+
+    def get_space_by_order(
+        self, game_id: int, sequence_order: int
+    ) -> Optional[BoardSpace]:
+        return self._route(game_id).get_space_by_order(game_id, sequence_order)
+
+    def get_space_by_id(self, space_id: int) -> Optional[BoardSpace]:
+        return self._route(space_id).get_space_by_id(space_id)
+
+    def get_property_state(
+        self, game_id: int, space_id: int
+    ) -> Optional[PropertyState]:
+        return self._route(game_id).get_property_state(game_id, space_id)
+
+    def set_property_owner(
+        self,
+        game_id: int,
+        space_id: int,
+        owner_id: Optional[int],
+        improvement_count: Optional[int] = None,
+    ) -> None:
+        self._route(game_id).set_property_owner(
+            game_id, space_id, owner_id, improvement_count
+        )
+
+    def increment_improvement(self, game_id: int, space_id: int) -> PropertyState:
+        return self._route(game_id).increment_improvement(game_id, space_id)
+
+    def properties_by_owner(
+        self, game_id: int, owner_id: int
+    ) -> List[tuple[BoardSpace, PropertyState]]:
+        return self._route(game_id).properties_by_owner(game_id, owner_id)
+
+    def release_properties_to_bank(self, game_id: int, owner_id: int) -> None:
+        self._route(game_id).release_properties_to_bank(game_id, owner_id)
+
+    def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]:
+        return self._route(game_id).liquidate_properties(
+            game_id, owner_id, sellback_ratio, improvement_value
+        )
+
+    def eliminate_player(self, game_id: int, player_id: int) -> None:
+        self._route(game_id).eliminate_player(game_id, player_id)
+
+    def count_spaces(self, game_id: int) -> int:
+        return self._route(game_id).count_spaces(game_id)
+
+    def next_sequence_order(self, game_id: int) -> int:
+        return self._route(game_id).next_sequence_order(game_id)
+
+    def reset_turn_orders(self, game_id: int) -> None:
+        self._route(game_id).reset_turn_orders(game_id)
+
+    def transfer_money(
+        self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
+    ) -> None:
+        self._route(game_id).transfer_money(
+            game_id, payer_id, payee_id, amount, description
+        )
+
+    def remove_player(self, player_id: int) -> None:
+        self._route(player_id).remove_player(player_id)
+
+    def list_transactions(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Transaction]:
+        return self._route(game_id).list_transactions(game_id, limit)
+
+    def append_transactions(
+        self, game_id: int, entries: Sequence[Tuple[Optional[int], int, str]]
+    ) -> None:
+        self._route(game_id).append_transactions(game_id, entries)
+
+    def list_property_states(self, game_id: int) -> List[PropertyState]:
+        return self._route(game_id).list_property_states(game_id)
+
+    def append_events(self, game_id: int, events: Sequence[TurnEvent]) -> None:
+        self._route(game_id).append_events(game_id, events)
+
+    def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]:
+        return self._route(game_id).list_events(game_id, after_turn, upto_turn)
+
+    def last_event_turn(self, game_id: int) -> Optional[int]:
+        return self._route(game_id).last_event_turn(game_id)
+
+    def save_snapshot(self, game_id: int, turn: int, state: Dict[str, Any]) -> None:
+        self._route(game_id).save_snapshot(game_id, turn, state)
+
+    def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]:
+        return self._route(game_id).latest_snapshot(game_id, upto_turn)
+
+
+class ShardMap:
+    """Ordered shard DSNs and a ``Database`` for each.
+
+    ``db_options`` go to every ``Database``. Replicas belong to a single
+    primary, so ``DATABASE_REPLICA_URLS`` is not applied to shards; pass
+    per-shard ``replica_dsns`` lists to use replicas.
+    """
+
+    def __init__(
+        self,
+        dsns: Sequence[str],
+        replica_dsns: Optional[Sequence[Sequence[str]]] = None,
+        **db_options: Any,
+    ) -> None:
+        if not dsns:
+            raise ValueError("A shard map needs at least one DSN.")
+        if replica_dsns is not None and len(replica_dsns) != len(dsns):
+            raise ValueError("Give one replica list per shard.")
+        self.databases: List[Database] = [
+            Database(
+                dsn,
+                replica_dsns=replica_dsns[index] if replica_dsns else (),
+                **db_options,
+            )
+            for index, dsn in enumerate(dsns)
+        ]
+
+    @classmethod
+    def from_env(cls, **db_options: Any) -> Optional["ShardMap"]:
+        """The map named by ``DATABASE_SHARD_URLS``, or ``None`` if unset."""
+        dsns = shard_dsns_from_env()
+        return cls(dsns, **db_options) if dsns else None
+
+    def __len__(self) -> int:
+        return len(self.databases)
+
+    def shard_of(self, id_: int) -> int:
+        return shard_index(id_, len(self.databases))
+
+    def database_for(self, id_: int) -> Database:
+        """The database holding the game, player or space with this id."""
+        return self.databases[self.shard_of(id_)]
+
+    def configure(self) -> None:
+        """Offset every shard's id sequences; see ``configure_shard``."""
+        for index, db in enumerate(self.databases):
+            configure_shard(db, index, len(self.databases))
+
+    def migrate(self) -> List[List[Migration]]:
+        """Apply pending migrations on every shard, then ``configure()``."""
+        applied = [db.migrate() for db in self.databases]
+        self.configure()
+        return applied
+
+    def repository(
+        self, buffered_ledger: bool = False, pipeline: bool = False
+    ) -> ShardedRepository:
+        """A ``ShardedRepository`` over one ``Repository`` per shard."""
+        shards: List[GameRepository] = []
+        for db in self.databases:
+            ledger = BufferedLedger(db) if buffered_ledger else None
+            shards.append(Repository(db, ledger=ledger, pipeline=pipeline))
+        return ShardedRepository(shards, configure=self.configure)
+
+    def close(self) -> None:
+        for db in self.databases:
+            db.close()
+
+    def __enter__(self) -> "ShardMap":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
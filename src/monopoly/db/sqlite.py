@@ -0,0 +1,874 @@
+"""Embedded SQLite backend for single-node and offline installs."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from monopoly.db.migrate import holdings_backfill
+from monopoly.db.repository import (
+    GAME_COLUMNS,
+    GAME_STATUS_COUNTS_SQL,
+    GAME_TOTALS_SQL,
+    PLAYER_COLUMNS,
+    PROPERTY_STATE_COLUMNS,
+    SPACE_COLUMNS,
+    STANDING_COLUMNS,
+    ranked,
+)
+from monopoly.db.rows import row_maker
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    GameSession,
+    GameSnapshot,
+    GameStats,
+    Player,
+    PropertyState,
+    SpaceDraft,
+    SpaceType,
+    Standing,
+    SquareStatus,
+    Transaction,
+    TurnEvent,
+)
+
+SQLITE_SCHEMA_PATH = Path(__file__).with_name("schema_sqlite.sql")
+DEFAULT_SQLITE_PATH = "monopoly.db"
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+TABLES = (
+    "game_snapshots",
+    "turn_events",
+    "transactions",
+    "property_states",
+    "spaces",
+    "players",
+    "game_sessions",
+)
+
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+TRANSACTION_COLUMNS = (
+    "id",
+    "game_id",
+    "player_id",
+    "amount",
+    "description",
+    "created_at",
+)
+EVENT_COLUMNS = (
+    "id",
+    "game_id",
+    "turn",
+    "kind",
+    "player_id",
+    "space_id",
+    "counterparty_id",
+    "amount",
+    "position",
+    "dice",
+)
+SNAPSHOT_COLUMNS = ("game_id", "turn", "state", "created_at")
+
+# Columns stored as 0/1, ISO text or JSON text that models expect as Python
+# values.
+_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "is_active": bool,
+    "created_at": datetime.fromisoformat,
+    "dice": json.loads,
+    "state": json.loads,
+}
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _columns(columns: Sequence[str], alias: str = "") -> str:
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(prefix + column for column in columns)
+
+
+def _named_params(statement: str) -> str:
+    """Postgres ``%(name)s`` placeholders as SQLite's ``:name``."""
+    return re.sub(r"%\((\w+)\)s", r":\1", statement)
+
+
+def sqlite_row(
+    model: Type[M], columns: Sequence[str], trusted: bool = True
+) -> Callable[[Sequence[Any]], M]:
+    """Build ``model`` instances from SQLite rows laid out as ``columns``."""
+    build = row_maker(model, columns, trusted)
+    decoders = [
+        (idx, _DECODERS[name]) for idx, name in enumerate(columns) if name in _DECODERS
+    ]
+    if not decoders:
+        return build
+
+    def make_row(values: Sequence[Any]) -> M:
+        decoded = list(values)
+        for idx, decode in decoders:
+            if decoded[idx] is not None:
+                decoded[idx] = decode(decoded[idx])
+        return build(decoded)
+
+    return make_row
+
+
+class SqliteDatabase:
+    """One SQLite connection shared by every caller in the process.
+
+    The file is opened in WAL mode with ``synchronous=NORMAL``: commits do not
+    wait for an fsync, so a power cut can lose the last few turns, but the
+    file is never corrupted and an application crash loses nothing. Callers
+    take turns on the connection; ``transaction()`` holds it, and a single
+    ``BEGIN IMMEDIATE``, for the whole block. ``path`` defaults to
+    ``MONOPOLY_SQLITE_PATH`` or ``monopoly.db``; ``":memory:"`` keeps
+    everything in RAM.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        synchronous: str = "NORMAL",
+    ) -> None:
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"synchronous must be one of {SYNCHRONOUS_LEVELS}.")
+        self.path = str(
+            path or os.getenv("MONOPOLY_SQLITE_PATH") or DEFAULT_SQLITE_PATH
+        )
+        self.conn = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.conn.execute("PRAGMA foreign_keys = ON;")
+        # Built in only where SQLite was compiled with math functions.
+        self.conn.create_function("floor", 1, math.floor, deterministic=True)
+        # In-memory databases report "memory" and stay that way.
+        self.journal_mode = self.conn.execute("PRAGMA journal_mode = WAL;").fetchone()[
+            0
+        ]
+        self.conn.execute(f"PRAGMA synchronous = {synchronous};")
+        self._lock = threading.RLock()
+        self._depth = 0
+        self.create_schema()
+
+    def __enter__(self) -> "SqliteDatabase":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self.conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed block in one transaction; nested blocks join it."""
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self.conn
+                finally:
+                    self._depth -= 1
+                return
+            self.conn.execute("BEGIN IMMEDIATE;")
+            self._depth = 1
+            try:
+                yield self.conn
+            except BaseException:
+                self._depth = 0
+                self.conn.execute("ROLLBACK;")
+                raise
+            self._depth = 0
+            self.conn.execute("COMMIT;")
+
+    def in_transaction(self) -> bool:
+        return self._depth > 0
+
+    def create_schema(self) -> None:
+        """Create any missing tables and indexes, keeping existing data."""
+        with self._lock:
+            self._add_holdings()
+            self.conn.executescript(SQLITE_SCHEMA_PATH.read_text())
+
+    def _add_holdings(self) -> None:
+        """Bring files from before ``players.holdings`` up to date.
+
+        Mirrors migration 0004, including its holdings backfill.
+        """
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(players);")}
+        if not columns or "holdings" in columns:
+            return
+        statement, params = holdings_backfill()
+        with self.transaction() as conn:
+            conn.execute(
+                "ALTER TABLE players ADD COLUMN holdings INTEGER NOT NULL DEFAULT 0;"
+            )
+            conn.execute(_named_params(statement), params)
+
+    def apply_schema(self) -> None:
+        """Drop every table and rebuild the schema (development only)."""
+        with self._lock:
+            self.conn.executescript(
+                "".join(f"DROP TABLE IF EXISTS {table};\n" for table in TABLES)
+            )
+            self.create_schema()
+
+
+class SqliteRepository:
+    """``GameRepository`` on an embedded SQLite database.
+
+    Mirrors ``Repository`` statement for statement where SQLite allows and
+    sticks to SQL every SQLite 3 in the wild understands, so no
+    ``RETURNING`` or ``UPDATE ... FROM``: multi-statement methods run in one
+    transaction instead. Each engine operation is one ``unit_of_work``, so a
+    whole turn commits once.
+    """
+
+    def __init__(self, db: SqliteDatabase, trusted_rows: bool = True) -> None:
+        self.db = db
+        self.trusted_rows = trusted_rows
+        self._game = sqlite_row(GameSession, GAME_COLUMNS, trusted_rows)
+        self._player = sqlite_row(Player, PLAYER_COLUMNS, trusted_rows)
+        self._space = sqlite_row(BoardSpace, SPACE_COLUMNS, trusted_rows)
+        self._state = sqlite_row(PropertyState, PROPERTY_STATE_COLUMNS, trusted_rows)
+        self._transaction = sqlite_row(Transaction, TRANSACTION_COLUMNS, trusted_rows)
+        self._event = sqlite_row(TurnEvent, EVENT_COLUMNS, trusted_rows)
+        self._snapshot = sqlite_row(GameSnapshot, SNAPSHOT_COLUMNS, trusted_rows)
+
+    def _one(
+        self, make: Callable[[Sequence[Any]], M], query: str, params: Sequence[Any]
+    ) -> Optional[M]:
+        with self.db.connection() as conn:
+            row = conn.execute(query, params).fetchone()
+        return make(row) if row is not None else None
+
+    def _all(
+        self, make: Callable[[Sequence[Any]], M], query: str, params: Sequence[Any]
+    ) -> List[M]:
+        with self.db.connection() as conn:
+            return [make(row) for row in conn.execute(query, params)]
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group the enclosed calls into a single SQLite transaction."""
+        with self.db.transaction():
+            yield
+
+    @contextmanager
+    def primary_reads(self) -> Iterator[None]:
+        yield
+
+    def end_turn(self, game_id: int) -> None:
+        pass
+
+    def reset_schema(self) -> None:
+        self.db.apply_schema()
+
+    def create_game(self, status: str = "setup") -> GameSession:
+        with self.db.connection() as conn:
+            cur = conn.execute(
+                "INSERT INTO game_sessions (status) VALUES (?);", (status,)
+            )
+            game_id = cur.lastrowid
+        game = self.get_game(game_id)  # type: ignore[arg-type]
+        assert game is not None
+        return game
+
+    def get_game(self, game_id: int) -> Optional[GameSession]:
+        return self._one(
+            self._game,
+            f"SELECT {_columns(GAME_COLUMNS)} FROM game_sessions WHERE id = ?;",
+            (game_id,),
+        )
+
+    def board_status(self, game_id: int) -> Optional[BoardStatus]:
+        """Players, spaces, owners and improvements of a game."""
+        with self.db.connection():
+            game = self.get_game(game_id)
+            if game is None:
+                return None
+            split = len(SPACE_COLUMNS)
+            squares = self._all(
+                lambda row: SquareStatus(
+                    space=self._space(row[:split]),
+                    owner_id=row[split],
+                    owner_name=row[split + 1],
+                    improvement_count=row[split + 2],
+                ),
+                f"""
+                SELECT {_columns(SPACE_COLUMNS, "s")},
+                    ps.owner_id, o.name, COALESCE(ps.improvement_count, 0)
+                FROM spaces s
+                LEFT JOIN property_states ps ON ps.space_id = s.id
+                LEFT JOIN players o ON o.id = ps.owner_id
+                WHERE s.game_id = ?
+                ORDER BY s.sequence_order;
+                """,
+                (game_id,),
+            )
+            with self.db.connection() as conn:
+                rows = conn.execute(
+                    f"SELECT {_columns(PLAYER_COLUMNS)}, holdings FROM players "
+                    "WHERE game_id = ? ORDER BY turn_order ASC;",
+                    (game_id,),
+                ).fetchall()
+            players = [self._player(row[:-1]) for row in rows]
+            return BoardStatus(
+                game=game,
+                players=players,
+                squares=squares,
+                holdings={p.id: row[-1] for p, row in zip(players, rows)},
+            )
+
+    def delete_game(self, game_id: int) -> None:
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM game_sessions WHERE id = ?;", (game_id,))
+
+    def list_games(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[GameSession]:
+        query = f"SELECT {_columns(GAME_COLUMNS)} FROM game_sessions"
+        params: list[object] = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self._all(self._game, query + ";", params)
+
+    def game_stats(self) -> GameStats:
+        with self.db.connection() as conn:
+            by_status = dict(conn.execute(GAME_STATUS_COUNTS_SQL).fetchall())
+            players, active, money, transactions = conn.execute(
+                GAME_TOTALS_SQL
+            ).fetchone()
+        return GameStats(
+            games_by_status=by_status,
+            players=players,
+            active_players=active,
+            money_in_play=money,
+            transactions=transactions,
+        )
+
+    def update_game_status(self, game_id: int, status: str) -> None:
+        with self.db.connection() as conn:
+            conn.execute(
+                "UPDATE game_sessions SET status = ? WHERE id = ?;", (status, game_id)
+            )
+
+    def set_current_turn(self, game_id: int, player_id: int) -> None:
+        with self.db.connection() as conn:
+            conn.execute(
+                "UPDATE game_sessions SET current_turn_player_id = ? WHERE id = ?;",
+                (player_id, game_id),
+            )
+
+    def add_player(
+        self, game_id: int, name: str, starting_money: int, turn_order: int
+    ) -> Player:
+        with self.db.connection() as conn:
+            cur = conn.execute(
+                """
+                INSERT INTO players (game_id, name, money, turn_order)
+                VALUES (?, ?, ?, ?);
+                """,
+                (game_id, name, starting_money, turn_order),
+            )
+            player = self.get_player(cur.lastrowid)  # type: ignore[arg-type]
+        assert player is not None
+        return player
+
+    def list_players(self, game_id: int, active_only: bool = False) -> List[Player]:
+        where_clause = "WHERE game_id = ?"
+        if active_only:
+            where_clause += " AND is_active"
+        return self._all(
+            self._player,
+            f"SELECT {_columns(PLAYER_COLUMNS)} FROM players {where_clause} "
+            "ORDER BY turn_order ASC;",
+            (game_id,),
+        )
+
+    def get_player(self, player_id: int) -> Optional[Player]:
+        return self._one(
+            self._player,
+            f"SELECT {_columns(PLAYER_COLUMNS)} FROM players WHERE id = ?;",
+            (player_id,),
+        )
+
+    def update_player_position(self, player_id: int, position: int) -> None:
+        with self.db.connection() as conn:
+            conn.execute(
+                "UPDATE players SET position = ? WHERE id = ?;", (position, player_id)
+            )
+
+    def update_player_active(self, player_id: int, is_active: bool) -> None:
+        with self.db.connection() as conn:
+            conn.execute(
+                "UPDATE players SET is_active = ? WHERE id = ?;",
+                (int(is_active), player_id),
+            )
+
+    def adjust_money(
+        self,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+        holdings_delta: int = 0,
+    ) -> Player:
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE players SET money = money + ?, holdings = holdings + ? "
+                "WHERE id = ?;",
+                (delta, holdings_delta, player_id),
+            )
+            self._log_money(conn, game_id, player_id, delta, description)
+            player = self.get_player(player_id)
+        assert player is not None
+        return player
+
+    def set_holdings(self, player_id: int, holdings: int) -> None:
+        with self.db.connection() as conn:
+            conn.execute(
+                "UPDATE players SET holdings = ? WHERE id = ?;", (holdings, player_id)
+            )
+
+    def standings(self, game_id: int) -> List[Standing]:
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {STANDING_COLUMNS} FROM players WHERE game_id = ? "
+                "ORDER BY money + holdings DESC, id;",
+                (game_id,),
+            ).fetchall()
+        return ranked(rows)
+
+    def leaderboard(self, limit: int = 10) -> List[Standing]:
+        with self.db.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {STANDING_COLUMNS} FROM players "
+                "ORDER BY money + holdings DESC, id LIMIT ?;",
+                (limit,),
+            ).fetchall()
+        return ranked(rows)
+
+    def _log_money(
+        self,
+        conn: sqlite3.Connection,
+        game_id: int,
+        player_id: int,
+        delta: int,
+        description: str,
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO transactions (game_id, player_id, amount, description)
+            VALUES (?, ?, ?, ?);
+            """,
+            (game_id, player_id, delta, description),
+        )
+
+    def set_money(self, player_id: int, amount: int) -> Player:
+        with self.db.connection() as conn:
+            conn.execute(
+                "UPDATE players SET money = ? WHERE id = ?;", (amount, player_id)
+            )
+            player = self.get_player(player_id)
+        assert player is not None
+        return player
+
+    def add_space(
+        self,
+        game_id: int,
+        sequence_order: int,
+        name: str,
+        type_: SpaceType | str,
+        description: str | None = None,
+        purchase_cost: int | None = None,
+        base_rent: int | None = None,
+        event_amount: int = 0,
+        move_target: int | None = None,
+    ) -> BoardSpace:
+        draft = SpaceDraft(
+            sequence_order=sequence_order,
+            name=name,
+            type=type_ if isinstance(type_, SpaceType) else SpaceType(type_),
+            description=description,
+            purchase_cost=purchase_cost,
+            base_rent=base_rent,
+            event_amount=event_amount,
+            move_target=move_target,
+        )
+        return self.add_spaces(game_id, [draft])[0]
+
+    def add_spaces(
+        self, game_id: int, drafts: Sequence[SpaceDraft]
+    ) -> List[BoardSpace]:
+        """Insert a whole board, with property states, in one transaction."""
+        if not drafts:
+            return []
+        rows = [SpaceDraft.model_validate(d).model_dump(mode="json") for d in drafts]
+        with self.db.transaction() as conn:
+            for row in rows:
+                cur = conn.execute(
+                    """
+                    INSERT INTO spaces (
+                        game_id, sequence_order, name, type, description,
+                        purchase_cost, base_rent, event_amount, move_target
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+                    """,
+                    (game_id, *(row[field] for field in SpaceDraft.model_fields)),
+                )
+                if row["type"] == SpaceType.PROPERTY.value:
+                    conn.execute(
+                        """
+                        INSERT INTO property_states (game_id, space_id, owner_id, improvement_count)
+                        VALUES (?, ?, NULL, 0);
+                        """,
+                        (game_id, cur.lastrowid),
+                    )
+            added = {row["sequence_order"] for row in rows}
+            return [
+                space
+                for space in self.list_spaces(game_id)
+                if space.sequence_order in added
+            ]
+
+    def list_spaces(self, game_id: int) -> List[BoardSpace]:
+        return self._all(
+            self._space,
+            f"SELECT {_columns(SPACE_COLUMNS)} FROM spaces WHERE game_id = ? "
+            "ORDER BY sequence_order ASC;",
+            (game_id,),
+        )
+
+    def get_space_by_order(
+        self, game_id: int, sequence_order: int
+    ) -> Optional[BoardSpace]:
+        return self._one(
+            self._space,
+            f"SELECT {_columns(SPACE_COLUMNS)} FROM spaces "
+            "WHERE game_id = ? AND sequence_order = ?;",
+            (game_id, sequence_order),
+        )
+
+    def get_space_by_id(self, space_id: int) -> Optional[BoardSpace]:
+        return self._one(
+            self._space,
+            f"SELECT {_columns(SPACE_COLUMNS)} FROM spaces WHERE id = ?;",
+            (space_id,),
+        )
+
+    def get_property_state(
+        self, game_id: int, space_id: int
+    ) -> Optional[PropertyState]:
+        return self._one(
+            self._state,
+            f"SELECT {_columns(PROPERTY_STATE_COLUMNS)} FROM property_states "
+            "WHERE game_id = ? AND space_id = ?;",
+            (game_id, space_id),
+        )
+
+    def set_property_owner(
+        self,
+        game_id: int,
+        space_id: int,
+        owner_id: Optional[int],
+        improvement_count: Optional[int] = None,
+    ) -> None:
+        update_sql = "UPDATE property_states SET owner_id = ?"
+        params: list[object] = [owner_id]
+        if improvement_count is not None:
+            update_sql += ", improvement_count = ?"
+            params.append(improvement_count)
+        update_sql += " WHERE game_id = ? AND space_id = ?;"
+        params.extend([game_id, space_id])
+        with self.db.connection() as conn:
+            conn.execute(update_sql, params)
+
+    def increment_improvement(self, game_id: int, space_id: int) -> PropertyState:
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE property_states
+                SET improvement_count = improvement_count + 1
+                WHERE game_id = ? AND space_id = ?;
+                """,
+                (game_id, space_id),
+            )
+            state = self.get_property_state(game_id, space_id)
+        assert state is not None
+        return state
+
+    def properties_by_owner(
+        self, game_id: int, owner_id: int
+    ) -> List[tuple[BoardSpace, PropertyState]]:
+        split = len(SPACE_COLUMNS)
+        return self._all(
+            lambda row: (self._space(row[:split]), self._state(row[split:])),
+            f"""
+            SELECT {_columns(SPACE_COLUMNS, "s")}, {_columns(PROPERTY_STATE_COLUMNS, "ps")}
+            FROM property_states ps
+            JOIN spaces s ON ps.space_id = s.id
+            WHERE ps.game_id = ? AND ps.owner_id = ?
+            ORDER BY s.sequence_order;
+            """,
+            (game_id, owner_id),
+        )
+
+    def release_properties_to_bank(self, game_id: int, owner_id: int) -> None:
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE property_states
+                SET owner_id = NULL, improvement_count = 0
+                WHERE game_id = ? AND owner_id = ?;
+                """,
+                (game_id, owner_id),
+            )
+            conn.execute("UPDATE players SET holdings = 0 WHERE id = ?;", (owner_id,))
+
+    def liquidate_properties(
+        self,
+        game_id: int,
+        owner_id: int,
+        sellback_ratio: float,
+        improvement_value: int,
+    ) -> List[Tuple[int, int]]:
+        """Sell every property ``owner_id`` holds back to the bank at once.
+
+        Returns ``(space_id, sale_value)`` per property in board order; the
+        owner is credited the total and each sale gets its own ledger row.
+        """
+        with self.db.transaction() as conn:
+            owned = conn.execute(
+                """
+                SELECT ps.space_id, s.name,
+                    CAST(COALESCE(s.purchase_cost, 0) * ? AS INTEGER)
+                        + ps.improvement_count * ?
+                FROM property_states ps
+                JOIN spaces s ON s.id = ps.space_id
+                WHERE ps.game_id = ? AND ps.owner_id = ?
+                ORDER BY s.sequence_order;
+                """,
+                (sellback_ratio, improvement_value, game_id, owner_id),
+            ).fetchall()
+            if not owned:
+                return []
+            self.release_properties_to_bank(game_id, owner_id)
+            conn.executemany(
+                """
+                INSERT INTO transactions (game_id, player_id, amount, description)
+                VALUES (?, ?, ?, ?);
+                """,
+                [
+                    (game_id, owner_id, value, f"Forced sale of {name}")
+                    for _, name, value in owned
+                ],
+            )
+            conn.execute(
+                "UPDATE players SET money = money + ? WHERE id = ?;",
+                (sum(value for _, _, value in owned), owner_id),
+            )
+        return [(space_id, value) for space_id, _, value in owned]
+
+    def eliminate_player(self, game_id: int, player_id: int) -> None:
+        """Deactivate, release properties and renumber turns in one transaction."""
+        with self.db.transaction():
+            self.update_player_active(player_id, False)
+            self.release_properties_to_bank(game_id, player_id)
+            self.reset_turn_orders(game_id)
+
+    def count_spaces(self, game_id: int) -> int:
+        with self.db.connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM spaces WHERE game_id = ?;", (game_id,)
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def next_sequence_order(self, game_id: int) -> int:
+        with self.db.connection() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(MAX(sequence_order) + 1, 0) FROM spaces WHERE game_id = ?;",
+                (game_id,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def reset_turn_orders(self, game_id: int) -> None:
+        """Re-normalize turn order so active players stay in order without gaps."""
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, turn_order FROM players
+                WHERE game_id = ? AND is_active
+                ORDER BY turn_order, id;
+                """,
+                (game_id,),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE players SET turn_order = ? WHERE id = ?;",
+                [
+                    (idx, player_id)
+                    for idx, (player_id, turn_order) in enumerate(rows)
+                    if turn_order != idx
+                ],
+            )
+
+    def transfer_money(
+        self, game_id: int, payer_id: int, payee_id: int, amount: int, description: str
+    ) -> None:
+        with self.db.transaction() as conn:
+            for player_id, delta, note in (
+                (payer_id, -amount, f"Paid {amount} for {description}"),
+                (payee_id, amount, f"Received {amount} for {description}"),
+            ):
+                conn.execute(
+                    "UPDATE players SET money = money + ? WHERE id = ?;",
+                    (delta, player_id),
+                )
+                self._log_money(conn, game_id, player_id, delta, note)
+
+    def remove_player(self, player_id: int) -> None:
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM players WHERE id = ?;", (player_id,))
+
+    def list_transactions(
+        self, game_id: int, limit: Optional[int] = None
+    ) -> List[Transaction]:
+        query = (
+            f"SELECT {_columns(TRANSACTION_COLUMNS)} FROM transactions "
+            "WHERE game_id = ? ORDER BY id DESC"
+        )
+        params: list[object] = [game_id]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self._all(self._transaction, query + ";", params)
+
+    def append_transactions(
+        self, game_id: int, entries: Sequence[Tuple[Optional[int], int, str]]
+    ) -> None:
+        if not entries:
+            return
+        with self.db.connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO transactions (game_id, player_id, amount, description)
+                VALUES (?, ?, ?, ?);
+                """,
+                [(game_id, *entry) for entry in entries],
+            )
+
+    def list_property_states(self, game_id: int) -> List[PropertyState]:
+        return self._all(
+            self._state,
+            f"SELECT {_columns(PROPERTY_STATE_COLUMNS)} FROM property_states "
+            "WHERE game_id = ? ORDER BY space_id;",
+            (game_id,),
+        )
+
+    def append_events(self, game_id: int, events: Sequence[TurnEvent]) -> None:
+        if not events:
+            return
+        with self.db.connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO turn_events (
+                    game_id, turn, kind, player_id, space_id, counterparty_id,
+                    amount, position, dice
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                [
+                    (
+                        game_id,
+                        e.turn,
+                        e.kind.value,
+                        e.player_id,
+                        e.space_id,
+                        e.counterparty_id,
+                        e.amount,
+                        e.position,
+                        json.dumps(e.dice) if e.dice is not None else None,
+                    )
+                    for e in events
+                ],
+            )
+
+    def list_events(
+        self, game_id: int, after_turn: int = 0, upto_turn: Optional[int] = None
+    ) -> List[TurnEvent]:
+        query = (
+            f"SELECT {_columns(EVENT_COLUMNS)} FROM turn_events "
+            "WHERE game_id = ? AND turn > ?"
+        )
+        params: list[object] = [game_id, after_turn]
+        if upto_turn is not None:
+            query += " AND turn <= ?"
+            params.append(upto_turn)
+        return self._all(self._event, query + " ORDER BY turn, id;", params)
+
+    def last_event_turn(self, game_id: int) -> Optional[int]:
+        with self.db.connection() as conn:
+            row = conn.execute(
+                "SELECT MAX(turn) FROM turn_events WHERE game_id = ?;", (game_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_snapshot(self, game_id: int, turn: int, state: Dict[str, Any]) -> None:
+        with self.db.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO game_snapshots (game_id, turn, state)
+                VALUES (?, ?, ?)
+                ON CONFLICT (game_id, turn) DO UPDATE SET state = excluded.state;
+                """,
+                (game_id, turn, json.dumps(state)),
+            )
+
+    def latest_snapshot(
+        self, game_id: int, upto_turn: Optional[int] = None
+    ) -> Optional[GameSnapshot]:
+        query = (
+            f"SELECT {_columns(SNAPSHOT_COLUMNS)} FROM game_snapshots WHERE game_id = ?"
+        )
+        params: list[object] = [game_id]
+        if upto_turn is not None:
+            query += " AND turn <= ?"
+            params.append(upto_turn)
+        return self._one(self._snapshot, query + " ORDER BY turn DESC LIMIT 1;", params)
@@ -0,0 +1,10 @@
+"""Standard rule values, shared by the engine and the storage layer.
+
+``HouseRules`` (``monopoly.domain.game_engine``) defaults to these; the
+storage layer reads them directly so it never imports the domain.
+"""
+
+PASS_GO_BONUS = 200
+IMPROVEMENT_COST = 100
+IMPROVEMENT_RENT_BONUS = 50
+SELLBACK_RATIO = 0.5
@@ -1,5 +1,6 @@
 """Domain services for the Monopoly game."""
 
-from .game_engine import GameEngine
+from .async_engine import AsyncGameEngine
+from .game_engine import GameEngine, HouseRules
 
-__all__ = ["GameEngine"]
+__all__ = ["AsyncGameEngine", "GameEngine", "HouseRules"]
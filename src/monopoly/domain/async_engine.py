@@ -0,0 +1,175 @@
+"""asyncio version of ``GameEngine`` for servers hosting many games."""
+
+from __future__ import annotations
+
+import random
+from typing import (
+    Any,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from typing import TYPE_CHECKING
+
+from monopoly.context import current_operation
+from monopoly.domain.game_engine import (
+    DEFAULT_BOARD,
+    Call,
+    EngineCore,
+    Flow,
+    HouseRules,
+    TurnResult,
+)
+from monopoly.domain.history import DEFAULT_SNAPSHOT_INTERVAL
+from monopoly.domain.turns import TurnRing
+from monopoly.models import BoardSpace, BoardStatus, Player, Standing
+
+if TYPE_CHECKING:
+    from monopoly.db.aio import AsyncGameRepository
+
+_T = TypeVar("_T")
+
+
+async def await_flow(repo: AsyncGameRepository, flow: Flow[_T]) -> _T:
+    """Async counterpart of ``game_engine.run_flow``."""
+    send: Callable[[Any], Call] = flow.send
+    value: Any = None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as done:
+            return cast(_T, done.value)
+        method = getattr(repo, step.method)
+        try:
+            if step.primary:
+                async with repo.primary_reads():
+                    value = await method(*step.args, **step.kwargs)
+            else:
+                value = await method(*step.args, **step.kwargs)
+            send = flow.send
+        except BaseException as exc:
+            value, send = exc, flow.throw
+
+
+class AsyncGameEngine(EngineCore):
+    """Same turn rules as ``GameEngine``, awaiting an async repository.
+
+    Rules, caches and history live in ``EngineCore``; only the storage calls
+    are awaited here. One engine serves one game and must not run two
+    operations concurrently - callers serialize per game (see
+    ``monopoly.server``).
+    """
+
+    def __init__(
+        self,
+        repo: AsyncGameRepository,
+        game_id: int,
+        rules: Optional[HouseRules] = None,
+        rng: Optional[random.Random] = None,
+        record_history: bool = True,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        self.repo = repo
+        super().__init__(game_id, rules, rng, record_history, snapshot_interval)
+
+    async def _run(self, name: str, flow: Flow[_T]) -> _T:
+        """See ``GameEngine._run``."""
+        token = current_operation.set(name) if current_operation.get() is None else None
+        try:
+            async with self.repo.unit_of_work():
+                return await await_flow(self.repo, self._operation(flow))
+        finally:
+            if token is not None:
+                current_operation.reset(token)
+
+    async def board(self) -> Tuple[Optional[BoardSpace], ...]:
+        """See ``GameEngine.board``."""
+        return await await_flow(self.repo, self._load_board())
+
+    async def turn_ring(self) -> TurnRing:
+        """See ``GameEngine.turn_ring``."""
+        return await await_flow(self.repo, self._load_ring())
+
+    async def board_status(self) -> Optional[BoardStatus]:
+        """See ``GameEngine.board_status``."""
+        return await await_flow(self.repo, self._load_status())
+
+    async def turn(self) -> int:
+        """See ``GameEngine.turn``."""
+        return await await_flow(self.repo, self._history_turn())
+
+    @classmethod
+    async def new_game_with_defaults(
+        cls,
+        repo: AsyncGameRepository,
+        player_names: List[str],
+        starting_money: int,
+        rules: Optional[HouseRules] = None,
+        rng: Optional[random.Random] = None,
+        record_history: bool = True,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        board: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> "AsyncGameEngine":
+        async with repo.unit_of_work():
+            game_id = await await_flow(
+                repo, cls._create_game(player_names, starting_money)
+            )
+            engine = cls(repo, game_id, rules, rng, record_history, snapshot_interval)
+            await engine._run(
+                "new_game_with_defaults",
+                engine._start_game(DEFAULT_BOARD if board is None else board),
+            )
+        return engine
+
+    async def load_default_board(self) -> None:
+        await self.load_board(DEFAULT_BOARD)
+
+    async def load_board(self, layout: Sequence[Mapping[str, Any]]) -> None:
+        """See ``GameEngine.load_board``."""
+        await self._run("load_board", self._load_layout(layout))
+
+    async def ensure_game_ready(self) -> None:
+        await await_flow(self.repo, self._ensure_game_ready())
+
+    async def roll_and_resolve(self, player: Player) -> TurnResult:
+        return await self._run("roll_and_resolve", self._roll_and_resolve(player))
+
+    async def buy_property(self, player: Player, space: BoardSpace) -> bool:
+        return await self._run("buy_property", self._buy_property(player, space))
+
+    async def improve_property(self, player: Player, space: BoardSpace) -> bool:
+        return await self._run(
+            "improve_property", self._improve_property(player, space)
+        )
+
+    async def sell_property(self, player: Player, space: BoardSpace) -> int:
+        return await self._run("sell_property", self._sell_property(player, space))
+
+    async def sell_all_properties(self, player_id: int) -> int:
+        """See ``GameEngine.sell_all_properties``."""
+        return await self._run(
+            "sell_all_properties", self._sell_all_properties(player_id)
+        )
+
+    async def standings(self) -> List[Standing]:
+        """See ``GameEngine.standings``."""
+        return await self.repo.standings(self.game_id)
+
+    async def get_current_player(self) -> Optional[Player]:
+        return await await_flow(self.repo, self._current_player())
+
+    async def set_current_player(self, player_id: int) -> None:
+        """See ``GameEngine.set_current_player``."""
+        await self._run("set_current_player", self._set_current_player(player_id))
+
+    async def ensure_turn_pointer(self) -> Player:
+        """See ``GameEngine.ensure_turn_pointer``."""
+        return await self._run("ensure_turn_pointer", self._ensure_turn_pointer())
+
+    async def next_turn(self) -> Optional[Player]:
+        return await self._run("next_turn", self._next_turn())
@@ -4,17 +4,99 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 if TYPE_CHECKING:
-    from monopoly.db.repository import Repository
-
-from monopoly.models import BoardSpace, Player, SpaceType
+    from monopoly.db.base import GameRepository
+
+from monopoly.context import current_operation
+from monopoly.defaults import (
+    IMPROVEMENT_COST,
+    IMPROVEMENT_RENT_BONUS,
+    PASS_GO_BONUS,
+    SELLBACK_RATIO,
+)
+from monopoly.domain.history import DEFAULT_SNAPSHOT_INTERVAL, state_from_rows
+from monopoly.domain.turns import TurnRing
+from monopoly.models import (
+    BoardSpace,
+    BoardStatus,
+    EventKind,
+    Player,
+    SpaceDraft,
+    SpaceType,
+    Standing,
+    TurnEvent,
+)
+
+CHANCE_OUTCOMES = (-100, -50, 50, 100, 200)
+
+# Payout used when a board space leaves ``event_amount`` at 0.
+DEFAULT_EVENT_PAYOUTS = {
+    SpaceType.BONUS: 150,
+    SpaceType.TAX: -150,
+    SpaceType.PENALTY: -100,
+    SpaceType.JAIL: -50,
+}
+
+
+@dataclass(frozen=True)
+class HouseRules:
+    """Tunable rule constants; defaults are the standard rules above."""
+
+    pass_go_bonus: int = PASS_GO_BONUS
+    improvement_cost: int = IMPROVEMENT_COST
+    improvement_rent_bonus: int = IMPROVEMENT_RENT_BONUS
+    sellback_ratio: float = SELLBACK_RATIO
+
+    def rent(self, space: BoardSpace, improvement_count: int) -> int:
+        return (space.base_rent or 0) + improvement_count * self.improvement_rent_bonus
+
+    @property
+    def improvement_sale_value(self) -> int:
+        return int(self.improvement_cost * self.sellback_ratio)
+
+    def sale_value(self, space: BoardSpace, improvement_count: int) -> int:
+        sale_value = int((space.purchase_cost or 0) * self.sellback_ratio)
+        sale_value += improvement_count * self.improvement_sale_value
+        return sale_value
 
-PASS_GO_BONUS = 200
-IMPROVEMENT_COST = 100
-IMPROVEMENT_RENT_BONUS = 50
-SELLBACK_RATIO = 0.5
+    def event_payout(self, space: BoardSpace) -> int:
+        """Fixed payout for a non-property space; Chance is drawn separately."""
+        if space.type == SpaceType.GO:
+            return space.event_amount or self.pass_go_bonus
+        return space.event_amount or DEFAULT_EVENT_PAYOUTS.get(space.type, 0)
+
+
+def describe_event(space: BoardSpace, payout: int) -> str:
+    """Player-facing message for landing on a non-property ``space``."""
+    if space.type == SpaceType.GO:
+        return f"Landed on GO and collected ${payout}."
+    if space.type == SpaceType.BONUS:
+        return f"Bonus space! Received ${payout}."
+    if space.type == SpaceType.TAX:
+        return f"Tax time. Paid ${abs(payout)}."
+    if space.type == SpaceType.PENALTY:
+        return f"Penalty applied: ${payout}."
+    if space.type == SpaceType.JAIL:
+        return "Sent to jail. Paying fine and moving to jail space."
+    if space.type == SpaceType.CHANCE:
+        return f"Chance card effect: {'gain' if payout > 0 else 'lose'} ${abs(payout)}."
+    return "Nothing happens here."
 
 
 DEFAULT_BOARD = [
@@ -110,55 +192,249 @@ class TurnResult:
     eliminated_players: List[str] = field(default_factory=list)
     winner: Optional[str] = None
 
-
-class GameEngine:
-    def __init__(self, repo: Repository, game_id: int) -> None:
-        self.repo = repo
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "player": self.player.model_dump(),
+            "space": self.space.model_dump(mode="json"),
+            "dice": list(self.dice_rolls),
+            "messages": self.messages,
+            "needs_buy_decision": self.needs_buy_decision,
+            "landed_on_own_property": self.landed_on_own_property,
+            "rent_paid": self.rent_paid,
+            "eliminated": self.eliminated_players,
+            "winner": self.winner,
+        }
+
+
+_T = TypeVar("_T")
+
+
+class Call(NamedTuple):
+    """One repository method call an engine operation needs made.
+
+    ``primary`` reads feed caches that later turns write from, so they run
+    inside ``repo.primary_reads()`` and never see replica lag.
+    """
+
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Mapping[str, Any] = MappingProxyType({})
+    primary: bool = False
+
+
+# An engine operation: yields the repository calls it needs, is sent each
+# result back and returns its own result (see ``EngineCore``).
+Flow = Generator[Call, Any, _T]
+
+
+def call(method: str, *args: Any, **kwargs: Any) -> Call:
+    return Call(method, args, kwargs)
+
+
+def primary_read(method: str, *args: Any, **kwargs: Any) -> Call:
+    return Call(method, args, kwargs, primary=True)
+
+
+def run_flow(repo: GameRepository, flow: Flow[_T]) -> _T:
+    """Make every call ``flow`` yields on ``repo`` and return its result.
+
+    A call that raises is thrown back into the flow, so the operation's own
+    cleanup runs before the error propagates.
+    """
+    send: Callable[[Any], Call] = flow.send
+    value: Any = None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as done:
+            return cast(_T, done.value)
+        method = getattr(repo, step.method)
+        try:
+            if step.primary:
+                with repo.primary_reads():
+                    value = method(*step.args, **step.kwargs)
+            else:
+                value = method(*step.args, **step.kwargs)
+            send = flow.send
+        except BaseException as exc:
+            value, send = exc, flow.throw
+
+
+class EngineCore:
+    """Turn rules, turn history and per-game caches of both engines.
+
+    Every operation is written once, as a generator that yields a ``Call``
+    for each repository method it needs and is sent the result back, so the
+    rules never touch storage themselves. ``GameEngine`` makes those calls
+    on a blocking repository and ``AsyncGameEngine`` awaits them on an async
+    one; both therefore play, record and cache a game identically.
+    """
+
+    def __init__(
+        self,
+        game_id: int,
+        rules: Optional[HouseRules] = None,
+        rng: Optional[random.Random] = None,
+        record_history: bool = True,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1.")
         self.game_id = game_id
+        self.rules = rules or HouseRules()
+        # Dice and Chance draws come from this stream rather than the global
+        # ``random`` module so simulations can run seeded and in parallel.
+        self.rng = rng or random.Random()
+        self._board: Optional[Tuple[Optional[BoardSpace], ...]] = None
+        # Every state change is logged as a TurnEvent and a full snapshot is
+        # saved every ``snapshot_interval`` turns; see monopoly.domain.history.
+        self.record_history = record_history
+        self.snapshot_interval = snapshot_interval
+        self._turn: Optional[int] = None
+        self._pending_events: List[TurnEvent] = []
+        self._status: Optional[BoardStatus] = None
+        self._ring: Optional[TurnRing] = None
+
+    def invalidate_board(self) -> None:
+        self._board = None
+
+    def invalidate_turn_ring(self) -> None:
+        self._ring = None
+
+    def invalidate_status(self) -> None:
+        self._status = None
+
+    def _operation(self, flow: Flow[_T]) -> Flow[_T]:
+        """Wrap ``flow`` as one engine operation.
+
+        Turn events recorded during the operation are written at its end, in
+        the same unit of work, and the cached ``board_status`` is dropped. A
+        failed operation also drops the turn ring and the history turn, which
+        are reloaded from the repository on next use.
+        """
+        try:
+            result = yield from flow
+            if self._pending_events:
+                events, self._pending_events = self._pending_events, []
+                yield call("append_events", self.game_id, events)
+            return result
+        except BaseException:
+            self._pending_events = []
+            self._ring = None
+            self._turn = None
+            raise
+        finally:
+            self._status = None
+
+    def _load_board(self) -> Flow[Tuple[Optional[BoardSpace], ...]]:
+        if self._board is None:
+            spaces = yield primary_read("list_spaces", self.game_id)
+            if not spaces:
+                return ()
+            by_order = {space.sequence_order: space for space in spaces}
+            self._board = tuple(by_order.get(idx) for idx in range(len(spaces)))
+        return self._board
+
+    def _load_ring(self) -> Flow[TurnRing]:
+        if self._ring is None:
+            game = yield primary_read("get_game", self.game_id)
+            players = yield primary_read("list_players", self.game_id, active_only=True)
+            self._ring = TurnRing(
+                players, game.current_turn_player_id if game else None
+            )
+        return self._ring
+
+    def _load_status(self) -> Flow[Optional[BoardStatus]]:
+        if self._status is None:
+            self._status = yield call("board_status", self.game_id)
+        return self._status
+
+    def _history_turn(self) -> Flow[int]:
+        """Current turn number, starting the history on first use.
+
+        A game with no events yet gets a turn-0 snapshot of its current state
+        before anything is recorded, which is what replay starts from.
+        """
+        if self._turn is None:
+            self._turn = yield primary_read("last_event_turn", self.game_id)
+            if self._turn is None:
+                self._turn = 0
+                if self.record_history:
+                    yield from self._save_snapshot()
+        return self._turn
+
+    def _save_snapshot(self) -> Flow[None]:
+        turn = yield from self._history_turn()
+        state = state_from_rows(
+            self.game_id,
+            turn,
+            (yield call("get_game", self.game_id)),
+            (yield call("list_players", self.game_id)),
+            (yield call("list_property_states", self.game_id)),
+        )
+        yield call("save_snapshot", self.game_id, state.turn, state.to_dict())
+
+    def _record(self, kind: EventKind, player_id: Optional[int], **fields: Any) -> None:
+        """Queue an event for the current turn (``_history_turn`` has run)."""
+        if self.record_history:
+            self._pending_events.append(
+                TurnEvent(
+                    game_id=self.game_id,
+                    turn=cast(int, self._turn),
+                    kind=kind,
+                    player_id=player_id,
+                    **fields,
+                )
+            )
 
-    @classmethod
-    def new_game_with_defaults(
-        cls, repo: Repository, player_names: List[str], starting_money: int
-    ) -> "GameEngine":
-        game = repo.create_game(status="active")
+    @staticmethod
+    def _create_game(player_names: Sequence[str], starting_money: int) -> Flow[int]:
+        game = yield call("create_game", status="active")
         for idx, name in enumerate(player_names):
-            repo.add_player(game.id, name, starting_money, idx)
-        engine = cls(repo, game.id)
-        engine.load_default_board()
-        active_players = repo.list_players(game.id, active_only=True)
-        if active_players:
-            repo.set_current_turn(game.id, active_players[0].id)
-        return engine
+            yield call("add_player", game.id, name, starting_money, idx)
+        return game.id
 
-    def load_default_board(self) -> None:
-        for idx, space in enumerate(DEFAULT_BOARD):
-            self.repo.add_space(
-                self.game_id,
-                idx,
-                space["name"],
-                space["type"],
-                space.get("description"),
-                space.get("purchase_cost"),
-                space.get("base_rent"),
-                space.get("event_amount", 0),
-                space.get("move_target"),
-            )
+    def _start_game(self, layout: Sequence[Mapping[str, Any]]) -> Flow[None]:
+        yield from self._load_layout(layout)
+        active_players = yield call("list_players", self.game_id, active_only=True)
+        if active_players:
+            yield call("set_current_turn", self.game_id, active_players[0].id)
+            self._ring = TurnRing(active_players, active_players[0].id)
+
+    def _load_layout(self, layout: Sequence[Mapping[str, Any]]) -> Flow[None]:
+        yield call(
+            "add_spaces",
+            self.game_id,
+            [
+                SpaceDraft(sequence_order=idx, **space)
+                for idx, space in enumerate(layout)
+            ],
+        )
+        self.invalidate_board()
 
-    def ensure_game_ready(self) -> None:
-        if self.repo.count_spaces(self.game_id) == 0:
+    def _ensure_game_ready(self) -> Flow[None]:
+        if not (yield from self._load_board()):
             raise RuntimeError("Game is not set up. Add spaces before playing.")
-        if not self.repo.list_players(self.game_id, active_only=True):
+        if not (yield from self._load_ring()):
             raise RuntimeError("No players found. Add players before playing.")
 
-    def roll_and_resolve(self, player: Player) -> TurnResult:
-        self.ensure_game_ready()
-        board_size = self.repo.count_spaces(self.game_id)
-        die1, die2 = random.randint(1, 6), random.randint(1, 6)
+    def _roll_and_resolve(self, player: Player) -> Flow[TurnResult]:
+        yield from self._ensure_game_ready()
+        self._turn = (yield from self._history_turn()) + 1
+        board = yield from self._load_board()
+        die1, die2 = self.rng.randint(1, 6), self.rng.randint(1, 6)
         total = die1 + die2
 
-        new_position = (player.position + total) % board_size
+        new_position = (player.position + total) % len(board)
         passed_go = new_position < player.position
-        self.repo.update_player_position(player.id, new_position)
+        yield call("update_player_position", player.id, new_position)
+        self._record(
+            EventKind.ROLL,
+            player.id,
+            dice=[die1, die2],
+            position=new_position,
+            amount=self.rules.pass_go_bonus if passed_go else 0,
+        )
 
         messages: list[str] = [
             f"Rolled {die1} + {die2} = {total}. Moved to space {new_position}."
@@ -166,12 +442,16 @@ class GameEngine:
         eliminated: list[str] = []
 
         if passed_go:
-            self.repo.adjust_money(
-                self.game_id, player.id, PASS_GO_BONUS, "Passed GO bonus"
+            yield call(
+                "adjust_money",
+                self.game_id,
+                player.id,
+                self.rules.pass_go_bonus,
+                "Passed GO bonus",
             )
-            messages.append(f"Collected ${PASS_GO_BONUS} for passing GO.")
+            messages.append(f"Collected ${self.rules.pass_go_bonus} for passing GO.")
 
-        space = self.repo.get_space_by_order(self.game_id, new_position)
+        space = board[new_position]
         if not space:
             raise RuntimeError("Space not found on board.")
 
@@ -180,17 +460,22 @@ class GameEngine:
         rent_paid = 0
 
         if space.type == SpaceType.PROPERTY:
-            needs_buy, landed_on_own, rent_paid, eliminated = self._resolve_property(
+            (
+                needs_buy,
+                landed_on_own,
+                rent_paid,
+                eliminated,
+            ) = yield from self._resolve_property(player, space)
+        else:
+            event_messages, eliminated = yield from self._resolve_event_space(
                 player, space
             )
-        else:
-            event_messages, eliminated = self._resolve_event_space(player, space)
             messages.extend(event_messages)
 
-        winner = self._detect_winner()
+        winner = yield from self._detect_winner()
 
         return TurnResult(
-            player=self.repo.get_player(player.id) or player,
+            player=(yield call("get_player", player.id)) or player,
             space=space,
             dice_rolls=(die1, die2),
             messages=messages,
@@ -203,165 +488,343 @@ class GameEngine:
 
     def _resolve_property(
         self, player: Player, space: BoardSpace
-    ) -> tuple[bool, bool, int, List[str]]:
-        state = self.repo.get_property_state(self.game_id, space.id)
+    ) -> Flow[tuple[bool, bool, int, List[str]]]:
+        state = yield call("get_property_state", self.game_id, space.id)
         if not state:
             raise RuntimeError("Property state missing.")
 
-        eliminated: list[str] = []
-
         if state.owner_id is None:
-            return True, False, 0, eliminated
+            return True, False, 0, []
 
         if state.owner_id == player.id:
-            return False, True, 0, eliminated
-
-        rent = (space.base_rent or 0) + state.improvement_count * IMPROVEMENT_RENT_BONUS
-        self.repo.transfer_money(
-            self.game_id, player.id, state.owner_id, rent, f"Rent for {space.name}"
+            return False, True, 0, []
+
+        rent = self.rules.rent(space, state.improvement_count)
+        yield call(
+            "transfer_money",
+            self.game_id,
+            player.id,
+            state.owner_id,
+            rent,
+            f"Rent for {space.name}",
+        )
+        self._record(
+            EventKind.RENT,
+            player.id,
+            space_id=space.id,
+            counterparty_id=state.owner_id,
+            amount=-rent,
         )
 
-        eliminated.extend(self._handle_bankruptcy_if_needed(player.id))
+        eliminated = yield from self._handle_bankruptcy_if_needed(player.id)
         return False, False, rent, eliminated
 
     def _resolve_event_space(
         self, player: Player, space: BoardSpace
-    ) -> tuple[List[str], List[str]]:
-        messages: list[str] = []
+    ) -> Flow[tuple[List[str], List[str]]]:
         eliminated: list[str] = []
-        payout = space.event_amount
+        payout = self.rules.event_payout(space)
 
-        if space.type == SpaceType.GO:
-            payout = payout or PASS_GO_BONUS
-            messages.append(f"Landed on GO and collected ${payout}.")
-        elif space.type == SpaceType.BONUS:
-            payout = payout or 150
-            messages.append(f"Bonus space! Received ${payout}.")
-        elif space.type == SpaceType.TAX:
-            payout = payout or -150
-            messages.append(f"Tax time. Paid ${abs(payout)}.")
-        elif space.type == SpaceType.PENALTY:
-            payout = payout or -100
-            messages.append(f"Penalty applied: ${payout}.")
-        elif space.type == SpaceType.JAIL:
+        if space.type == SpaceType.JAIL:
             target = (
                 space.move_target if space.move_target is not None else player.position
             )
-            self.repo.update_player_position(player.id, target)
-            payout = payout or -50
-            messages.append("Sent to jail. Paying fine and moving to jail space.")
+            yield call("update_player_position", player.id, target)
+            self._record(EventKind.MOVE, player.id, space_id=space.id, position=target)
         elif space.type == SpaceType.CHANCE:
-            payout = random.choice([-100, -50, 50, 100, 200])
-            messages.append(
-                f"Chance card effect: {'gain' if payout > 0 else 'lose'} ${abs(payout)}."
-            )
-        elif space.type == SpaceType.FREE:
-            payout = payout or 0
-            messages.append("Nothing happens here.")
+            payout = self.rng.choice(CHANCE_OUTCOMES)
+        messages = [describe_event(space, payout)]
 
         if payout != 0:
-            self.repo.adjust_money(
-                self.game_id, player.id, payout, f"Event {space.name}"
+            yield call(
+                "adjust_money", self.game_id, player.id, payout, f"Event {space.name}"
             )
-            eliminated.extend(self._handle_bankruptcy_if_needed(player.id))
+            self._record(EventKind.CASH, player.id, space_id=space.id, amount=payout)
+            eliminated.extend((yield from self._handle_bankruptcy_if_needed(player.id)))
 
         return messages, eliminated
 
-    def buy_property(self, player: Player, space: BoardSpace) -> bool:
-        state = self.repo.get_property_state(self.game_id, space.id)
+    def _buy_property(self, player: Player, space: BoardSpace) -> Flow[bool]:
+        yield from self._history_turn()
+        state = yield call("get_property_state", self.game_id, space.id)
         if not state or state.owner_id is not None:
             return False
         if player.money < (space.purchase_cost or 0):
             return False
-        self.repo.adjust_money(
-            self.game_id, player.id, -(space.purchase_cost or 0), f"Bought {space.name}"
+        yield call(
+            "adjust_money",
+            self.game_id,
+            player.id,
+            -(space.purchase_cost or 0),
+            f"Bought {space.name}",
+            holdings_delta=self.rules.sale_value(space, state.improvement_count),
         )
-        self.repo.set_property_owner(
-            self.game_id, space.id, player.id, state.improvement_count
+        yield call(
+            "set_property_owner",
+            self.game_id,
+            space.id,
+            player.id,
+            state.improvement_count,
+        )
+        self._record(
+            EventKind.BUY,
+            player.id,
+            space_id=space.id,
+            amount=-(space.purchase_cost or 0),
         )
         return True
 
-    def improve_property(self, player: Player, space: BoardSpace) -> bool:
-        state = self.repo.get_property_state(self.game_id, space.id)
+    def _improve_property(self, player: Player, space: BoardSpace) -> Flow[bool]:
+        yield from self._history_turn()
+        state = yield call("get_property_state", self.game_id, space.id)
         if not state or state.owner_id != player.id:
             return False
-        if player.money < IMPROVEMENT_COST:
+        if player.money < self.rules.improvement_cost:
             return False
-        self.repo.adjust_money(
-            self.game_id, player.id, -IMPROVEMENT_COST, f"Improved {space.name}"
+        yield call(
+            "adjust_money",
+            self.game_id,
+            player.id,
+            -self.rules.improvement_cost,
+            f"Improved {space.name}",
+            holdings_delta=self.rules.improvement_sale_value,
+        )
+        yield call("increment_improvement", self.game_id, space.id)
+        self._record(
+            EventKind.IMPROVE,
+            player.id,
+            space_id=space.id,
+            amount=-self.rules.improvement_cost,
         )
-        self.repo.increment_improvement(self.game_id, space.id)
         return True
 
-    def sell_property(self, player: Player, space: BoardSpace) -> int:
-        state = self.repo.get_property_state(self.game_id, space.id)
+    def _sell_property(self, player: Player, space: BoardSpace) -> Flow[int]:
+        yield from self._history_turn()
+        state = yield call("get_property_state", self.game_id, space.id)
         if not state or state.owner_id != player.id:
             return 0
-        sale_value = int((space.purchase_cost or 0) * SELLBACK_RATIO)
-        sale_value += state.improvement_count * int(IMPROVEMENT_COST * SELLBACK_RATIO)
-        self.repo.set_property_owner(self.game_id, space.id, None, 0)
-        self.repo.adjust_money(
-            self.game_id, player.id, sale_value, f"Sold {space.name} to bank"
+        sale_value = self.rules.sale_value(space, state.improvement_count)
+        yield call("set_property_owner", self.game_id, space.id, None, 0)
+        yield call(
+            "adjust_money",
+            self.game_id,
+            player.id,
+            sale_value,
+            f"Sold {space.name} to bank",
+            holdings_delta=-sale_value,
         )
+        self._record(EventKind.SELL, player.id, space_id=space.id, amount=sale_value)
         return sale_value
 
-    def sell_all_properties(self, player_id: int) -> None:
-        owned = self.repo.properties_by_owner(self.game_id, player_id)
-        for space, state in owned:
-            sale_value = int((space.purchase_cost or 0) * SELLBACK_RATIO)
-            sale_value += state.improvement_count * int(
-                IMPROVEMENT_COST * SELLBACK_RATIO
+    def _sell_all_properties(self, player_id: int) -> Flow[int]:
+        yield from self._history_turn()
+        sales = yield call(
+            "liquidate_properties",
+            self.game_id,
+            player_id,
+            self.rules.sellback_ratio,
+            self.rules.improvement_sale_value,
+        )
+        for space_id, sale_value in sales:
+            self._record(
+                EventKind.SELL, player_id, space_id=space_id, amount=sale_value
             )
-            self.repo.set_property_owner(self.game_id, space.id, None, 0)
-            self.repo.adjust_money(
-                self.game_id, player_id, sale_value, f"Forced sale of {space.name}"
+        return sum(sale_value for _, sale_value in sales)
+
+    def _handle_bankruptcy_if_needed(self, player_id: int) -> Flow[List[str]]:
+        player = yield call("get_player", player_id)
+        if not player or player.money > 0:
+            return []
+        if player.money + (yield from self._sell_all_properties(player_id)) > 0:
+            return []
+        yield call("eliminate_player", self.game_id, player_id)
+        (yield from self._load_ring()).remove(player_id)
+        self._record(EventKind.ELIMINATE, player_id)
+        return [player.name]
+
+    def _detect_winner(self) -> Flow[Optional[str]]:
+        ring = yield from self._load_ring()
+        winner_id = ring.sole_survivor()
+        if winner_id is None:
+            return None
+        yield call("update_game_status", self.game_id, "completed")
+        self._record(EventKind.WIN, winner_id)
+        return ring.names[winner_id]
+
+    def _current_player(self) -> Flow[Optional[Player]]:
+        current_id = (yield from self._load_ring()).current_id
+        return (yield call("get_player", current_id)) if current_id else None
+
+    def _set_current_player(self, player_id: int) -> Flow[None]:
+        yield call("set_current_turn", self.game_id, player_id)
+        (yield from self._load_ring()).current_id = player_id
+
+    def _ensure_turn_pointer(self) -> Flow[Player]:
+        player = yield from self._current_player()
+        if player:
+            return player
+        players = yield call("list_players", self.game_id, active_only=True)
+        if not players:
+            raise RuntimeError("No active players available.")
+        yield from self._set_current_player(players[0].id)
+        return players[0]
+
+    def _next_turn(self) -> Flow[Optional[Player]]:
+        turn = yield from self._history_turn()
+        next_id = (yield from self._load_ring()).advance()
+        if next_id is None:
+            return None
+        yield call("set_current_turn", self.game_id, next_id)
+        self._record(EventKind.TURN, next_id)
+        if self.record_history and turn and turn % self.snapshot_interval == 0:
+            yield from self._save_snapshot()
+        yield call("end_turn", self.game_id)
+        return (yield call("get_player", next_id))
+
+
+class GameEngine(EngineCore):
+    """Plays one game on a blocking ``GameRepository``.
+
+    Each operation below runs in one repository unit of work, so a turn that
+    triggers a forced sale or bankruptcy still commits exactly once.
+    """
+
+    def __init__(
+        self,
+        repo: GameRepository,
+        game_id: int,
+        rules: Optional[HouseRules] = None,
+        rng: Optional[random.Random] = None,
+        record_history: bool = True,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    ) -> None:
+        self.repo = repo
+        super().__init__(game_id, rules, rng, record_history, snapshot_interval)
+
+    def _run(self, name: str, flow: Flow[_T]) -> _T:
+        """Run ``flow`` as the engine operation ``name`` in one unit of work."""
+        token = current_operation.set(name) if current_operation.get() is None else None
+        try:
+            with self.repo.unit_of_work():
+                return run_flow(self.repo, self._operation(flow))
+        finally:
+            if token is not None:
+                current_operation.reset(token)
+
+    @property
+    def board(self) -> Tuple[Optional[BoardSpace], ...]:
+        """Spaces indexed by ``sequence_order``, loaded once per engine.
+
+        A board is fixed once play starts, so turns read board size and spaces
+        from this cache instead of the repository. Call ``invalidate_board``
+        after adding spaces during setup. An empty board is never cached.
+        """
+        return run_flow(self.repo, self._load_board())
+
+    @property
+    def board_size(self) -> int:
+        return len(self.board)
+
+    def space_at(self, position: int) -> Optional[BoardSpace]:
+        board = self.board
+        return board[position] if 0 <= position < len(board) else None
+
+    @property
+    def turn_ring(self) -> TurnRing:
+        """Active players in turn order plus the turn pointer, loaded once.
+
+        Rotation, elimination and winner checks update the ring in place, so
+        a turn costs the same with 4 players as with 1,000. Call
+        ``invalidate_turn_ring`` after changing players through the
+        repository directly. Like every cache turns write from, it is loaded
+        with ``primary_reads`` so replica lag cannot leak into the game.
+        """
+        return run_flow(self.repo, self._load_ring())
+
+    def board_status(self) -> Optional[BoardStatus]:
+        """Players and every square with its owner, read in one query.
+
+        The result is cached until the engine next changes the game, so
+        redrawing the board between moves costs no round trips. Call
+        ``invalidate_status`` after writing to the repository directly.
+        """
+        return run_flow(self.repo, self._load_status())
+
+    @property
+    def turn(self) -> int:
+        """Number of rolls recorded for this game."""
+        return run_flow(self.repo, self._history_turn())
+
+    @classmethod
+    def new_game_with_defaults(
+        cls,
+        repo: GameRepository,
+        player_names: List[str],
+        starting_money: int,
+        rules: Optional[HouseRules] = None,
+        rng: Optional[random.Random] = None,
+        record_history: bool = True,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        board: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> "GameEngine":
+        with repo.unit_of_work():
+            game_id = run_flow(repo, cls._create_game(player_names, starting_money))
+            engine = cls(repo, game_id, rules, rng, record_history, snapshot_interval)
+            engine._run(
+                "new_game_with_defaults",
+                engine._start_game(DEFAULT_BOARD if board is None else board),
             )
+        return engine
 
-    def _handle_bankruptcy_if_needed(self, player_id: int) -> List[str]:
-        eliminated: list[str] = []
-        player = self.repo.get_player(player_id)
-        if not player:
-            return eliminated
-        if player.money > 0:
-            return eliminated
-        self.sell_all_properties(player_id)
-        player_after_sale = self.repo.get_player(player_id)
-        if player_after_sale and player_after_sale.money <= 0:
-            self.repo.update_player_active(player_id, False)
-            eliminated.append(player_after_sale.name)
-            self.repo.release_properties_to_bank(self.game_id, player_id)
-            self.repo.reset_turn_orders(self.game_id)
-        return eliminated
-
-    def _detect_winner(self) -> Optional[str]:
-        active_players = self.repo.list_players(self.game_id, active_only=True)
-        if len(active_players) == 1:
-            winner = active_players[0]
-            self.repo.update_game_status(self.game_id, "completed")
-            return winner.name
-        return None
+    def load_default_board(self) -> None:
+        self.load_board(DEFAULT_BOARD)
+
+    def load_board(self, layout: Sequence[Mapping[str, Any]]) -> None:
+        """Add ``layout`` (``DEFAULT_BOARD``-style dicts) in list order."""
+        self._run("load_board", self._load_layout(layout))
+
+    def ensure_game_ready(self) -> None:
+        run_flow(self.repo, self._ensure_game_ready())
+
+    def roll_and_resolve(self, player: Player) -> TurnResult:
+        return self._run("roll_and_resolve", self._roll_and_resolve(player))
+
+    def buy_property(self, player: Player, space: BoardSpace) -> bool:
+        return self._run("buy_property", self._buy_property(player, space))
+
+    def improve_property(self, player: Player, space: BoardSpace) -> bool:
+        return self._run("improve_property", self._improve_property(player, space))
+
+    def sell_property(self, player: Player, space: BoardSpace) -> int:
+        return self._run("sell_property", self._sell_property(player, space))
+
+    def sell_all_properties(self, player_id: int) -> int:
+        """Sell every property the player owns to the bank; returns the total.
+
+        The repository prices and releases all properties, writes the ledger
+        and credits the player in a fixed number of statements.
+        """
+        return self._run("sell_all_properties", self._sell_all_properties(player_id))
+
+    def standings(self) -> List[Standing]:
+        """Players by net worth (cash plus holdings at the sellback ratio).
+
+        Buying, improving and selling adjust each player's holdings in the
+        same statement as their cash, forced sales and bankruptcy clear them,
+        so this is one indexed read rather than pricing every property.
+        """
+        return self.repo.standings(self.game_id)
 
     def get_current_player(self) -> Optional[Player]:
-        game = self.repo.get_game(self.game_id)
-        if not game or not game.current_turn_player_id:
-            return None
-        return self.repo.get_player(game.current_turn_player_id)
+        return run_flow(self.repo, self._current_player())
+
+    def set_current_player(self, player_id: int) -> None:
+        """Point the turn at ``player_id`` without advancing the rotation."""
+        self._run("set_current_player", self._set_current_player(player_id))
+
+    def ensure_turn_pointer(self) -> Player:
+        """Current player, pointing the turn at the first active one if unset."""
+        return self._run("ensure_turn_pointer", self._ensure_turn_pointer())
 
     def next_turn(self) -> Optional[Player]:
-        active = self.repo.list_players(self.game_id, active_only=True)
-        if not active:
-            return None
-        active_sorted = sorted(active, key=lambda p: p.turn_order)
-        game = self.repo.get_game(self.game_id)
-        current_id = game.current_turn_player_id if game else None
-        current_index = next(
-            (
-                idx
-                for idx, player in enumerate(active_sorted)
-                if player.id == current_id
-            ),
-            -1,
-        )
-        next_player = active_sorted[(current_index + 1) % len(active_sorted)]
-        self.repo.set_current_turn(self.game_id, next_player.id)
-        return next_player
+        return self._run("next_turn", self._next_turn())
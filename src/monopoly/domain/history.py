@@ -0,0 +1,171 @@
+"""Rebuild any turn of a game from its nearest snapshot and the event log."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+from monopoly.models import EventKind, GameSession, Player, PropertyState, TurnEvent
+
+if TYPE_CHECKING:
+    from monopoly.db.base import GameRepository
+
+# Turns between full-state snapshots; replay reads at most this many turns of
+# events on top of a snapshot.
+DEFAULT_SNAPSHOT_INTERVAL = 100
+
+
+@dataclass
+class PlayerState:
+    id: int
+    name: str
+    money: int
+    position: int
+    is_active: bool
+    turn_order: int
+
+
+@dataclass
+class PropertyHolding:
+    owner_id: Optional[int] = None
+    improvement_count: int = 0
+
+
+@dataclass
+class GameState:
+    """Everything that changes during play, as of the end of ``turn``."""
+
+    game_id: int
+    turn: int
+    status: str
+    current_player_id: Optional[int]
+    players: Dict[int, PlayerState] = field(default_factory=dict)
+    properties: Dict[int, PropertyHolding] = field(default_factory=dict)
+
+    def apply(self, event: TurnEvent) -> None:
+        """Advance the state by one recorded engine event."""
+        self.turn = max(self.turn, event.turn)
+        player = self.players.get(event.player_id) if event.player_id else None
+        kind = event.kind
+        if player is not None:
+            player.money += event.amount
+            if event.position is not None:
+                player.position = event.position
+        if kind == EventKind.RENT and event.counterparty_id in self.players:
+            self.players[event.counterparty_id].money -= event.amount
+        elif kind == EventKind.BUY:
+            self._holding(event).owner_id = event.player_id
+        elif kind == EventKind.IMPROVE:
+            self._holding(event).improvement_count += 1
+        elif kind == EventKind.SELL:
+            self.properties[event.space_id] = PropertyHolding()
+        elif kind == EventKind.ELIMINATE and player is not None:
+            player.is_active = False
+            for space_id, holding in self.properties.items():
+                if holding.owner_id == player.id:
+                    self.properties[space_id] = PropertyHolding()
+            active = sorted(
+                (p for p in self.players.values() if p.is_active),
+                key=lambda p: p.turn_order,
+            )
+            for idx, remaining in enumerate(active):
+                remaining.turn_order = idx
+        elif kind == EventKind.TURN:
+            self.current_player_id = event.player_id
+        elif kind == EventKind.WIN:
+            self.status = "completed"
+
+    def _holding(self, event: TurnEvent) -> PropertyHolding:
+        return self.properties.setdefault(event.space_id, PropertyHolding())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "game_id": self.game_id,
+            "turn": self.turn,
+            "status": self.status,
+            "current_player_id": self.current_player_id,
+            "players": [asdict(p) for p in self.players.values()],
+            "properties": {
+                str(space_id): [h.owner_id, h.improvement_count]
+                for space_id, h in self.properties.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameState":
+        return cls(
+            game_id=data["game_id"],
+            turn=data["turn"],
+            status=data["status"],
+            current_player_id=data["current_player_id"],
+            players={p["id"]: PlayerState(**p) for p in data["players"]},
+            properties={
+                int(space_id): PropertyHolding(owner, improvements)
+                for space_id, (owner, improvements) in data["properties"].items()
+            },
+        )
+
+
+def state_from_rows(
+    game_id: int,
+    turn: int,
+    game: Optional[GameSession],
+    players: Iterable[Player],
+    property_states: Iterable[PropertyState],
+) -> GameState:
+    """Build a ``GameState`` from the rows ``capture_state`` reads."""
+    if game is None:
+        raise ValueError(f"Game {game_id} not found.")
+    return GameState(
+        game_id=game_id,
+        turn=turn,
+        status=game.status,
+        current_player_id=game.current_turn_player_id,
+        players={
+            p.id: PlayerState(
+                p.id, p.name, p.money, p.position, p.is_active, p.turn_order
+            )
+            for p in players
+        },
+        properties={
+            s.space_id: PropertyHolding(s.owner_id, s.improvement_count)
+            for s in property_states
+        },
+    )
+
+
+def capture_state(repo: GameRepository, game_id: int, turn: int) -> GameState:
+    """Read the live state of a game from the repository."""
+    return state_from_rows(
+        game_id,
+        turn,
+        repo.get_game(game_id),
+        repo.list_players(game_id),
+        repo.list_property_states(game_id),
+    )
+
+
+def replay(state: GameState, events: Iterable[TurnEvent]) -> GameState:
+    for event in events:
+        state.apply(event)
+    return state
+
+
+def rebuild_state(
+    repo: GameRepository, game_id: int, turn: Optional[int] = None
+) -> GameState:
+    """State at the end of ``turn`` (default: the latest recorded turn).
+
+    Loads the newest snapshot at or before ``turn`` and replays only the
+    events recorded after it, so the cost depends on the snapshot interval,
+    not on the length of the game.
+    """
+    snapshot = repo.latest_snapshot(game_id, upto_turn=turn)
+    if snapshot is None:
+        raise ValueError(f"Game {game_id} has no recorded history.")
+    state = GameState.from_dict(snapshot.state)
+    events = repo.list_events(game_id, after_turn=snapshot.turn, upto_turn=turn)
+    replay(state, events)
+    if turn is not None:
+        state.turn = turn
+    return state
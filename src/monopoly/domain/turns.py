@@ -0,0 +1,59 @@
+"""Turn order kept in memory so rotation does not re-read every player."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+from monopoly.models import Player
+
+
+class TurnRing:
+    """Active players as a circular linked list in turn order.
+
+    Advancing the turn, removing an eliminated player and checking for a sole
+    survivor are all O(1). When the current player has just been removed,
+    the turn passes to the first player in turn order, the same rule the
+    engine has always used and ``sim.vectorized`` mirrors.
+    """
+
+    def __init__(
+        self, players: Iterable[Player], current_id: Optional[int] = None
+    ) -> None:
+        ordered = sorted(players, key=lambda p: (p.turn_order, p.id))
+        ids = [p.id for p in ordered]
+        self._next: Dict[int, int] = dict(zip(ids, ids[1:] + ids[:1]))
+        self._prev: Dict[int, int] = {nxt: pid for pid, nxt in self._next.items()}
+        self.names: Dict[int, str] = {p.id: p.name for p in ordered}
+        self.head: Optional[int] = ids[0] if ids else None
+        self.current_id = current_id
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._next
+
+    def advance(self) -> Optional[int]:
+        """Move the turn to the next active player and return their id."""
+        current = self.current_id
+        if current is not None and current in self._next:
+            self.current_id = self._next[current]
+        else:
+            self.current_id = self.head
+        return self.current_id
+
+    def remove(self, player_id: int) -> None:
+        if player_id not in self._next:
+            return
+        nxt = self._next.pop(player_id)
+        prev = self._prev.pop(player_id)
+        if nxt == player_id:
+            self.head = None
+            return
+        self._next[prev] = nxt
+        self._prev[nxt] = prev
+        if self.head == player_id:
+            self.head = nxt
+
+    def sole_survivor(self) -> Optional[int]:
+        return self.head if len(self._next) == 1 else None
@@ -1,14 +1,27 @@
 """Convenience exports for models."""
 
-from .game import GameSession
+from .board_status import BoardStatus, SquareStatus
+from .game import GameSession, GameStats
+from .history import EventKind, GameSnapshot, TurnEvent
 from .player import Player
 from .property_state import PropertyState
-from .space import BoardSpace, SpaceType
+from .space import BoardSpace, SpaceDraft, SpaceType
+from .standing import Standing
+from .transaction import Transaction
 
 __all__ = [
     "BoardSpace",
+    "BoardStatus",
+    "EventKind",
     "GameSession",
+    "GameSnapshot",
+    "GameStats",
     "Player",
     "PropertyState",
+    "SpaceDraft",
     "SpaceType",
+    "SquareStatus",
+    "Standing",
+    "Transaction",
+    "TurnEvent",
 ]
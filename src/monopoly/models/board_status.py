@@ -0,0 +1,75 @@
+"""Read model for rendering a whole game: players plus every square."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from .game import GameSession
+from .player import Player
+from .space import BoardSpace
+from .standing import Standing
+
+
+class SquareStatus(BaseModel):
+    space: BoardSpace
+    owner_id: Optional[int] = None
+    owner_name: Optional[str] = None
+    improvement_count: int = 0
+
+
+class BoardStatus(BaseModel):
+    """Everything a status screen shows, as read in one repository call.
+
+    ``holdings`` maps each player id to the holdings kept on the player row,
+    so the standings come out of the same read.
+    """
+
+    game: GameSession
+    players: List[Player]
+    squares: List[SquareStatus]
+    holdings: Dict[int, int] = {}
+
+    @property
+    def current_player(self) -> Optional[Player]:
+        current_id = self.game.current_turn_player_id
+        return next((p for p in self.players if p.id == current_id), None)
+
+    def standings(self) -> List[Standing]:
+        """The players ranked like ``GameRepository.standings``."""
+        ranked = sorted(
+            self.players, key=lambda p: (-(p.money + self.holdings.get(p.id, 0)), p.id)
+        )
+        return [
+            Standing(
+                rank=rank,
+                game_id=player.game_id,
+                player_id=player.id,
+                name=player.name,
+                money=player.money,
+                holdings=self.holdings.get(player.id, 0),
+                net_worth=player.money + self.holdings.get(player.id, 0),
+                is_active=player.is_active,
+            )
+            for rank, player in enumerate(ranked, start=1)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Game, players and owned squares as JSON-ready data."""
+        return {
+            "game_id": self.game.id,
+            "status": self.game.status,
+            "current_player_id": self.game.current_turn_player_id,
+            "players": [p.model_dump() for p in self.players],
+            "owned": [
+                {
+                    "space": square.space.name,
+                    "position": square.space.sequence_order,
+                    "owner": square.owner_name,
+                    "improvements": square.improvement_count,
+                }
+                for square in self.squares
+                if square.owner_id is not None
+            ],
+        }
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from pydantic import BaseModel
 
@@ -13,3 +13,32 @@ class GameSession(BaseModel):
     status: str
     current_turn_player_id: Optional[int] = None
     created_at: datetime
+
+
+class GameStats(BaseModel):
+    """Totals across every stored game, for admin screens."""
+
+    games_by_status: Dict[str, int] = {}
+    players: int = 0
+    active_players: int = 0
+    money_in_play: int = 0
+    transactions: int = 0
+
+    @property
+    def games(self) -> int:
+        return sum(self.games_by_status.values())
+
+    @classmethod
+    def combine(cls, parts: Iterable["GameStats"]) -> "GameStats":
+        """Sum the stats of separate databases (e.g. shards)."""
+        total = cls()
+        for part in parts:
+            for status, count in part.games_by_status.items():
+                total.games_by_status[status] = (
+                    total.games_by_status.get(status, 0) + count
+                )
+            total.players += part.players
+            total.active_players += part.active_players
+            total.money_in_play += part.money_in_play
+            total.transactions += part.transactions
+        return total
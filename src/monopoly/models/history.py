@@ -0,0 +1,49 @@
+"""Pydantic models for the per-turn event log and state snapshots."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class EventKind(str, Enum):
+    ROLL = "roll"
+    MOVE = "move"
+    CASH = "cash"
+    RENT = "rent"
+    BUY = "buy"
+    IMPROVE = "improve"
+    SELL = "sell"
+    ELIMINATE = "eliminate"
+    TURN = "turn"
+    WIN = "win"
+
+
+class TurnEvent(BaseModel):
+    """One state change made by the engine during turn ``turn``.
+
+    ``amount`` is the money change for ``player_id`` (rent is also credited
+    to ``counterparty_id``), ``position`` the square a roll or jail move ends
+    on, and ``dice`` the two dice of a roll.
+    """
+
+    id: Optional[int] = None
+    game_id: int
+    turn: int
+    kind: EventKind
+    player_id: Optional[int] = None
+    space_id: Optional[int] = None
+    counterparty_id: Optional[int] = None
+    amount: int = 0
+    position: Optional[int] = None
+    dice: Optional[List[int]] = None
+
+
+class GameSnapshot(BaseModel):
+    game_id: int
+    turn: int
+    state: Dict[str, Any]
+    created_at: Optional[datetime] = None
@@ -30,3 +30,16 @@ class BoardSpace(BaseModel):
     base_rent: Optional[int] = None
     event_amount: int = 0
     move_target: Optional[int] = None
+
+
+class SpaceDraft(BaseModel):
+    """A space that has not been saved yet, e.g. staged in the board builder."""
+
+    sequence_order: int
+    name: str
+    type: SpaceType
+    description: Optional[str] = None
+    purchase_cost: Optional[int] = None
+    base_rent: Optional[int] = None
+    event_amount: int = 0
+    move_target: Optional[int] = None
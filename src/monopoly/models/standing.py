@@ -0,0 +1,22 @@
+"""Read model for ranking players by net worth."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Standing(BaseModel):
+    """A player's place by net worth: cash plus holdings.
+
+    ``holdings`` is what the player's properties and improvements would fetch
+    from the bank at the game's sellback ratio, kept up to date by the engine.
+    """
+
+    rank: int
+    game_id: int
+    player_id: int
+    name: str
+    money: int
+    holdings: int
+    net_worth: int
+    is_active: bool
@@ -0,0 +1,17 @@
+"""Pydantic models for the money transaction log."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Transaction(BaseModel):
+    id: int
+    game_id: int
+    player_id: Optional[int] = None
+    amount: int
+    description: Optional[str] = None
+    created_at: datetime
@@ -0,0 +1,6 @@
+"""asyncio line-protocol server hosting many games in one process."""
+
+from .app import GameServer, serve
+from .metrics import GameMetrics
+
+__all__ = ["GameMetrics", "GameServer", "serve"]
@@ -0,0 +1,326 @@
+"""Line-protocol TCP server running ``AsyncGameEngine`` games.
+
+Each request is one line, a command followed by space-separated arguments;
+each response is one line, ``ok <json>`` or ``err <message>``::
+
+    new <starting_money> <name> <name> [...]   create a game and join it
+    join <game_id> [<player_name>]             join a game, optionally as one seat
+    roll                                       current player rolls and moves
+    buy | improve | sell                       act on the space just landed on
+    end                                        finish the turn
+    status                                     players, owners and turn pointer
+    stats [all]                                latency/throughput counters
+    quit                                       close the connection
+
+A connection joined without a player name may act for every seat (hot-seat
+play); with a name it may only act on that player's turns. Commands for the
+same game are serialized, different games run concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from monopoly.db.aio import AsyncGameRepository
+from monopoly.domain.async_engine import AsyncGameEngine
+from monopoly.domain.game_engine import DEFAULT_BOARD, HouseRules
+from monopoly.models import BoardSpace, Player, SpaceType
+from monopoly.server.metrics import GameMetrics
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE_BYTES = 4096
+
+logger = logging.getLogger(__name__)
+
+
+class CommandError(Exception):
+    """A request the server rejects; reported to the client as ``err``."""
+
+
+@dataclass
+class Table:
+    """Server-side state for one hosted game."""
+
+    engine: AsyncGameEngine
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    metrics: GameMetrics = field(default_factory=GameMetrics)
+    landed: Optional[BoardSpace] = None
+    rolled: bool = False
+
+
+@dataclass
+class Session:
+    """Per-connection binding to a game and, optionally, a seat."""
+
+    game_id: Optional[int] = None
+    player_id: Optional[int] = None
+
+
+def _player_dict(player: Player) -> Dict[str, Any]:
+    return player.model_dump()
+
+
+class GameServer:
+    """Hosts any number of games over one async repository.
+
+    ``execute`` runs one command line for a session; ``monopoly.cli.script``
+    reuses it, with a few setup commands of its own, for scripted play.
+    """
+
+    # Commands that run without a game bound to the session.
+    unbound_commands: FrozenSet[str] = frozenset({"new", "join", "stats"})
+    no_game_message = "Join or create a game first."
+
+    def __init__(
+        self,
+        repo: AsyncGameRepository,
+        rules: Optional[HouseRules] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.repo = repo
+        self.rules = rules or HouseRules()
+        self.seed = seed
+        self.tables: Dict[int, Table] = {}
+        self.connections = 0
+        # Layout of games created with ``new``.
+        self.board: Sequence[Mapping[str, Any]] = DEFAULT_BOARD
+
+    def _rng(self, game_id: int) -> random.Random:
+        if self.seed is None:
+            return random.Random()
+        return random.Random(f"monopoly-server:{self.seed}:{game_id}")
+
+    async def _table(self, game_id: int) -> Table:
+        table = self.tables.get(game_id)
+        if table is None:
+            if await self.repo.get_game(game_id) is None:
+                raise CommandError(f"Game {game_id} not found.")
+            table = self.tables.setdefault(
+                game_id,
+                Table(
+                    AsyncGameEngine(self.repo, game_id, self.rules, self._rng(game_id))
+                ),
+            )
+        return table
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+    ) -> asyncio.AbstractServer:
+        return await asyncio.start_server(
+            self.handle_client, host, port, limit=MAX_LINE_BYTES
+        )
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        session = Session()
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b"err Line too long.\n")
+                    break
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").strip()
+                if not text:
+                    continue
+                if text.lower() == "quit":
+                    writer.write(b"ok {}\n")
+                    break
+                writer.write((await self.dispatch(session, text) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def dispatch(self, session: Session, text: str) -> str:
+        """Run one command line and format its response line."""
+        started = time.perf_counter()
+        ok, result = await self.execute(session, text)
+        table = None if session.game_id is None else self.tables.get(session.game_id)
+        if table is not None:
+            command = text.split()[0].lower()
+            table.metrics.record(command, time.perf_counter() - started, ok)
+        if ok:
+            return "ok " + json.dumps(result, default=str)
+        return f"err {result}"
+
+    async def execute(self, session: Session, text: str) -> Tuple[bool, Any]:
+        """Run one command line; ``(True, result)`` or ``(False, message)``."""
+        command, *args = text.split()
+        command = command.lower()
+        handler = getattr(self, f"_cmd_{command}", None)
+        try:
+            if handler is None:
+                raise CommandError(f"Unknown command '{command}'.")
+            if command in self.unbound_commands:
+                return True, await handler(session, args)
+            table = await self._bound_table(session)
+            async with table.lock:
+                return True, await handler(session, table, args)
+        except (CommandError, RuntimeError, ValueError) as exc:
+            return False, str(exc)
+        except Exception:
+            # A bug must not drop the connection or leak internals; the
+            # traceback goes to the log and the client gets a fixed reply.
+            logger.exception("Command %r failed", text)
+            return False, "internal error"
+
+    async def _bound_table(self, session: Session) -> Table:
+        if session.game_id is None:
+            raise CommandError(self.no_game_message)
+        return await self._table(session.game_id)
+
+    async def _acting_player(self, session: Session, table: Table) -> Player:
+        player = await table.engine.get_current_player()
+        if player is None:
+            raise CommandError("Game has no current player.")
+        if session.player_id is not None and session.player_id != player.id:
+            raise CommandError(f"It is {player.name}'s turn.")
+        return player
+
+    async def _cmd_new(self, session: Session, args: List[str]) -> Dict[str, Any]:
+        if len(args) < 3 or not args[0].isdigit():
+            raise CommandError("Usage: new <starting_money> <name> <name> [...]")
+        names = args[1:]
+        if len({name.lower() for name in names}) != len(names):
+            raise CommandError("Player names must be unique.")
+        engine = await AsyncGameEngine.new_game_with_defaults(
+            self.repo, names, int(args[0]), self.rules, board=self.board
+        )
+        engine.rng = self._rng(engine.game_id)
+        self.tables[engine.game_id] = Table(engine)
+        session.game_id, session.player_id = engine.game_id, None
+        players = await self.repo.list_players(engine.game_id)
+        return {
+            "game_id": engine.game_id,
+            "players": [_player_dict(p) for p in players],
+        }
+
+    async def _cmd_join(self, session: Session, args: List[str]) -> Dict[str, Any]:
+        if not args or not args[0].isdigit():
+            raise CommandError("Usage: join <game_id> [<player_name>]")
+        table = await self._table(int(args[0]))
+        player_id = None
+        if len(args) > 1:
+            name = " ".join(args[1:]).lower()
+            players = await self.repo.list_players(table.engine.game_id)
+            match = next((p for p in players if p.name.lower() == name), None)
+            if match is None:
+                raise CommandError(f"No player named '{' '.join(args[1:])}'.")
+            player_id = match.id
+        session.game_id, session.player_id = table.engine.game_id, player_id
+        return {"game_id": session.game_id, "player_id": player_id}
+
+    async def _cmd_roll(
+        self, session: Session, table: Table, args: List[str]
+    ) -> Dict[str, Any]:
+        game = await self.repo.get_game(table.engine.game_id)
+        if game and game.status == "completed":
+            raise CommandError("Game is over.")
+        if table.rolled:
+            raise CommandError("Already rolled this turn; send 'end'.")
+        player = await self._acting_player(session, table)
+        result = await table.engine.roll_and_resolve(player)
+        table.rolled = True
+        table.landed = result.space if result.space.type == SpaceType.PROPERTY else None
+        table.metrics.turns += 1
+        return result.to_dict()
+
+    async def _landed_property(
+        self, session: Session, table: Table
+    ) -> tuple[Player, BoardSpace]:
+        player = await self._acting_player(session, table)
+        if not table.rolled or table.landed is None:
+            raise CommandError("Not on a property this turn.")
+        return player, table.landed
+
+    async def _cmd_buy(
+        self, session: Session, table: Table, args: List[str]
+    ) -> Dict[str, Any]:
+        player, space = await self._landed_property(session, table)
+        if not await table.engine.buy_property(player, space):
+            raise CommandError("Unable to purchase (insufficient funds or owned).")
+        buyer = await self.repo.get_player(player.id)
+        return {"bought": space.name, "money": buyer.money if buyer else None}
+
+    async def _cmd_improve(
+        self, session: Session, table: Table, args: List[str]
+    ) -> Dict[str, Any]:
+        player, space = await self._landed_property(session, table)
+        if not await table.engine.improve_property(player, space):
+            raise CommandError("Unable to improve (not owner or insufficient funds).")
+        state = await self.repo.get_property_state(table.engine.game_id, space.id)
+        return {
+            "improved": space.name,
+            "improvements": state.improvement_count if state else 0,
+        }
+
+    async def _cmd_sell(
+        self, session: Session, table: Table, args: List[str]
+    ) -> Dict[str, Any]:
+        player, space = await self._landed_property(session, table)
+        sale_value = await table.engine.sell_property(player, space)
+        if sale_value == 0:
+            raise CommandError("Unable to sell (not owner).")
+        return {"sold": space.name, "sale_value": sale_value}
+
+    async def _cmd_end(
+        self, session: Session, table: Table, args: List[str]
+    ) -> Dict[str, Any]:
+        await self._acting_player(session, table)
+        if not table.rolled:
+            raise CommandError("Roll before ending the turn.")
+        next_player = await table.engine.next_turn()
+        table.rolled, table.landed = False, None
+        return {"next_player": _player_dict(next_player) if next_player else None}
+
+    async def _cmd_status(
+        self, session: Session, table: Table, args: List[str]
+    ) -> Dict[str, Any]:
+        status = await table.engine.board_status()
+        if status is None:
+            raise CommandError(f"Game {table.engine.game_id} not found.")
+        payload = status.to_dict()
+        payload["rolled"] = table.rolled
+        return payload
+
+    async def _cmd_stats(self, session: Session, args: List[str]) -> Dict[str, Any]:
+        if args and args[0].lower() == "all":
+            return {
+                "connections": self.connections,
+                "games": {
+                    str(game_id): table.metrics.to_dict()
+                    for game_id, table in self.tables.items()
+                },
+            }
+        table = await self._bound_table(session)
+        return table.metrics.to_dict()
+
+
+async def serve(
+    repo: AsyncGameRepository,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    rules: Optional[HouseRules] = None,
+    seed: Optional[int] = None,
+) -> None:
+    """Run a ``GameServer`` until cancelled."""
+    game_server = GameServer(repo, rules, seed)
+    server = await game_server.start(host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving Monopoly on {addresses}")
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,70 @@
+"""Per-game latency and throughput counters for the game server."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+
+# Recent latencies kept per game for percentile estimates.
+LATENCY_WINDOW = 1024
+
+
+def _percentile(samples: Deque[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+@dataclass
+class GameMetrics:
+    """Command counts, latency and throughput for one game."""
+
+    commands: int = 0
+    errors: int = 0
+    turns: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    first_at: Optional[float] = None
+    last_at: Optional[float] = None
+    by_command: Dict[str, int] = field(default_factory=dict)
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def record(
+        self, command: str, seconds: float, ok: bool, now: Optional[float] = None
+    ) -> None:
+        now = time.monotonic() if now is None else now
+        self.commands += 1
+        self.errors += 0 if ok else 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+        self.by_command[command] = self.by_command.get(command, 0) + 1
+        if self.first_at is None:
+            self.first_at = now
+        self.last_at = now
+
+    def commands_per_second(self) -> float:
+        if self.first_at is None or self.last_at is None:
+            return 0.0
+        window = self.last_at - self.first_at
+        return self.commands / window if window > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        mean = self.total_seconds / self.commands if self.commands else 0.0
+        return {
+            "commands": self.commands,
+            "errors": self.errors,
+            "turns": self.turns,
+            "by_command": dict(self.by_command),
+            "latency_ms": {
+                "mean": round(mean * 1000, 3),
+                "p50": round(_percentile(self.recent, 0.50) * 1000, 3),
+                "p99": round(_percentile(self.recent, 0.99) * 1000, 3),
+                "max": round(self.max_seconds * 1000, 3),
+            },
+            "commands_per_second": round(self.commands_per_second(), 2),
+        }
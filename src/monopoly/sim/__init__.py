@@ -0,0 +1,16 @@
+"""Headless simulation and analysis tools."""
+
+from .parallel import run_parallel
+from .policies import BotPolicy, PropertyAction, make_policy
+from .simulator import SimulationConfig, SimulationStats, play_game, simulate
+
+__all__ = [
+    "BotPolicy",
+    "PropertyAction",
+    "SimulationConfig",
+    "SimulationStats",
+    "make_policy",
+    "play_game",
+    "run_parallel",
+    "simulate",
+]
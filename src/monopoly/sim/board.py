@@ -0,0 +1,70 @@
+"""Helpers for treating board layouts uniformly in the simulation tools."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+from monopoly.domain.game_engine import DEFAULT_BOARD
+from monopoly.models import BoardSpace, SpaceType
+
+BoardLayout = Sequence[Union[BoardSpace, Mapping[str, Any]]]
+
+
+def normalize_board(board: BoardLayout | None = None) -> List[BoardSpace]:
+    """Return ``board`` as ``BoardSpace`` objects ordered by position.
+
+    Accepts spaces loaded from a repository (e.g. a board built with
+    ``manual_board_setup``) or a ``DEFAULT_BOARD``-style list of dicts, which
+    is used when ``board`` is omitted.
+    """
+    layout = DEFAULT_BOARD if board is None else board
+    spaces: list[BoardSpace] = []
+    for idx, space in enumerate(layout):
+        if isinstance(space, BoardSpace):
+            spaces.append(space)
+            continue
+        spaces.append(
+            BoardSpace(
+                id=idx,
+                game_id=0,
+                sequence_order=space.get("sequence_order", idx),
+                name=space["name"],
+                type=SpaceType(space["type"]),
+                description=space.get("description"),
+                purchase_cost=space.get("purchase_cost"),
+                base_rent=space.get("base_rent"),
+                event_amount=space.get("event_amount", 0),
+                move_target=space.get("move_target"),
+            )
+        )
+    spaces.sort(key=lambda s: s.sequence_order)
+    if not spaces:
+        raise ValueError("Board has no spaces.")
+    if [s.sequence_order for s in spaces] != list(range(len(spaces))):
+        raise ValueError("Board positions must run 0..n-1 without gaps.")
+    return spaces
+
+
+def tiled_board(size: int) -> List[Dict[str, Any]]:
+    """A ``DEFAULT_BOARD``-style layout of ``size`` spaces for benchmarks.
+
+    Repeats ``DEFAULT_BOARD`` with numbered names. Only the first copy keeps
+    GO; later copies rest on a free space there, and each jail sends players
+    to the jail of its own copy, so every space keeps its usual neighbours.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1.")
+    period = len(DEFAULT_BOARD)
+    spaces: List[Dict[str, Any]] = []
+    for idx in range(size):
+        block, offset = divmod(idx, period)
+        space = dict(DEFAULT_BOARD[offset])
+        if block:
+            space["name"] = f"{space['name']} {block + 1}"
+            if space["type"] == SpaceType.GO:
+                space.update(type=SpaceType.FREE, event_amount=0)
+        if space.get("move_target") is not None:
+            target = block * period + space["move_target"]
+            space["move_target"] = target if target < size else 0
+        spaces.append(space)
+    return spaces
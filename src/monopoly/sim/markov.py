@@ -0,0 +1,232 @@
+"""Closed-form landing probabilities and property ROI for a board.
+
+Requires the optional ``numpy`` dependency (``pip install monopoly[sim]``).
+
+A player's position at the end of a turn is a Markov chain: roll 2d6, move,
+and if the landing space is ``JAIL`` jump to its ``move_target`` (or back to
+where the roll started when it has none, as ``GameEngine`` does). The
+stationary distribution of that chain gives the long-run probability that a
+roll lands on each space, from which expected rent and break-even times for
+every property follow without simulating a single game.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from monopoly.domain.game_engine import HouseRules
+from monopoly.models import BoardSpace, SpaceType
+from monopoly.sim.board import BoardLayout, normalize_board
+
+# P(total = t) for t = 2..12 with two fair six-sided dice.
+DICE_TOTALS = np.arange(2, 13)
+DICE_PROBABILITIES = (6 - np.abs(DICE_TOTALS - 7)) / 36.0
+MAX_ROLL = int(DICE_TOTALS.max())
+
+# Boards up to this size are solved with a dense transition matrix; larger
+# boards use the banded solver, which is linear in the number of spaces.
+DENSE_LIMIT = 400
+
+
+@dataclass(frozen=True)
+class PropertyReport:
+    sequence_order: int
+    name: str
+    purchase_cost: int
+    rent: int
+    landing_probability: float
+    expected_rent_per_roll: float
+    expected_rent_per_round: float
+    break_even_rounds: Optional[float]
+
+
+@dataclass
+class BoardAnalysis:
+    stationary: np.ndarray
+    landing: np.ndarray
+    properties: List[PropertyReport]
+
+
+def _jail_targets(spaces: List[BoardSpace]) -> np.ndarray:
+    """Per-space jump target: -2 for normal spaces, -1 for "back to start"."""
+    size = len(spaces)
+    targets = np.full(size, -2, dtype=np.int64)
+    for space in spaces:
+        if space.type != SpaceType.JAIL:
+            continue
+        target = space.move_target
+        if target is not None and not 0 <= target < size:
+            raise ValueError(
+                f"Jail space {space.sequence_order} targets {target}, "
+                f"outside a {size}-space board."
+            )
+        targets[space.sequence_order] = -1 if target is None else target
+    return targets
+
+
+def transition_matrix(board: BoardLayout | None = None) -> np.ndarray:
+    """Dense end-of-turn transition matrix, rows summing to 1."""
+    spaces = normalize_board(board)
+    size = len(spaces)
+    targets = _jail_targets(spaces)
+    matrix = np.zeros((size, size))
+    starts = np.arange(size)
+    for total, prob in zip(DICE_TOTALS, DICE_PROBABILITIES):
+        landed = (starts + total) % size
+        jump = targets[landed]
+        end = np.where(jump == -2, landed, np.where(jump == -1, starts, jump))
+        np.add.at(matrix, (starts, end), prob)
+    return matrix
+
+
+def _stationary_dense(matrix: np.ndarray) -> np.ndarray:
+    size = matrix.shape[0]
+    system = np.vstack([matrix.T - np.eye(size), np.ones((1, size))])
+    rhs = np.zeros(size + 1)
+    rhs[-1] = 1.0
+    return np.linalg.lstsq(system, rhs, rcond=None)[0]
+
+
+def _stationary_banded(targets: np.ndarray) -> np.ndarray:
+    """Solve the chain in O(n) using its ring structure.
+
+    Away from jail spaces the balance equations are a linear recurrence,
+    ``pi[j] = sum_t p_t * pi[j - t]``, which is stable to run forward. Each
+    ``pi[j]`` is expressed as a combination of a few unknowns - the first
+    ``MAX_ROLL`` positions and the total inflow into each jail target - and
+    the wrap-around and inflow equations then form a small dense system.
+    """
+    size = len(targets)
+    is_jail = targets != -2
+    # Probability that a roll from j lands on a target-less jail and so
+    # returns the player to j.
+    stay = np.zeros(size)
+    for total, prob in zip(DICE_TOTALS, DICE_PROBABILITIES):
+        stay += prob * (targets[(np.arange(size) + total) % size] == -1)
+    if np.any(stay >= 1.0):
+        raise ValueError("Board has a position no roll can leave.")
+    jump_targets = sorted({int(t) for t in targets if t >= 0})
+    inflow_index = {target: MAX_ROLL + i for i, target in enumerate(jump_targets)}
+    unknowns = MAX_ROLL + len(jump_targets)
+
+    # weights[k] multiplies pi[j - MAX_ROLL + k], i.e. offsets 12..1.
+    weights = np.zeros(MAX_ROLL)
+    weights[MAX_ROLL - DICE_TOTALS] = DICE_PROBABILITIES
+
+    basis = np.zeros((size, unknowns))
+    basis[:MAX_ROLL, :MAX_ROLL] = np.eye(MAX_ROLL)
+    for j in range(MAX_ROLL, size):
+        row = np.zeros(unknowns) if is_jail[j] else weights @ basis[j - MAX_ROLL : j]
+        if j in inflow_index:
+            row[inflow_index[j]] += 1.0
+        basis[j] = row / (1.0 - stay[j])
+
+    def landing_row(j: int) -> np.ndarray:
+        return DICE_PROBABILITIES @ basis[(j - DICE_TOTALS) % size]
+
+    equations = []
+    for j in range(MAX_ROLL):
+        row = np.zeros(unknowns) if is_jail[j] else landing_row(j)
+        if j in inflow_index:
+            row[inflow_index[j]] += 1.0
+        equations.append(basis[j] * (1.0 - stay[j]) - row)
+    for target in jump_targets:
+        row = np.zeros(unknowns)
+        row[inflow_index[target]] = 1.0
+        for j in np.flatnonzero(targets == target):
+            row -= landing_row(int(j))
+        equations.append(row)
+    equations.append(basis.sum(axis=0))
+    rhs = np.zeros(len(equations))
+    rhs[-1] = 1.0
+    solution = np.linalg.lstsq(np.array(equations), rhs, rcond=None)[0]
+    return basis @ solution
+
+
+def stationary_distribution(board: BoardLayout | None = None) -> np.ndarray:
+    """Long-run probability of ending a turn on each space."""
+    spaces = normalize_board(board)
+    if len(spaces) <= max(DENSE_LIMIT, MAX_ROLL):
+        pi = _stationary_dense(transition_matrix(spaces))
+    else:
+        pi = _stationary_banded(_jail_targets(spaces))
+    pi = np.clip(pi, 0.0, None)
+    return pi / pi.sum()
+
+
+def landing_distribution(stationary: np.ndarray) -> np.ndarray:
+    """Probability that a single roll lands on each space (before any jump)."""
+    landing = np.zeros_like(stationary)
+    for total, prob in zip(DICE_TOTALS, DICE_PROBABILITIES):
+        landing += prob * np.roll(stationary, int(total))
+    return landing
+
+
+def analyze_board(
+    board: BoardLayout | None = None,
+    players: int = 4,
+    improvements: int = 0,
+    rules: Optional[HouseRules] = None,
+) -> BoardAnalysis:
+    """Expected rent and break-even time for every property on ``board``.
+
+    ``expected_rent_per_round`` assumes the other ``players - 1`` players each
+    roll once per round; ``break_even_rounds`` is the purchase price plus
+    ``improvements`` upgrades divided by that rate.
+    """
+    if players < 2:
+        raise ValueError("ROI needs at least two players.")
+    rules = rules or HouseRules()
+    spaces = normalize_board(board)
+    stationary = stationary_distribution(spaces)
+    landing = landing_distribution(stationary)
+    reports: list[PropertyReport] = []
+    for space in spaces:
+        if space.type != SpaceType.PROPERTY:
+            continue
+        rent = rules.rent(space, improvements)
+        probability = float(landing[space.sequence_order])
+        per_roll = probability * rent
+        per_round = per_roll * (players - 1)
+        invested = (space.purchase_cost or 0) + improvements * rules.improvement_cost
+        reports.append(
+            PropertyReport(
+                sequence_order=space.sequence_order,
+                name=space.name,
+                purchase_cost=space.purchase_cost or 0,
+                rent=rent,
+                landing_probability=probability,
+                expected_rent_per_roll=per_roll,
+                expected_rent_per_round=per_round,
+                break_even_rounds=invested / per_round if per_round > 0 else None,
+            )
+        )
+    return BoardAnalysis(stationary=stationary, landing=landing, properties=reports)
+
+
+def format_analysis(analysis: BoardAnalysis) -> str:
+    lines = [
+        f"{'#':>4}  {'Property':<24} {'Cost':>6} {'Rent':>5} "
+        f"{'P(land)':>8} {'Rent/roll':>10} {'Break-even':>11}"
+    ]
+    for report in sorted(
+        analysis.properties,
+        key=lambda r: (
+            r.break_even_rounds if r.break_even_rounds is not None else float("inf")
+        ),
+    ):
+        break_even = (
+            f"{report.break_even_rounds:8.1f} rd"
+            if report.break_even_rounds is not None
+            else "      never"
+        )
+        lines.append(
+            f"{report.sequence_order:>4}  {report.name[:24]:<24} "
+            f"{report.purchase_cost:>6} {report.rent:>5} "
+            f"{report.landing_probability:>8.4f} "
+            f"{report.expected_rent_per_roll:>10.3f} {break_even:>11}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,58 @@
+"""Multi-process Monte Carlo runner for the batch simulator."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Optional, Set
+
+from monopoly.sim.simulator import SimulationConfig, SimulationStats, run_batch
+
+
+def run_parallel(
+    config: SimulationConfig,
+    workers: Optional[int] = None,
+    on_batch: Optional[Callable[[SimulationStats], None]] = None,
+) -> SimulationStats:
+    """Spread the configured games over a process pool.
+
+    Each batch plays on its own random stream derived from ``config.seed`` and
+    the batch index, so a seeded run gives identical aggregates for any worker
+    count. Workers return one ``SimulationStats`` per batch, never per-game
+    records, and the parent folds them in as they complete while keeping at
+    most ``2 * workers`` batches in flight. ``on_batch`` sees each partial
+    result, e.g. for progress reporting.
+    """
+    config.seat_policies()
+    workers = workers or os.cpu_count() or 1
+    batches = iter(config.batches())
+    totals = SimulationStats()
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Set[Future[SimulationStats]] = set()
+
+        def submit_next() -> bool:
+            batch = next(batches, None)
+            if batch is None:
+                return False
+            pending.add(pool.submit(run_batch, config, *batch))
+            return True
+
+        for _ in range(workers * 2):
+            if not submit_next():
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                partial = future.result()
+                totals.merge(partial)
+                if on_batch is not None:
+                    on_batch(partial)
+                submit_next()
+
+    # Batch timings overlap across processes; report wall-clock throughput.
+    totals.elapsed_seconds = time.perf_counter() - started
+    return totals
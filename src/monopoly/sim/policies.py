@@ -0,0 +1,140 @@
+"""Bot policies that stand in for the interactive property prompts."""
+
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+from monopoly.domain.game_engine import GameEngine
+from monopoly.models import BoardSpace, Player, PropertyState
+
+
+class PropertyAction(str, Enum):
+    IMPROVE = "improve"
+    SELL = "sell"
+    SKIP = "skip"
+
+
+class BotPolicy(ABC):
+    """Answers the questions ``handle_property_decision`` asks a human.
+
+    ``should_buy`` replaces the "Do you want to buy ...?" prompt and every
+    policy must decide it. ``own_property_action`` replaces the
+    improve/sell/skip menu shown when a player lands on a property they
+    already own, and skips unless overridden.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def should_buy(
+        self, engine: GameEngine, player: Player, space: BoardSpace
+    ) -> bool: ...
+
+    def own_property_action(
+        self,
+        engine: GameEngine,
+        player: Player,
+        space: BoardSpace,
+        state: PropertyState,
+    ) -> PropertyAction:
+        return PropertyAction.SKIP
+
+
+class AggressivePolicy(BotPolicy):
+    """Buy everything affordable and improve whenever cash allows."""
+
+    name = "aggressive"
+
+    def should_buy(self, engine: GameEngine, player: Player, space: BoardSpace) -> bool:
+        return player.money >= (space.purchase_cost or 0)
+
+    def own_property_action(
+        self,
+        engine: GameEngine,
+        player: Player,
+        space: BoardSpace,
+        state: PropertyState,
+    ) -> PropertyAction:
+        if player.money >= engine.rules.improvement_cost:
+            return PropertyAction.IMPROVE
+        return PropertyAction.SKIP
+
+
+class CautiousPolicy(BotPolicy):
+    """Only spend while keeping a cash reserve; sell when nearly broke."""
+
+    name = "cautious"
+
+    def __init__(self, reserve: int = 500, panic_below: int = 100) -> None:
+        self.reserve = reserve
+        self.panic_below = panic_below
+
+    def should_buy(self, engine: GameEngine, player: Player, space: BoardSpace) -> bool:
+        return player.money - (space.purchase_cost or 0) >= self.reserve
+
+    def own_property_action(
+        self,
+        engine: GameEngine,
+        player: Player,
+        space: BoardSpace,
+        state: PropertyState,
+    ) -> PropertyAction:
+        if player.money < self.panic_below:
+            return PropertyAction.SELL
+        if player.money - engine.rules.improvement_cost >= self.reserve:
+            return PropertyAction.IMPROVE
+        return PropertyAction.SKIP
+
+
+class PassivePolicy(BotPolicy):
+    """Never buys; a baseline for measuring what ownership is worth."""
+
+    name = "passive"
+
+    def should_buy(self, engine: GameEngine, player: Player, space: BoardSpace) -> bool:
+        return False
+
+
+class RandomPolicy(BotPolicy):
+    """Coin-flip decisions, useful as a noisy opponent."""
+
+    name = "random"
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self.rng = rng or random.Random()
+
+    def should_buy(self, engine: GameEngine, player: Player, space: BoardSpace) -> bool:
+        return self.rng.random() < 0.5
+
+    def own_property_action(
+        self,
+        engine: GameEngine,
+        player: Player,
+        space: BoardSpace,
+        state: PropertyState,
+    ) -> PropertyAction:
+        return self.rng.choice(list(PropertyAction))
+
+
+POLICIES: Dict[str, Callable[[], BotPolicy]] = {
+    AggressivePolicy.name: AggressivePolicy,
+    CautiousPolicy.name: CautiousPolicy,
+    PassivePolicy.name: PassivePolicy,
+    RandomPolicy.name: RandomPolicy,
+}
+
+
+def make_policy(name: str) -> BotPolicy:
+    try:
+        return POLICIES[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown policy '{name}'. Choose from: {', '.join(sorted(POLICIES))}."
+        ) from None
+
+
+def policy_names() -> List[str]:
+    return sorted(POLICIES)
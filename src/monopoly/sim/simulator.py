@@ -0,0 +1,273 @@
+"""Headless batch simulation of complete games driven by bot policies."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from monopoly.db.base import GameRepository
+from monopoly.db.memory import InMemoryRepository
+from monopoly.domain.game_engine import GameEngine, HouseRules
+from monopoly.models import BoardSpace, Player, SpaceType
+from monopoly.sim.policies import BotPolicy, PropertyAction, RandomPolicy, make_policy
+
+DEFAULT_MAX_TURNS = 1000
+DEFAULT_BATCH_SIZE = 50
+
+
+@dataclass
+class SimulationConfig:
+    games: int = 100
+    players: int = 4
+    starting_money: int = 1500
+    policies: Sequence[str] = ("aggressive", "cautious")
+    max_turns: int = DEFAULT_MAX_TURNS
+    rules: HouseRules = field(default_factory=HouseRules)
+    seed: Optional[int] = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+
+    def batches(self) -> List[Tuple[int, int]]:
+        """``(batch_index, games)`` pairs covering ``games`` in fixed chunks.
+
+        The split depends only on ``games`` and ``batch_size``, so a seeded run
+        produces the same batches however many processes execute them.
+        """
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        full, rest = divmod(self.games, self.batch_size)
+        sizes = [self.batch_size] * full + ([rest] if rest else [])
+        return list(enumerate(sizes))
+
+    def batch_rng(self, batch_index: int) -> random.Random:
+        """Independent random stream for one batch of games."""
+        if self.seed is None:
+            return random.Random()
+        # String seeds are hashed with SHA-512, giving well-separated streams
+        # that do not depend on PYTHONHASHSEED.
+        return random.Random(f"monopoly-sim:{self.seed}:{batch_index}")
+
+    def seat_policies(self) -> List[str]:
+        """Assign policies to seats round-robin."""
+        if self.players < 2:
+            raise ValueError("A game needs at least two players.")
+        if not self.policies:
+            raise ValueError("At least one policy is required.")
+        return [self.policies[i % len(self.policies)] for i in range(self.players)]
+
+
+@dataclass
+class GameOutcome:
+    turns: int
+    winner_policy: Optional[str]
+    bankruptcies: int
+    seats: List[str]
+
+
+@dataclass
+class SimulationStats:
+    """Aggregate results; ``merge`` combines partial results from batches."""
+
+    games: int = 0
+    finished_games: int = 0
+    total_turns: int = 0
+    min_turns: Optional[int] = None
+    max_turns: Optional[int] = None
+    bankruptcies: int = 0
+    wins: Dict[str, int] = field(default_factory=dict)
+    seats: Dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def record(self, outcome: GameOutcome) -> None:
+        self.games += 1
+        self.total_turns += outcome.turns
+        self.bankruptcies += outcome.bankruptcies
+        if self.min_turns is None or outcome.turns < self.min_turns:
+            self.min_turns = outcome.turns
+        if self.max_turns is None or outcome.turns > self.max_turns:
+            self.max_turns = outcome.turns
+        for policy in outcome.seats:
+            self.seats[policy] = self.seats.get(policy, 0) + 1
+            self.wins.setdefault(policy, 0)
+        if outcome.winner_policy is not None:
+            self.finished_games += 1
+            self.wins[outcome.winner_policy] += 1
+
+    def merge(self, other: "SimulationStats") -> None:
+        self.games += other.games
+        self.finished_games += other.finished_games
+        self.total_turns += other.total_turns
+        self.bankruptcies += other.bankruptcies
+        for bound in ("min_turns", "max_turns"):
+            mine, theirs = getattr(self, bound), getattr(other, bound)
+            if theirs is not None:
+                pick = min if bound == "min_turns" else max
+                setattr(self, bound, theirs if mine is None else pick(mine, theirs))
+        for policy, count in other.seats.items():
+            self.seats[policy] = self.seats.get(policy, 0) + count
+        for policy, count in other.wins.items():
+            self.wins[policy] = self.wins.get(policy, 0) + count
+        self.elapsed_seconds += other.elapsed_seconds
+
+    @property
+    def mean_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+    @property
+    def bankruptcies_per_turn(self) -> float:
+        return self.bankruptcies / self.total_turns if self.total_turns else 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.total_turns / self.elapsed_seconds
+
+    def win_rates(self) -> Dict[str, float]:
+        """Wins per seat played, so policies with more seats are comparable."""
+        return {
+            policy: self.wins.get(policy, 0) / seats if seats else 0.0
+            for policy, seats in sorted(self.seats.items())
+        }
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "games": self.games,
+            "finished_games": self.finished_games,
+            "total_turns": self.total_turns,
+            "mean_turns": round(self.mean_turns, 2),
+            "min_turns": self.min_turns,
+            "max_turns": self.max_turns,
+            "bankruptcies": self.bankruptcies,
+            "bankruptcies_per_turn": round(self.bankruptcies_per_turn, 6),
+            "win_rates": {k: round(v, 4) for k, v in self.win_rates().items()},
+            "wins": dict(sorted(self.wins.items())),
+            "turns_per_second": round(self.turns_per_second, 1),
+        }
+
+
+def _decide(
+    engine: GameEngine,
+    policy: BotPolicy,
+    player: Player,
+    space: BoardSpace,
+    needs_buy: bool,
+) -> None:
+    """Mirror ``handle_property_decision`` with the policy answering prompts."""
+    if needs_buy:
+        if policy.should_buy(engine, player, space):
+            engine.buy_property(player, space)
+        return
+    state = engine.repo.get_property_state(engine.game_id, space.id)
+    if not state or state.owner_id != player.id:
+        return
+    action = policy.own_property_action(engine, player, space, state)
+    if action == PropertyAction.IMPROVE:
+        engine.improve_property(player, space)
+    elif action == PropertyAction.SELL:
+        engine.sell_property(player, space)
+
+
+def build_policies(
+    seats: Sequence[str], rng: Optional[random.Random] = None
+) -> Dict[str, BotPolicy]:
+    policies = {name: make_policy(name) for name in sorted(set(seats))}
+    for policy in policies.values():
+        if isinstance(policy, RandomPolicy) and rng is not None:
+            policy.rng = rng
+    return policies
+
+
+def play_game(
+    repo: GameRepository,
+    config: SimulationConfig,
+    policies: Optional[Dict[str, BotPolicy]] = None,
+    rng: Optional[random.Random] = None,
+) -> GameOutcome:
+    """Play one game to completion (or ``max_turns``) without prompts."""
+    seats = config.seat_policies()
+    policies = policies or build_policies(seats, rng)
+    names = [f"{policy}-{seat}" for seat, policy in enumerate(seats)]
+    # Bot games are thrown away at the end, so skip the turn history.
+    engine = GameEngine.new_game_with_defaults(
+        repo, names, config.starting_money, config.rules, rng, record_history=False
+    )
+    policy_by_name = dict(zip(names, seats))
+
+    current = engine.get_current_player()
+    turns = 0
+    bankruptcies = 0
+    winner_policy: Optional[str] = None
+    while current is not None and turns < config.max_turns:
+        result = engine.roll_and_resolve(current)
+        turns += 1
+        bankruptcies += len(result.eliminated_players)
+        if result.space.type == SpaceType.PROPERTY and result.player.is_active:
+            if result.needs_buy_decision or result.landed_on_own_property:
+                _decide(
+                    engine,
+                    policies[policy_by_name[result.player.name]],
+                    result.player,
+                    result.space,
+                    result.needs_buy_decision,
+                )
+        if result.winner:
+            winner_policy = policy_by_name[result.winner]
+            break
+        current = engine.next_turn()
+
+    repo.delete_game(engine.game_id)
+    return GameOutcome(
+        turns=turns,
+        winner_policy=winner_policy,
+        bankruptcies=bankruptcies,
+        seats=seats,
+    )
+
+
+def run_batch(
+    config: SimulationConfig,
+    batch_index: int,
+    games: int,
+    repo: Optional[GameRepository] = None,
+) -> SimulationStats:
+    """Play one batch of games on its own random stream."""
+    repo = repo or InMemoryRepository()
+    rng = config.batch_rng(batch_index)
+    policies = build_policies(config.seat_policies(), rng)
+    stats = SimulationStats()
+    started = time.perf_counter()
+    for _ in range(games):
+        stats.record(play_game(repo, config, policies, rng))
+    stats.elapsed_seconds = time.perf_counter() - started
+    return stats
+
+
+def simulate(
+    config: SimulationConfig, repo: Optional[GameRepository] = None
+) -> SimulationStats:
+    """Run ``config.games`` games in-process and return aggregate statistics."""
+    config.seat_policies()
+    repo = repo or InMemoryRepository()
+    stats = SimulationStats()
+    for batch_index, games in config.batches():
+        stats.merge(run_batch(config, batch_index, games, repo))
+    return stats
+
+
+def format_stats(stats: SimulationStats) -> str:
+    lines = [
+        f"Games played:       {stats.games} ({stats.finished_games} finished)",
+        f"Game length:        mean {stats.mean_turns:.1f} turns "
+        f"(min {stats.min_turns}, max {stats.max_turns})",
+        f"Bankruptcies/turn:  {stats.bankruptcies_per_turn:.5f}",
+        f"Throughput:         {stats.turns_per_second:,.0f} turns/sec",
+        "Win rate per seat:",
+    ]
+    for policy, rate in stats.win_rates().items():
+        lines.append(
+            f"  {policy:<12} {rate:6.1%} ({stats.wins.get(policy, 0)} wins "
+            f"in {stats.seats[policy]} seats)"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,312 @@
+"""Lockstep NumPy simulator that advances thousands of games per array op.
+
+Requires the optional ``numpy`` dependency (``pip install monopoly[sim]``).
+
+Every game takes exactly one turn per step. Per-game state lives in arrays
+shaped ``(games, players)`` (position, money, active) and ``(games, spaces)``
+(owner, improvement count), and each rule from ``GameEngine`` is applied to
+all games at once with masked array operations. The rules are derived from
+the same ``HouseRules`` and board the object engine uses, including its
+turn-order behaviour after an elimination, so results are directly
+comparable with ``monopoly.sim.simulator``.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from monopoly.domain.game_engine import CHANCE_OUTCOMES, HouseRules
+from monopoly.models import SpaceType
+from monopoly.sim.board import BoardLayout, normalize_board
+from monopoly.sim.policies import (
+    AggressivePolicy,
+    BotPolicy,
+    CautiousPolicy,
+    PassivePolicy,
+    make_policy,
+)
+from monopoly.sim.simulator import SimulationConfig, SimulationStats
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+_NEVER = np.iinfo(np.int64).max // 4
+_TYPE_CODES = {space_type: code for code, space_type in enumerate(SpaceType)}
+_PROPERTY = _TYPE_CODES[SpaceType.PROPERTY]
+_JAIL = _TYPE_CODES[SpaceType.JAIL]
+_CHANCE = _TYPE_CODES[SpaceType.CHANCE]
+
+
+@dataclass(frozen=True)
+class VectorPolicy:
+    """Threshold form of a ``BotPolicy`` that can be evaluated on arrays."""
+
+    buy_reserve: int
+    improve_reserve: int
+    sell_below: int
+
+    @classmethod
+    def from_policy(cls, policy: BotPolicy) -> "VectorPolicy":
+        if isinstance(policy, AggressivePolicy):
+            return cls(buy_reserve=0, improve_reserve=0, sell_below=-_NEVER)
+        if isinstance(policy, CautiousPolicy):
+            return cls(
+                buy_reserve=policy.reserve,
+                improve_reserve=policy.reserve,
+                sell_below=policy.panic_below,
+            )
+        if isinstance(policy, PassivePolicy):
+            return cls(buy_reserve=_NEVER, improve_reserve=_NEVER, sell_below=-_NEVER)
+        raise ValueError(
+            f"Policy '{policy.name}' has no vectorized form; "
+            "use aggressive, cautious or passive."
+        )
+
+
+class BoardArrays:
+    """Per-space rule values for one board, precomputed for a rule set."""
+
+    def __init__(self, board: BoardLayout | None, rules: HouseRules) -> None:
+        spaces = normalize_board(board)
+        self.size = len(spaces)
+        self.type = np.array([_TYPE_CODES[s.type] for s in spaces], dtype=np.int8)
+        self.purchase_cost = np.array(
+            [s.purchase_cost or 0 for s in spaces], dtype=np.int64
+        )
+        self.base_rent = np.array([s.base_rent or 0 for s in spaces], dtype=np.int64)
+        self.payout = np.array(
+            [
+                0 if s.type == SpaceType.PROPERTY else rules.event_payout(s)
+                for s in spaces
+            ],
+            dtype=np.int64,
+        )
+        # -1 sends the player back to where the roll started, matching the
+        # engine's fallback when a jail space has no move_target.
+        self.jail_target = np.array(
+            [s.move_target if s.move_target is not None else -1 for s in spaces],
+            dtype=np.int64,
+        )
+        self.sale_base = np.array(
+            [rules.sale_value(s, 0) for s in spaces], dtype=np.int64
+        )
+        self.is_property = self.type == _PROPERTY
+
+
+class LockstepGames:
+    """State for a block of games advanced one turn per ``step``."""
+
+    def __init__(
+        self,
+        games: int,
+        seats: List[str],
+        policies: Dict[str, VectorPolicy],
+        board: BoardArrays,
+        rules: HouseRules,
+        starting_money: int,
+        rng: np.random.Generator,
+    ) -> None:
+        players = len(seats)
+        self.board = board
+        self.rules = rules
+        self.rng = rng
+        self.improvement_sale = int(rules.improvement_cost * rules.sellback_ratio)
+        self.buy_reserve = np.array(
+            [policies[p].buy_reserve for p in seats], dtype=np.int64
+        )
+        self.improve_reserve = np.array(
+            [policies[p].improve_reserve for p in seats], dtype=np.int64
+        )
+        self.sell_below = np.array(
+            [policies[p].sell_below for p in seats], dtype=np.int64
+        )
+
+        self.position = np.zeros((games, players), dtype=np.int64)
+        self.money = np.full((games, players), starting_money, dtype=np.int64)
+        self.active = np.ones((games, players), dtype=bool)
+        self.owner = np.full((games, board.size), -1, dtype=np.int64)
+        self.improvements = np.zeros((games, board.size), dtype=np.int64)
+        self.current = np.zeros(games, dtype=np.int64)
+        self.turns = np.zeros(games, dtype=np.int64)
+        self.bankruptcies = np.zeros(games, dtype=np.int64)
+
+    @property
+    def live(self) -> int:
+        return len(self.current)
+
+    def step(self) -> None:
+        board, rules = self.board, self.rules
+        rows = np.arange(self.live)
+        cur = self.current
+
+        dice = self.rng.integers(1, 7, size=(self.live, 2))
+        start = self.position[rows, cur]
+        landed = (start + dice.sum(axis=1)) % board.size
+        self.money[rows, cur] += np.where(landed < start, rules.pass_go_bonus, 0)
+        self.position[rows, cur] = landed
+
+        is_property = board.is_property[landed]
+        owner = self.owner[rows, landed]
+        cash = self.money[rows, cur]
+        cost = board.purchase_cost[landed]
+
+        buy = (
+            is_property
+            & (owner == -1)
+            & (cash >= cost)
+            & (cash - cost >= self.buy_reserve[cur])
+        )
+        self.owner[rows[buy], landed[buy]] = cur[buy]
+        self.money[rows[buy], cur[buy]] -= cost[buy]
+
+        mine = is_property & (owner == cur)
+        improvements = self.improvements[rows, landed]
+        sell = mine & (cash < self.sell_below[cur])
+        sale = board.sale_base[landed] + improvements * self.improvement_sale
+        self.owner[rows[sell], landed[sell]] = -1
+        self.improvements[rows[sell], landed[sell]] = 0
+        self.money[rows[sell], cur[sell]] += sale[sell]
+        improve = (
+            mine
+            & ~sell
+            & (cash >= rules.improvement_cost)
+            & (cash - rules.improvement_cost >= self.improve_reserve[cur])
+        )
+        self.improvements[rows[improve], landed[improve]] += 1
+        self.money[rows[improve], cur[improve]] -= rules.improvement_cost
+
+        rented = is_property & (owner >= 0) & (owner != cur)
+        rent = board.base_rent[landed] + improvements * rules.improvement_rent_bonus
+        self.money[rows[rented], cur[rented]] -= rent[rented]
+        self.money[rows[rented], owner[rented]] += rent[rented]
+
+        payout = np.where(is_property, 0, board.payout[landed])
+        chance = board.type[landed] == _CHANCE
+        payout[chance] = self.rng.choice(
+            np.array(CHANCE_OUTCOMES, dtype=np.int64), size=int(chance.sum())
+        )
+        jail = board.type[landed] == _JAIL
+        target = np.where(
+            board.jail_target[landed] < 0, start, board.jail_target[landed]
+        )
+        self.position[rows[jail], cur[jail]] = target[jail]
+        paid = payout != 0
+        self.money[rows[paid], cur[paid]] += payout[paid]
+
+        self._resolve_bankruptcy(rows, rented | paid)
+        self.turns += 1
+
+    def _resolve_bankruptcy(self, rows: np.ndarray, checked: np.ndarray) -> None:
+        cur = self.current
+        broke = checked & (self.money[rows, cur] <= 0)
+        if not broke.any():
+            return
+        b_rows, b_cur = rows[broke], cur[broke]
+        owned = self.owner[b_rows] == b_cur[:, None]
+        values = (
+            self.board.sale_base + self.improvements[b_rows] * self.improvement_sale
+        )
+        self.money[b_rows, b_cur] += np.where(owned, values, 0).sum(axis=1)
+        self.owner[b_rows] = np.where(owned, -1, self.owner[b_rows])
+        self.improvements[b_rows] = np.where(owned, 0, self.improvements[b_rows])
+        out = self.money[b_rows, b_cur] <= 0
+        self.active[b_rows[out], b_cur[out]] = False
+        self.bankruptcies[b_rows[out]] += 1
+
+    def advance_turn(self) -> None:
+        players = self.active.shape[1]
+        rows = np.arange(self.live)
+        offsets = (self.current[:, None] + 1 + np.arange(players)) % players
+        following = offsets[
+            rows, np.argmax(self.active[rows[:, None], offsets], axis=1)
+        ]
+        # GameEngine's TurnRing falls back to the first active seat when the
+        # current player was just eliminated.
+        first_active = np.argmax(self.active, axis=1)
+        still_in = self.active[rows, self.current]
+        self.current = np.where(still_in, following, first_active)
+
+    def finished(self, max_turns: int) -> np.ndarray:
+        return (self.active.sum(axis=1) <= 1) | (self.turns >= max_turns)
+
+    def drop(self, keep: np.ndarray) -> None:
+        for name in (
+            "position",
+            "money",
+            "active",
+            "owner",
+            "improvements",
+            "current",
+            "turns",
+            "bankruptcies",
+        ):
+            setattr(self, name, getattr(self, name)[keep])
+
+
+def _record_finished(
+    stats: SimulationStats, games: LockstepGames, done: np.ndarray, seats: List[str]
+) -> None:
+    turns = games.turns[done]
+    count = int(done.sum())
+    stats.games += count
+    stats.total_turns += int(turns.sum())
+    stats.bankruptcies += int(games.bankruptcies[done].sum())
+    low, high = int(turns.min()), int(turns.max())
+    stats.min_turns = low if stats.min_turns is None else min(stats.min_turns, low)
+    stats.max_turns = high if stats.max_turns is None else max(stats.max_turns, high)
+    for policy in seats:
+        stats.seats[policy] = stats.seats.get(policy, 0) + count
+        stats.wins.setdefault(policy, 0)
+    active = games.active[done]
+    won = active.sum(axis=1) == 1
+    stats.finished_games += int(won.sum())
+    winners = np.argmax(active[won], axis=1)
+    for seat, wins in zip(*np.unique(winners, return_counts=True)):
+        stats.wins[seats[int(seat)]] += int(wins)
+
+
+def simulate_vectorized(
+    config: SimulationConfig,
+    board: BoardLayout | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SimulationStats:
+    """Vectorized counterpart of ``simulate`` for the same configuration.
+
+    Games run in chunks of ``chunk_size`` to bound memory; finished games are
+    tallied and dropped from the arrays as soon as they end.
+    """
+    seats = config.seat_policies()
+    policies = {
+        name: VectorPolicy.from_policy(make_policy(name)) for name in set(seats)
+    }
+    board_arrays = BoardArrays(board, config.rules)
+    seed_seq = np.random.SeedSequence(config.seed)
+    stats = SimulationStats()
+    started = time.perf_counter()
+    remaining = config.games
+    for chunk_seed in seed_seq.spawn(max(1, -(-config.games // chunk_size))):
+        block = min(chunk_size, remaining)
+        remaining -= block
+        if block <= 0:
+            break
+        games = LockstepGames(
+            block,
+            seats,
+            policies,
+            board_arrays,
+            config.rules,
+            config.starting_money,
+            np.random.default_rng(chunk_seed),
+        )
+        while games.live:
+            games.step()
+            done = games.finished(config.max_turns)
+            if done.any():
+                _record_finished(stats, games, done, seats)
+                games.drop(~done)
+            games.advance_turn()
+    stats.elapsed_seconds = time.perf_counter() - started
+    return stats
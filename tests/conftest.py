@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+from itertools import count
+from typing import Optional, Sequence
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.domain.game_engine import GameEngine, HouseRules
+from monopoly.domain.history import DEFAULT_SNAPSHOT_INTERVAL
+
+# No Go bonus and steep improvements, so players go bankrupt and the forced
+# sale and elimination paths run too.
+HARSH = HouseRules(pass_go_bonus=0, improvement_rent_bonus=150)
+
+ID_COUNTERS = (
+    "_game_ids",
+    "_player_ids",
+    "_space_ids",
+    "_state_ids",
+    "_transaction_ids",
+    "_event_ids",
+)
+
+
+def memory_shards(shard_count: int) -> list[InMemoryRepository]:
+    """Memory repositories numbering ids like configured Postgres shards."""
+    shards = []
+    for index in range(shard_count):
+        repo = InMemoryRepository()
+        for name in ID_COUNTERS:
+            setattr(repo, name, count(index + 1, shard_count))
+        shards.append(repo)
+    return shards
+
+
+def play_bots(
+    repo,
+    seed: int,
+    turns: int,
+    money: int = 1500,
+    players: Sequence[str] = ("Ann", "Bob"),
+    rules: Optional[HouseRules] = None,
+    improve: bool = False,
+    sell_chance: float = 0.0,
+    snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+) -> GameEngine:
+    """Play up to ``turns`` turns of a new game with dice seeded by ``seed``.
+
+    Bots buy every property they land on. On their own property they sell it
+    with probability ``sell_chance``, drawn from a stream of its own so the
+    choices do not follow the dice, and otherwise improve it if ``improve``.
+    """
+    engine = GameEngine.new_game_with_defaults(
+        repo,
+        list(players),
+        money,
+        rules,
+        rng=random.Random(seed),
+        snapshot_interval=snapshot_interval,
+    )
+    decisions = random.Random(f"decisions:{seed}")
+    player = engine.get_current_player()
+    for _ in range(turns):
+        result = engine.roll_and_resolve(player)
+        if result.needs_buy_decision:
+            engine.buy_property(result.player, result.space)
+        elif result.landed_on_own_property:
+            if sell_chance and decisions.random() < sell_chance:
+                engine.sell_property(result.player, result.space)
+            elif improve:
+                engine.improve_property(result.player, result.space)
+        if result.winner:
+            break
+        player = engine.next_turn()
+    return engine
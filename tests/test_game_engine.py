@@ -1 +1,326 @@
-# TODO
+# SPDX-FileCopyrightText: 2025-present zer0f8th <25908759+Zer0F8th@users.noreply.github.com>
+#
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+
+import pytest
+
+from monopoly.db.aio import AsyncRepositoryAdapter
+from monopoly.db.memory import InMemoryRepository
+from monopoly.domain import game_engine
+from monopoly.domain.async_engine import AsyncGameEngine
+from monopoly.domain.game_engine import (
+    DEFAULT_BOARD,
+    IMPROVEMENT_COST,
+    PASS_GO_BONUS,
+    GameEngine,
+)
+from monopoly.models import SpaceDraft, SpaceType
+from monopoly.sim.board import tiled_board
+
+
+class FixedDice(random.Random):
+    def __init__(self, *rolls: int) -> None:
+        super().__init__(0)
+        self.values = itertools.cycle(rolls)
+
+    def randint(self, a: int, b: int) -> int:
+        return next(self.values)
+
+
+def fixed_dice(engine: GameEngine, *rolls: int) -> None:
+    engine.rng = FixedDice(*rolls)
+
+
+@pytest.fixture
+def repo() -> InMemoryRepository:
+    return InMemoryRepository()
+
+
+@pytest.fixture
+def engine(repo: InMemoryRepository) -> GameEngine:
+    return GameEngine.new_game_with_defaults(repo, ["Ada", "Grace"], 1500)
+
+
+def test_new_game_loads_default_board(repo: InMemoryRepository, engine: GameEngine):
+    spaces = repo.list_spaces(engine.game_id)
+    assert [s.name for s in spaces] == [s["name"] for s in DEFAULT_BOARD]
+    current = engine.get_current_player()
+    assert current is not None and current.name == "Ada"
+
+
+def test_new_game_on_a_tiled_board(repo: InMemoryRepository):
+    engine = GameEngine.new_game_with_defaults(
+        repo, ["Ada", "Grace"], 1500, board=tiled_board(30)
+    )
+    assert engine.board_size == 30
+    assert [s.type for s in engine.board].count(SpaceType.GO) == 1
+    jails = [s.move_target for s in engine.board if s.type == SpaceType.JAIL]
+    assert jails == [8, 20]
+
+
+def test_roll_onto_unowned_property_then_buy(repo, engine):
+    fixed_dice(engine, 1)  # 1 + 1 -> Volunteer Avenue
+    player = engine.get_current_player()
+    result = engine.roll_and_resolve(player)
+    assert result.space.sequence_order == 2
+    assert result.needs_buy_decision
+    assert engine.buy_property(result.player, result.space)
+    owned = repo.properties_by_owner(engine.game_id, player.id)
+    assert [s.name for s, _ in owned] == ["Volunteer Avenue"]
+    assert repo.get_player(player.id).money == 1500 - 150
+
+
+def test_rent_is_paid_to_owner(repo, engine):
+    ada, grace = repo.list_players(engine.game_id)
+    space = repo.get_space_by_order(engine.game_id, 2)
+    engine.buy_property(ada, space)
+    engine.improve_property(repo.get_player(ada.id), space)
+    fixed_dice(engine, 1)
+    result = engine.roll_and_resolve(grace)
+    assert result.rent_paid == space.base_rent + game_engine.IMPROVEMENT_RENT_BONUS
+    assert repo.get_player(grace.id).money == 1500 - result.rent_paid
+    assert (
+        repo.get_player(ada.id).money
+        == 1500 - space.purchase_cost - IMPROVEMENT_COST + result.rent_paid
+    )
+
+
+def test_passing_go_pays_bonus(repo, engine):
+    player = engine.get_current_player()
+    repo.update_player_position(player.id, 10)
+    fixed_dice(engine, 1)  # 10 + 2 wraps to GO
+    result = engine.roll_and_resolve(repo.get_player(player.id))
+    assert result.space.type == SpaceType.GO
+    assert result.player.money == 1500 + 2 * PASS_GO_BONUS
+
+
+def test_bankruptcy_eliminates_and_declares_winner(repo, engine):
+    ada, grace = repo.list_players(engine.game_id)
+    repo.set_money(ada.id, 50)
+    fixed_dice(engine, 1, 2)  # 1 + 2 -> City Tax (-150)
+    result = engine.roll_and_resolve(repo.get_player(ada.id))
+    assert result.eliminated_players == ["Ada"]
+    assert result.winner == "Grace"
+    assert repo.get_game(engine.game_id).status == "completed"
+
+
+def test_bankruptcy_liquidates_everything_and_renumbers_turns(repo):
+    engine = GameEngine.new_game_with_defaults(repo, ["Ada", "Grace", "Linus"], 1500)
+    ada, grace, linus = repo.list_players(engine.game_id)
+    market, volunteer = (repo.get_space_by_order(engine.game_id, i) for i in (1, 2))
+    engine.buy_property(ada, market)
+    engine.buy_property(repo.get_player(ada.id), volunteer)
+    for _ in range(2):
+        engine.improve_property(repo.get_player(ada.id), volunteer)
+    repo.set_money(ada.id, -500)  # deeper in debt than the properties cover
+    fixed_dice(engine, 1, 2)  # 1 + 2 -> City Tax
+
+    result = engine.roll_and_resolve(repo.get_player(ada.id))
+
+    assert result.eliminated_players == ["Ada"] and result.winner is None
+    assert repo.properties_by_owner(engine.game_id, ada.id) == []
+    sales = [
+        (t.description, t.amount)
+        for t in repo.list_transactions(engine.game_id, limit=2)
+    ]
+    assert sorted(sales) == [
+        ("Forced sale of Market Street", engine.rules.sale_value(market, 0)),
+        ("Forced sale of Volunteer Avenue", engine.rules.sale_value(volunteer, 2)),
+    ]
+    remaining = repo.list_players(engine.game_id, active_only=True)
+    assert [(p.id, p.turn_order) for p in remaining] == [(grace.id, 0), (linus.id, 1)]
+
+
+def test_next_turn_rotates_active_players(repo, engine):
+    ada, grace = repo.list_players(engine.game_id)
+    assert engine.next_turn().id == grace.id
+    assert engine.next_turn().id == ada.id
+
+
+def test_in_memory_ledger_is_kept_unless_capped():
+    repo = InMemoryRepository()
+    game = repo.create_game()
+    player = repo.add_player(game.id, "Ada", 0, 0)
+    for amount in range(5):
+        repo.adjust_money(game.id, player.id, amount, f"tx {amount}")
+    assert [t.amount for t in repo.list_transactions(game.id)] == [4, 3, 2, 1, 0]
+
+    capped = InMemoryRepository(ledger_limit=3)
+    game = capped.create_game()
+    player = capped.add_player(game.id, "Ada", 0, 0)
+    with pytest.warns(RuntimeWarning, match="ledger_limit=3"):
+        for amount in range(5):
+            capped.adjust_money(game.id, player.id, amount, f"tx {amount}")
+    assert [t.amount for t in capped.list_transactions(game.id)] == [4, 3, 2]
+    assert capped.dropped_transactions(game.id) == 2
+    assert capped.get_player(player.id).money == sum(range(5))
+
+
+def test_failed_operation_leaves_memory_untouched(
+    repo: InMemoryRepository, engine: GameEngine, monkeypatch
+):
+    fixed_dice(engine, 3, 4)
+    player = engine.get_current_player()
+    before = (engine.board_status(), repo.list_transactions(engine.game_id))
+
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(repo, "append_events", broken)
+    with pytest.raises(RuntimeError):
+        engine.roll_and_resolve(player)
+    assert repo.get_player(player.id).position == 0
+    assert (engine.board_status(), repo.list_transactions(engine.game_id)) == before
+
+
+def test_memory_unit_of_work_undoes_every_change():
+    repo = InMemoryRepository(ledger_limit=2)
+    kept = repo.create_game()
+    ada = repo.add_player(kept.id, "Ada", 100, 0)
+    repo.adjust_money(kept.id, ada.id, 5, "one")
+    repo.adjust_money(kept.id, ada.id, 5, "two")
+    space = repo.add_space(kept.id, 0, "Lot", SpaceType.PROPERTY, purchase_cost=60)
+    before = (
+        repo.board_status(kept.id),
+        repo.list_transactions(kept.id),
+        repo.leaderboard(),
+    )
+    with pytest.raises(RuntimeError), pytest.warns(RuntimeWarning):
+        with repo.unit_of_work():
+            game = repo.create_game()
+            repo.add_player(game.id, "Grace", 900, 0)
+            repo.set_property_owner(kept.id, space.id, ada.id, 2)
+            repo.adjust_money(kept.id, ada.id, -50, "three", holdings_delta=30)
+            repo.append_events(kept.id, [])
+            repo.remove_player(ada.id)
+            repo.delete_game(kept.id)
+            raise RuntimeError("boom")
+    assert repo.list_games() == [kept]
+    assert (
+        repo.board_status(kept.id),
+        repo.list_transactions(kept.id),
+        repo.leaderboard(),
+    ) == before
+    assert repo.properties_by_owner(kept.id, ada.id) == []
+    assert repo.dropped_transactions(kept.id) == 0
+
+
+def test_seeded_engines_replay_identically():
+    def play(seed: int) -> list:
+        repo = InMemoryRepository()
+        engine = GameEngine.new_game_with_defaults(
+            repo, ["Ada", "Grace"], 1500, rng=random.Random(seed)
+        )
+        player = engine.get_current_player()
+        rolls = []
+        for _ in range(20):
+            result = engine.roll_and_resolve(player)
+            rolls.append((result.dice_rolls, result.player.money))
+            if result.winner:
+                break
+            player = engine.next_turn()
+        return rolls
+
+    assert play(7) == play(7)
+    assert play(7) != play(8)
+
+
+def test_async_engine_plays_the_same_rules():
+    def play_blocking() -> list:
+        repo = InMemoryRepository()
+        engine = GameEngine.new_game_with_defaults(
+            repo, ["Ada", "Grace"], 300, rng=random.Random(3)
+        )
+        turns = []
+        for _ in range(60):
+            result = engine.roll_and_resolve(engine.get_current_player())
+            if result.needs_buy_decision:
+                engine.buy_property(result.player, result.space)
+            turns.append((result.dice_rolls, result.messages, engine.standings()))
+            if result.winner or engine.next_turn() is None:
+                break
+        return turns
+
+    async def play_async() -> list:
+        repo = AsyncRepositoryAdapter(InMemoryRepository())
+        engine = await AsyncGameEngine.new_game_with_defaults(
+            repo, ["Ada", "Grace"], 300, rng=random.Random(3)
+        )
+        turns = []
+        for _ in range(60):
+            result = await engine.roll_and_resolve(await engine.get_current_player())
+            if result.needs_buy_decision:
+                await engine.buy_property(result.player, result.space)
+            turns.append((result.dice_rolls, result.messages, await engine.standings()))
+            if result.winner or await engine.next_turn() is None:
+                break
+        return turns
+
+    assert play_blocking() == asyncio.run(play_async())
+
+
+def test_turns_use_the_cached_board(repo, engine):
+    def no_query(*args):
+        raise AssertionError("board should be served from the cache")
+
+    engine.board  # warm the cache
+    repo.count_spaces = no_query
+    repo.get_space_by_order = no_query
+    repo.list_spaces = no_query
+    result = engine.roll_and_resolve(engine.get_current_player())
+    assert result.space is engine.board[result.space.sequence_order]
+
+
+def test_board_cache_is_refreshed_after_setup_edits(repo):
+    game = repo.create_game()
+    repo.add_player(game.id, "Ada", 1500, 0)
+    engine = GameEngine(repo, game.id)
+    with pytest.raises(RuntimeError):
+        engine.ensure_game_ready()
+    repo.add_space(game.id, 0, "GO", SpaceType.GO)
+    assert engine.board_size == 1
+    repo.add_space(game.id, 1, "Free", SpaceType.FREE)
+    assert engine.board_size == 1
+    engine.invalidate_board()
+    assert engine.board_size == 2
+
+
+def test_add_spaces_saves_a_board_in_one_call(repo):
+    game = repo.create_game()
+    drafts = [
+        SpaceDraft(sequence_order=0, name="GO", type=SpaceType.GO),
+        SpaceDraft(
+            sequence_order=1,
+            name="Lot",
+            type=SpaceType.PROPERTY,
+            purchase_cost=100,
+            base_rent=10,
+        ),
+    ]
+    spaces = repo.add_spaces(game.id, drafts)
+    assert [s.name for s in spaces] == ["GO", "Lot"]
+    assert repo.get_property_state(game.id, spaces[1].id).owner_id is None
+    assert repo.get_property_state(game.id, spaces[0].id) is None
+    with pytest.raises(ValueError):
+        repo.add_spaces(game.id, drafts[:1])
+
+
+def test_board_status_is_cached_until_the_engine_writes(repo, engine):
+    status = engine.board_status()
+    assert [s.space.name for s in status.squares] == [s["name"] for s in DEFAULT_BOARD]
+    assert status.current_player.name == "Ada"
+    assert engine.board_status() is status
+
+    fixed_dice(engine, 1)
+    result = engine.roll_and_resolve(engine.get_current_player())
+    assert engine.buy_property(result.player, result.space)
+    square = engine.board_status().squares[2]
+    assert (square.owner_id, square.owner_name) == (result.player.id, "Ada")
+    assert [p.money for p in engine.board_status().players] == [
+        p.money for p in repo.list_players(engine.game_id)
+    ]
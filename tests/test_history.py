@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.db.sqlite import SqliteDatabase, SqliteRepository
+from monopoly.domain.game_engine import GameEngine
+from monopoly.domain.history import capture_state, rebuild_state
+from monopoly.models import EventKind
+
+
+def play(engine: GameEngine, turns: int, checkpoints=()) -> dict:
+    """Play bot turns, returning the live state at each checkpoint turn."""
+    repo = engine.repo
+    seen = {}
+    player = engine.get_current_player()
+    for _ in range(turns):
+        result = engine.roll_and_resolve(player)
+        fresh = result.player
+        if result.needs_buy_decision:
+            engine.buy_property(fresh, result.space)
+        elif result.landed_on_own_property:
+            if fresh.money < 300:
+                engine.sell_property(fresh, result.space)
+            else:
+                engine.improve_property(fresh, result.space)
+        if result.winner:
+            break
+        player = engine.next_turn()
+        if engine.turn in checkpoints:
+            seen[engine.turn] = capture_state(repo, engine.game_id, engine.turn)
+    return seen
+
+
+@pytest.mark.parametrize("money", [400, 1500])
+def test_rebuilt_state_matches_live_state(money):
+    repo = InMemoryRepository()
+    engine = GameEngine.new_game_with_defaults(
+        repo,
+        ["Ada", "Grace", "Linus"],
+        money,
+        rng=random.Random(money),
+        snapshot_interval=25,
+    )
+    seen = play(engine, 400, checkpoints={1, 24, 25, 26, 77, 150})
+    final = capture_state(repo, engine.game_id, engine.turn)
+    assert rebuild_state(repo, engine.game_id).to_dict() == final.to_dict()
+    for turn, state in seen.items():
+        assert rebuild_state(repo, engine.game_id, turn).to_dict() == state.to_dict()
+
+
+def test_bankruptcy_is_replayed():
+    repo = InMemoryRepository()
+    engine = GameEngine.new_game_with_defaults(
+        repo, ["Ada", "Grace", "Linus"], 300, rng=random.Random(3)
+    )
+    play(engine, 2000)
+    kinds = {e.kind for e in repo.list_events(engine.game_id)}
+    assert EventKind.ELIMINATE in kinds
+    rebuilt = rebuild_state(repo, engine.game_id)
+    assert (
+        rebuilt.to_dict() == capture_state(repo, engine.game_id, engine.turn).to_dict()
+    )
+
+
+def test_replay_reads_only_events_after_the_snapshot():
+    repo = InMemoryRepository()
+    engine = GameEngine.new_game_with_defaults(
+        repo, ["Ada", "Grace"], 10**9, rng=random.Random(1), snapshot_interval=100
+    )
+    play(engine, 1050)
+    calls = []
+    list_events = repo.list_events
+
+    def spy(game_id, after_turn=0, upto_turn=None):
+        events = list_events(game_id, after_turn, upto_turn)
+        calls.append((after_turn, len(events)))
+        return events
+
+    repo.list_events = spy
+    rebuild_state(repo, engine.game_id, 1049)
+    assert calls[0][0] == 1000
+    assert {e.turn for e in list_events(engine.game_id, 1000, 1049)} == set(
+        range(1001, 1050)
+    )
+
+
+def test_history_can_be_disabled():
+    repo = InMemoryRepository()
+    engine = GameEngine.new_game_with_defaults(repo, ["Ada", "Grace"], 1500)
+    engine.record_history = False
+    play(engine, 10)
+    assert repo.list_events(engine.game_id) == []
+
+
+def test_failed_operation_rereads_the_history_turn():
+    with SqliteDatabase(":memory:") as db:
+        repo = SqliteRepository(db)
+        engine = GameEngine.new_game_with_defaults(
+            repo, ["Ada", "Grace"], 1500, rng=random.Random(5), snapshot_interval=25
+        )
+        move = repo.update_player_position
+
+        def broken(player_id, position):
+            raise RuntimeError("boom")
+
+        repo.update_player_position = broken
+        with pytest.raises(RuntimeError):
+            engine.roll_and_resolve(engine.get_current_player())
+        repo.update_player_position = move
+        seen = play(engine, 12, checkpoints={3})
+        assert min(e.turn for e in repo.list_events(engine.game_id)) == 1
+        assert rebuild_state(repo, engine.game_id, 3).to_dict() == seen[3].to_dict()
+        final = capture_state(repo, engine.game_id, engine.turn)
+        assert rebuild_state(repo, engine.game_id).to_dict() == final.to_dict()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from monopoly.db import InMemoryRepository, Instrumentation, QueryBudgetExceeded
+from monopoly.db.sqlite import SqliteDatabase, SqliteRepository
+from monopoly.domain import GameEngine
+
+
+def new_engine(instrumentation: Instrumentation) -> GameEngine:
+    return GameEngine.new_game_with_defaults(
+        instrumentation.wrap(InMemoryRepository()),
+        ["Alice", "Bob"],
+        1500,
+        rng=random.Random(3),
+    )
+
+
+def test_calls_are_grouped_by_engine_operation() -> None:
+    instrumentation = Instrumentation()
+    engine = new_engine(instrumentation)
+    instrumentation.reset()
+
+    player = engine.get_current_player()
+    engine.roll_and_resolve(player)
+    engine.next_turn()
+
+    snapshot = instrumentation.snapshot()
+    operations = snapshot["operations"]
+    assert operations["roll_and_resolve"]["calls"] == 1
+    assert operations["next_turn"]["calls"] == 1
+    assert "end_turn" in operations["next_turn"]["methods"]
+    assert "get_player" in operations["roll_and_resolve"]["methods"]
+    # Without a database every repository call counts as one round trip.
+    total = sum(
+        method["calls"]
+        for operation in operations.values()
+        for method in operation["methods"].values()
+    )
+    assert snapshot["statements"] == total
+    assert snapshot["turns"]["calls"] == 1
+
+
+def test_budgets_raise_when_exceeded() -> None:
+    instrumentation = Instrumentation(turn_budget=1)
+    engine = new_engine(instrumentation)
+    player = engine.get_current_player()
+    engine.roll_and_resolve(player)
+    with pytest.raises(QueryBudgetExceeded, match="Turn took"):
+        engine.next_turn()
+
+    instrumentation = Instrumentation(operation_budgets={"roll_and_resolve": 1})
+    engine = new_engine(instrumentation)
+    with pytest.raises(QueryBudgetExceeded, match="roll_and_resolve took"):
+        engine.roll_and_resolve(engine.get_current_player())
+
+
+def test_turn_over_budget_still_commits() -> None:
+    instrumentation = Instrumentation(turn_budget=1)
+    with SqliteDatabase(":memory:") as db:
+        repo = SqliteRepository(db)
+        engine = GameEngine.new_game_with_defaults(
+            instrumentation.wrap(repo), ["Alice", "Bob"], 1500
+        )
+        alice = engine.get_current_player()
+        engine.roll_and_resolve(alice)
+        with pytest.raises(QueryBudgetExceeded, match="Turn took"):
+            engine.next_turn()
+        assert repo.get_game(engine.game_id).current_turn_player_id != alice.id
+        assert repo.last_event_turn(engine.game_id) == 1
+
+
+def test_dump_writes_json_and_prometheus(tmp_path) -> None:
+    instrumentation = Instrumentation()
+    engine = new_engine(instrumentation)
+    engine.next_turn()
+
+    instrumentation.dump(tmp_path / "stats.json")
+    data = json.loads((tmp_path / "stats.json").read_text())
+    assert data["operations"]["next_turn"]["calls"] == 1
+
+    instrumentation.dump(tmp_path / "stats.prom")
+    text = (tmp_path / "stats.prom").read_text()
+    assert 'monopoly_operation_calls_total{operation="next_turn"} 1' in text
+    assert 'le="+Inf"' in text
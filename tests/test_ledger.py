@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+import pytest
+
+from monopoly.db.ledger import BufferedLedger
+
+
+class FakeCopy:
+    def __init__(self, sink: List[Any]) -> None:
+        self.sink = sink
+
+    def write_row(self, row: Any) -> None:
+        self.sink.append(row)
+
+    def __enter__(self) -> "FakeCopy":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+class FakeDatabase:
+    """Just enough of ``Database`` to watch what the ledger writes."""
+
+    def __init__(self) -> None:
+        self.copied: List[Any] = []
+        self.hooks: List[Any] = []
+        self.active = False
+        self.fail = False
+
+    def add_close_hook(self, hook: Any) -> None:
+        self.hooks.append(hook)
+
+    def in_transaction(self) -> bool:
+        return self.active
+
+    def close(self) -> None:
+        for hook in self.hooks:
+            hook()
+
+    @contextmanager
+    def connection(self) -> Iterator["FakeDatabase"]:
+        if self.fail:
+            raise ConnectionError("database went away")
+        yield self
+
+    def cursor(self) -> "FakeDatabase":
+        return self
+
+    def __enter__(self) -> "FakeDatabase":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def copy(self, statement: str) -> FakeCopy:
+        return FakeCopy(self.copied)
+
+
+@pytest.fixture
+def db() -> FakeDatabase:
+    return FakeDatabase()
+
+
+def test_rows_flush_on_size_and_age(db):
+    now = [0.0]
+    ledger = BufferedLedger(db, max_rows=3, max_delay=5.0, clock=lambda: now[0])
+    ledger.append(1, 1, 10, "a")
+    ledger.append(1, 2, -10, "b")
+    assert db.copied == [] and len(ledger) == 2
+    ledger.append(1, 1, 5, "c")
+    assert [row[3] for row in db.copied] == ["a", "b", "c"]
+    ledger.append(1, 1, 1, "d")
+    now[0] = 6.0
+    ledger.append(1, 1, 1, "e")
+    assert len(db.copied) == 5 and len(ledger) == 0
+
+
+def test_rolled_back_work_is_discarded_and_close_flushes(db):
+    ledger = BufferedLedger(db)
+    with ledger.transaction():
+        ledger.append(1, 1, 100, "committed")
+    with pytest.raises(RuntimeError):
+        with ledger.transaction():
+            ledger.append(1, 1, -100, "rolled back")
+            raise RuntimeError("turn failed")
+    assert db.copied == []
+    db.close()
+    assert [row[3] for row in db.copied] == ["committed"]
+
+
+def test_failed_flush_keeps_rows_for_retry(db):
+    ledger = BufferedLedger(db)
+    ledger.append(1, 1, 10, "a")
+    db.fail = True
+    with pytest.raises(ConnectionError):
+        ledger.flush()
+    db.fail = False
+    ledger.append(1, 1, 20, "b")
+    assert ledger.flush() == 2
+    assert [row[3] for row in db.copied] == ["a", "b"]
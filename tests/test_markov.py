@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from monopoly.models import SpaceType  # noqa: E402
+from monopoly.sim import markov  # noqa: E402
+from monopoly.sim.board import normalize_board  # noqa: E402
+
+
+def test_transition_rows_are_distributions():
+    matrix = markov.transition_matrix()
+    assert np.allclose(matrix.sum(axis=1), 1.0)
+
+
+def test_board_without_jumps_is_uniform():
+    board = [{"name": f"Lot {i}", "type": SpaceType.FREE} for i in range(30)]
+    assert np.allclose(markov.stationary_distribution(board), 1 / 30)
+
+
+def test_default_board_never_ends_on_go_to_jail():
+    pi = markov.stationary_distribution()
+    assert pi[6] == pytest.approx(0.0, abs=1e-12)
+    assert pi[8] == pi.max()
+
+
+def test_banded_solver_matches_dense_solver():
+    board = []
+    for i in range(450):
+        if i % 37 == 5:
+            board.append(
+                {"name": "Jail", "type": SpaceType.JAIL, "move_target": i // 2}
+            )
+        elif i % 101 == 7:
+            board.append({"name": "Back", "type": SpaceType.JAIL})
+        else:
+            board.append({"name": f"Lot {i}", "type": SpaceType.FREE})
+    spaces = normalize_board(board)
+    dense = markov._stationary_dense(markov.transition_matrix(spaces))
+    banded = markov._stationary_banded(markov._jail_targets(spaces))
+    assert np.allclose(dense, banded, atol=1e-12)
+
+
+def test_property_report_break_even():
+    analysis = markov.analyze_board(players=3)
+    assert len(analysis.properties) == 5
+    for report in analysis.properties:
+        expected = report.purchase_cost / (2 * report.landing_probability * report.rent)
+        assert report.break_even_rounds == pytest.approx(expected)
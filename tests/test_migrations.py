@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from monopoly.db.migrate import HOT_QUERIES, load_migrations, plan_indexes
+
+
+def test_migrations_are_ordered_and_create_checked_indexes():
+    migrations = load_migrations()
+    assert [m.version for m in migrations] == list(range(1, len(migrations) + 1))
+    assert migrations[0].name == "baseline"
+    ddl = "".join(m.sql for m in migrations)
+    for check in HOT_QUERIES:
+        assert check.index in ddl
+
+
+def test_migration_files_must_be_versioned(tmp_path):
+    (tmp_path / "0001_first.sql").write_text("SELECT 1;")
+    (tmp_path / "second.sql").write_text("SELECT 1;")
+    with pytest.raises(ValueError, match="second.sql"):
+        load_migrations(tmp_path)
+
+
+def test_plan_indexes_walks_nested_plans():
+    plan = [
+        {
+            "Plan": {
+                "Node Type": "Nested Loop",
+                "Plans": [
+                    {"Node Type": "Index Scan", "Index Name": "idx_a"},
+                    {
+                        "Node Type": "Bitmap Heap Scan",
+                        "Plans": [{"Index Name": "idx_b"}],
+                    },
+                ],
+            }
+        }
+    ]
+    assert sorted(plan_indexes(plan)) == ["idx_a", "idx_b"]
+    assert plan_indexes([{"Plan": {"Node Type": "Seq Scan"}}]) == []
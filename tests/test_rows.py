@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from monopoly.db.repository import SPACE_COLUMNS
+from monopoly.db.rows import row_maker
+from monopoly.models import (
+    BoardSpace,
+    GameSession,
+    GameSnapshot,
+    Player,
+    PropertyState,
+    SpaceType,
+    SquareStatus,
+    Transaction,
+    TurnEvent,
+)
+
+PLAYER_COLUMNS = (
+    "id",
+    "game_id",
+    "name",
+    "money",
+    "position",
+    "is_active",
+    "turn_order",
+)
+
+
+def test_trusted_rows_match_validated_models():
+    values = (1, 2, "Ada", 1500, 3, True, 0)
+    trusted = row_maker(Player, PLAYER_COLUMNS)(values)
+    validated = row_maker(Player, PLAYER_COLUMNS, trusted=False)(values)
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_copy(update={"money": 0}).money == 0
+
+
+NOW = datetime(2024, 5, 1, 12, 30)
+SPACE = row_maker(BoardSpace, SPACE_COLUMNS, trusted=False)(
+    (5, 1, 2, "Volunteer Avenue", "property", None, 150, 30, 0, None)
+)
+
+# One row, as the schema returns it, for every model the repositories decode
+# with trusted row factories.
+SCHEMA_ROWS = {
+    GameSession: {
+        "id": 1,
+        "status": "active",
+        "current_turn_player_id": None,
+        "created_at": NOW,
+    },
+    Player: dict(zip(PLAYER_COLUMNS, (1, 2, "Ada", 1500, 3, True, 0))),
+    BoardSpace: SPACE.model_dump(),
+    PropertyState: {
+        "id": 4,
+        "game_id": 1,
+        "space_id": 5,
+        "owner_id": None,
+        "improvement_count": 2,
+    },
+    SquareStatus: {
+        "space": SPACE,
+        "owner_id": 7,
+        "owner_name": "Ada",
+        "improvement_count": 1,
+    },
+    Transaction: {
+        "id": 9,
+        "game_id": 1,
+        "player_id": None,
+        "amount": -150,
+        "description": "Event City Tax",
+        "created_at": NOW,
+    },
+    TurnEvent: {
+        "id": 3,
+        "game_id": 1,
+        "turn": 12,
+        "kind": "roll",
+        "player_id": 2,
+        "space_id": None,
+        "counterparty_id": None,
+        "amount": 200,
+        "position": 4,
+        "dice": [3, 5],
+    },
+    GameSnapshot: {
+        "game_id": 1,
+        "turn": 100,
+        "state": {"players": [], "properties": {}},
+        "created_at": NOW,
+    },
+}
+
+
+@pytest.mark.parametrize("model", SCHEMA_ROWS, ids=lambda m: m.__name__)
+def test_trusted_rows_equal_model_validate(model):
+    names, values = zip(*SCHEMA_ROWS[model].items())
+    trusted = row_maker(model, names)(values)
+    validated = model.model_validate(SCHEMA_ROWS[model])
+    assert type(trusted) is model
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.model_copy(deep=True) == validated
+    field = next(iter(model.model_fields))
+    assert trusted.model_copy(update={field: None}) == validated.model_copy(
+        update={field: None}
+    )
+
+
+def test_trusted_rows_convert_space_type():
+    values = (5, 1, 2, "Volunteer Avenue", "property", None, 150, 30, 0, None)
+    space = row_maker(BoardSpace, SPACE_COLUMNS)(values)
+    assert space.type is SpaceType.PROPERTY
+    assert space == row_maker(BoardSpace, SPACE_COLUMNS, trusted=False)(values)
+
+
+def test_trusted_rows_require_every_field():
+    with pytest.raises(ValueError, match="missing columns"):
+        row_maker(Player, PLAYER_COLUMNS[:-1])
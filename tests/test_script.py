@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from monopoly.cli.main import main
+from monopoly.cli.script import ScriptRunner
+from monopoly.db.memory import InMemoryRepository
+from monopoly.sim.board import tiled_board
+
+SESSION = """\
+# two players on the default board
+seed 11
+new 1500 Ada Grace
+roll
+end
+roll
+status
+"""
+
+
+def run(script: str, **kwargs: Any) -> List[Dict[str, Any]]:
+    out = io.StringIO()
+    ScriptRunner(InMemoryRepository(), seed=11).run(script.splitlines(), out, **kwargs)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_script_prints_one_json_result_per_command() -> None:
+    records = run(SESSION)
+    assert [r["command"] for r in records] == [
+        "seed",
+        "new",
+        "roll",
+        "end",
+        "roll",
+        "status",
+    ]
+    assert all(r["ok"] for r in records)
+    assert records[0]["line"] == 2
+    status = records[-1]["result"]
+    assert status["rolled"] is True
+    assert [p["name"] for p in status["players"]] == ["Ada", "Grace"]
+
+
+def test_seeded_scripts_replay_identically() -> None:
+    first = [r.get("result") for r in run(SESSION)]
+    second = [r.get("result") for r in run(SESSION)]
+    assert first == second
+
+
+def test_errors_are_reported_and_can_stop_the_script() -> None:
+    records = run("roll\nnew 1500 Ada Grace\nend\n")
+    assert [r["ok"] for r in records] == [False, True, False]
+    assert records[0]["error"] == "Create or load a game first."
+
+    records = run("roll\nnew 1500 Ada Grace\n", stop_on_error=True)
+    assert len(records) == 1
+
+
+def test_script_command_exits_nonzero_on_errors(tmp_path, capsys) -> None:
+    script = tmp_path / "session.txt"
+    script.write_text("board tiled 30\nnew 1500 Ada Grace\nroll\nbogus\n")
+    with pytest.raises(SystemExit) as exc:
+        main(["--backend", "memory", "script", str(script), "--summary"])
+    assert exc.value.code == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[1])["result"]["game_id"] == 1
+    assert json.loads(lines[-1])["summary"]["commands"] == 4
+
+
+def test_load_resumes_a_game_through_the_server_commands() -> None:
+    repo = InMemoryRepository()
+    ScriptRunner(repo, seed=1).run(["new 1500 Ada Grace", "roll", "end"], io.StringIO())
+    out = io.StringIO()
+    ScriptRunner(repo, seed=1).run(["load 1", "roll", "stats"], out)
+    loaded, rolled, stats = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert loaded["result"]["current_player"]["name"] == "Grace"
+    assert rolled["ok"] and rolled["result"]["player"]["name"] == "Grace"
+    assert stats["result"]["turns"] == 1
+
+
+def test_board_files_are_read_and_checked(tmp_path) -> None:
+    board = tmp_path / "board.json"
+    board.write_text(json.dumps(tiled_board(20)))
+    (tmp_path / "bad.json").write_text('{"name": "Go"}')
+    records = run(
+        f"board {board}\nnew 1500 Ada Grace\n"
+        f"board {tmp_path / 'bad.json'}\nboard {tmp_path / 'missing.json'}\n"
+    )
+    assert records[0]["result"] == {"spaces": 20}
+    assert records[1]["ok"]
+    assert records[2]["error"] == "Board file must hold a JSON list of spaces."
+    assert records[3]["error"].startswith("Cannot read board:")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+from monopoly.db import AsyncRepositoryAdapter, InMemoryRepository
+from monopoly.domain.history import capture_state, rebuild_state
+from monopoly.models import EventKind
+from monopoly.server import GameServer
+
+
+async def _request(reader, writer, line: str):
+    writer.write((line + "\n").encode())
+    await writer.drain()
+    status, _, body = (await reader.readline()).decode().strip().partition(" ")
+    return status, json.loads(body) if status == "ok" else body
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class BrokenRolls(InMemoryRepository):
+    def update_player_position(self, player_id: int, position: int) -> None:
+        raise KeyError(player_id)
+
+
+def test_clients_play_turns_over_tcp():
+    async def scenario():
+        game_server = GameServer(AsyncRepositoryAdapter(InMemoryRepository()), seed=1)
+        server = await game_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        host = await asyncio.open_connection("127.0.0.1", port)
+        status, game = await _request(*host, "new 1500 Ada Grace")
+        assert status == "ok" and len(game["players"]) == 2
+
+        grace = await asyncio.open_connection("127.0.0.1", port)
+        status, _ = await _request(*grace, f"join {game['game_id']} Grace")
+        assert status == "ok"
+        status, message = await _request(*grace, "roll")
+        assert status == "err" and "Ada's turn" in message
+
+        status, turn = await _request(*host, "roll")
+        assert status == "ok" and sum(turn["dice"]) >= 2
+        status, _ = await _request(*host, "roll")
+        assert status == "err"
+        status, ended = await _request(*host, "end")
+        assert ended["next_player"]["name"] == "Grace"
+        status, _ = await _request(*grace, "roll")
+        assert status == "ok"
+
+        status, stats = await _request(*host, "stats")
+        assert stats["turns"] == 2
+        assert stats["by_command"]["roll"] == 4
+        assert stats["errors"] == 2
+        for reader, writer in (host, grace):
+            writer.close()
+        server.close()
+        await server.wait_closed()
+
+    run(scenario())
+
+
+def test_games_run_concurrently():
+    async def scenario():
+        game_server = GameServer(AsyncRepositoryAdapter(InMemoryRepository()))
+        server = await game_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def play(turns: int) -> int:
+            client = await asyncio.open_connection("127.0.0.1", port)
+            await _request(*client, "new 100000 A B C")
+            for _ in range(turns):
+                await _request(*client, "roll")
+                await _request(*client, "end")
+            client[1].close()
+            return turns
+
+        assert sum(await asyncio.gather(*(play(10) for _ in range(50)))) == 500
+        assert len(game_server.tables) == 50
+        assert all(t.metrics.turns == 10 for t in game_server.tables.values())
+        server.close()
+        await server.wait_closed()
+
+    run(scenario())
+
+
+def test_unexpected_errors_are_reported_logged_and_counted(caplog):
+    async def scenario():
+        game_server = GameServer(AsyncRepositoryAdapter(BrokenRolls()), seed=1)
+        server = await game_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = await asyncio.open_connection("127.0.0.1", port)
+        await _request(*client, "new 1500 Ada Grace")
+        status, message = await _request(*client, "roll")
+        assert (status, message) == ("err", "internal error")
+        status, stats = await _request(*client, "stats")
+        assert status == "ok" and stats["errors"] == 1
+        client[1].close()
+        server.close()
+        await server.wait_closed()
+
+    with caplog.at_level(logging.ERROR, logger="monopoly.server.app"):
+        run(scenario())
+    assert "Command 'roll' failed" in caplog.text
+    assert "KeyError" in caplog.text
+
+
+def test_served_games_can_be_replayed():
+    repo = InMemoryRepository()
+    seen = {}
+
+    async def scenario() -> int:
+        game_server = GameServer(AsyncRepositoryAdapter(repo), seed=3)
+        server = await game_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = await asyncio.open_connection("127.0.0.1", port)
+        _, game = await _request(*client, "new 400 Ada Grace Linus")
+        for _ in range(150):
+            status, turn = await _request(*client, "roll")
+            if status != "ok":
+                break
+            if turn["needs_buy_decision"]:
+                await _request(*client, "buy")
+            elif turn["landed_on_own_property"]:
+                await _request(
+                    *client, "sell" if turn["player"]["money"] < 300 else "improve"
+                )
+            if turn["winner"]:
+                break
+            await _request(*client, "end")
+            number = repo.last_event_turn(game["game_id"])
+            if number in (1, 99, 100, 101):
+                seen[number] = capture_state(repo, game["game_id"], number)
+        client[1].close()
+        server.close()
+        await server.wait_closed()
+        return game["game_id"]
+
+    game_id = run(scenario())
+    kinds = {event.kind for event in repo.list_events(game_id)}
+    assert {EventKind.ROLL, EventKind.BUY, EventKind.TURN} <= kinds
+    assert repo.latest_snapshot(game_id, 100).turn == 100
+    final = capture_state(repo, game_id, repo.last_event_turn(game_id))
+    assert rebuild_state(repo, game_id).to_dict() == final.to_dict()
+    assert seen
+    for turn, state in seen.items():
+        assert rebuild_state(repo, game_id, turn).to_dict() == state.to_dict()
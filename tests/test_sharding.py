@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.db.sharding import ShardedRepository, next_shard_id, shard_index
+from monopoly.domain.game_engine import GameEngine
+from tests.conftest import memory_shards, play_bots
+
+
+def play(repo, seed: int, turns: int = 60) -> GameEngine:
+    return play_bots(repo, seed, turns)
+
+
+def test_shard_id_arithmetic():
+    assert [shard_index(i, 3) for i in range(1, 8)] == [0, 1, 2, 0, 1, 2, 0]
+    for index in range(3):
+        for current_max in range(10):
+            start = next_shard_id(current_max, index, 3)
+            assert start > current_max
+            assert shard_index(start, 3) == index
+            assert start - current_max <= 3
+
+
+def test_games_spread_and_play_like_one_database():
+    shards = memory_shards(3)
+    repo = ShardedRepository(shards)
+    engines = [play(repo, seed) for seed in range(6)]
+
+    placed = [repo.shard_of(e.game_id) for e in engines]
+    assert placed == [(placed[0] + n) % 3 for n in range(6)]
+    for engine in engines:
+        home = shards[repo.shard_of(engine.game_id)]
+        assert home.get_game(engine.game_id) is not None
+        for player in home.list_players(engine.game_id):
+            assert repo.shard_of(player.id) == repo.shard_of(engine.game_id)
+        for other in shards:
+            if other is not home:
+                assert other.get_game(engine.game_id) is None
+
+        single = InMemoryRepository()
+        expected = play(single, engines.index(engine))
+        assert [
+            (p.name, p.money, p.position) for p in repo.list_players(engine.game_id)
+        ] == [
+            (p.name, p.money, p.position) for p in single.list_players(expected.game_id)
+        ]
+
+
+def test_unit_of_work_stays_on_one_shard():
+    shards = memory_shards(2)
+    repo = ShardedRepository(shards)
+    first, second = repo.create_game(), repo.create_game()
+    with repo.unit_of_work():
+        created = repo.create_game("waiting")  # joins the shard already in use
+        repo.update_game_status(first.id, "playing")
+        with pytest.raises(RuntimeError, match="cannot touch shard"):
+            repo.get_game(second.id)
+    assert repo.shard_of(created.id) == repo.shard_of(first.id)
+    assert repo.shard_of(second.id) != repo.shard_of(first.id)
+    assert repo.get_game(first.id).status == "playing"
+
+
+def test_create_game_rejects_unconfigured_shards():
+    # Unoffset shards both start at id 1, which only routes to shard 0.
+    repo = ShardedRepository([InMemoryRepository(), InMemoryRepository()])
+    with pytest.raises(RuntimeError, match="configure the shard map"):
+        for _ in range(2):
+            repo.create_game()
+
+
+def test_admin_queries_fan_out_and_merge():
+    repo = ShardedRepository(memory_shards(3))
+    try:
+        engines = [play(repo, seed, turns=10) for seed in range(5)]
+        repo.update_game_status(engines[1].game_id, "finished")
+
+        games = repo.list_games()
+        assert sorted(g.id for g in games) == sorted(e.game_id for e in engines)
+        assert [g.created_at for g in games] == sorted(
+            (g.created_at for g in games), reverse=True
+        )
+        assert len(repo.list_games(limit=2)) == 2
+        assert [g.id for g in repo.list_games("finished")] == [engines[1].game_id]
+
+        stats = repo.game_stats()
+        assert stats.games == 5
+        assert stats.games_by_status["finished"] == 1
+        assert stats.players == sum(s.players for s in repo.shard_stats()) == 10
+        assert stats.money_in_play == sum(
+            p.money for e in engines for p in repo.list_players(e.game_id)
+        )
+    finally:
+        repo.close()
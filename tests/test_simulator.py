@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.domain.game_engine import HouseRules
+from monopoly.sim.parallel import run_parallel
+from monopoly.sim.simulator import SimulationConfig, SimulationStats, simulate
+
+
+def test_simulate_reports_consistent_stats():
+    config = SimulationConfig(games=5, players=3, policies=["aggressive", "passive"])
+    stats = simulate(config)
+    assert stats.games == 5
+    assert stats.seats == {"aggressive": 10, "passive": 5}
+    assert sum(stats.wins.values()) == stats.finished_games
+    assert stats.min_turns <= stats.mean_turns <= stats.max_turns <= config.max_turns
+    assert stats.turns_per_second > 0
+
+
+class GoBonusLog(InMemoryRepository):
+    """Records every GO bonus the engine pays out."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bonuses: list[int] = []
+
+    def adjust_money(self, game_id, player_id, delta, description, holdings_delta=0):
+        if description == "Passed GO bonus":
+            self.bonuses.append(delta)
+        return super().adjust_money(
+            game_id, player_id, delta, description, holdings_delta
+        )
+
+
+@pytest.mark.parametrize("bonus", [0, 275])
+def test_house_rules_are_applied(bonus):
+    config = SimulationConfig(
+        games=3, players=2, max_turns=50, seed=5, rules=HouseRules(pass_go_bonus=bonus)
+    )
+    repo = GoBonusLog()
+    simulate(config, repo)
+    assert repo.bonuses and set(repo.bonuses) == {bonus}
+
+
+def test_merge_combines_partial_results():
+    config = SimulationConfig(games=2, players=2, max_turns=100)
+    total = SimulationStats()
+    parts = [simulate(config), simulate(config)]
+    for part in parts:
+        total.merge(part)
+    assert total.games == 4
+    assert total.total_turns == sum(p.total_turns for p in parts)
+    assert total.min_turns == min(p.min_turns for p in parts)
+
+
+def test_single_player_is_rejected():
+    with pytest.raises(ValueError):
+        simulate(SimulationConfig(games=1, players=1))
+
+
+def test_seeded_runs_are_reproducible_across_worker_counts():
+    config = SimulationConfig(
+        games=6,
+        players=3,
+        policies=["aggressive", "random"],
+        max_turns=200,
+        seed=11,
+        batch_size=2,
+    )
+    sequential = simulate(config).to_dict()
+    parallel = run_parallel(config, workers=2).to_dict()
+    for result in (sequential, parallel):
+        result.pop("turns_per_second")
+    assert sequential == parallel
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.db.portable import export_game, import_game
+from monopoly.db.sqlite import SqliteDatabase, SqliteRepository
+from monopoly.domain.game_engine import GameEngine
+from monopoly.domain.history import capture_state, rebuild_state
+from tests.conftest import HARSH, play_bots
+
+
+def play(repo, turns: int = 200, money: int = 400) -> GameEngine:
+    return play_bots(
+        repo,
+        11,
+        turns,
+        money,
+        ("Ann", "Bob", "Cy"),
+        HARSH,
+        improve=True,
+        snapshot_interval=25,
+    )
+
+
+def fingerprint(repo, game_id: int) -> dict:
+    """Everything about a game except its ids and timestamps."""
+    status = repo.board_status(game_id)
+    names = {p.id: p.name for p in status.players}
+    return {
+        "status": status.game.status,
+        "current": names[status.game.current_turn_player_id],
+        "players": [
+            (p.name, p.money, p.position, p.is_active, p.turn_order)
+            for p in status.players
+        ],
+        "owned": status.to_dict()["owned"],
+        "ledger": [(t.amount, t.description) for t in repo.list_transactions(game_id)],
+        "events": [
+            (e.turn, e.kind, e.amount, e.position, e.dice)
+            for e in repo.list_events(game_id)
+        ],
+    }
+
+
+@pytest.fixture
+def sqlite_repo():
+    with SqliteDatabase(":memory:") as db:
+        yield SqliteRepository(db)
+
+
+def test_sqlite_plays_like_memory(sqlite_repo):
+    memory = InMemoryRepository()
+    expected = fingerprint(memory, play(memory).game_id)
+    assert fingerprint(sqlite_repo, play(sqlite_repo).game_id) == expected
+    assert any(not is_active for _, _, _, is_active, _ in expected["players"])
+
+
+def test_unit_of_work_rolls_back(sqlite_repo):
+    engine = play(sqlite_repo, turns=3)
+    player = engine.get_current_player()
+    with pytest.raises(RuntimeError):
+        with sqlite_repo.unit_of_work():
+            sqlite_repo.adjust_money(engine.game_id, player.id, 500, "Bonus")
+            sqlite_repo.update_player_position(player.id, 9)
+            raise RuntimeError("boom")
+    assert sqlite_repo.get_player(player.id) == player
+    assert sqlite_repo.list_transactions(engine.game_id, limit=1)[0].amount != 500
+
+
+def test_file_database_uses_wal_and_persists(tmp_path):
+    path = tmp_path / "games.db"
+    with SqliteDatabase(path) as db:
+        assert db.journal_mode == "wal"
+        game_id = play(SqliteRepository(db), turns=20).game_id
+        expected = fingerprint(SqliteRepository(db), game_id)
+    with SqliteDatabase(path) as db:
+        assert fingerprint(SqliteRepository(db), game_id) == expected
+
+
+def test_export_import_round_trip(sqlite_repo):
+    engine = play(sqlite_repo, turns=80, money=1500)
+    data = export_game(sqlite_repo, engine.game_id)
+    assert len(data["snapshots"]) > 1
+
+    memory = InMemoryRepository()
+    memory.create_game()  # the import must not rely on matching ids
+    game_id = import_game(memory, data)
+    assert game_id != engine.game_id
+    assert fingerprint(memory, game_id) == fingerprint(sqlite_repo, engine.game_id)
+
+    live = capture_state(memory, game_id, engine.turn)
+    assert rebuild_state(memory, game_id) == live
+    assert (
+        rebuild_state(memory, game_id, 30).to_dict()["players"]
+        == (rebuild_state(sqlite_repo, engine.game_id, 30).to_dict()["players"])
+    )
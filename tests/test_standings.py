@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.db.portable import export_game, import_game
+from monopoly.db.sharding import ShardedRepository
+from monopoly.db.sqlite import SqliteDatabase, SqliteRepository
+from monopoly.domain.game_engine import GameEngine, HouseRules
+from tests.conftest import HARSH, memory_shards, play_bots
+
+# A sellback ratio off the default, so holdings are priced by the game's rules.
+RULES = replace(HARSH, sellback_ratio=0.6)
+
+
+def play(repo, seed: int, turns: int = 150) -> GameEngine:
+    return play_bots(
+        repo,
+        seed,
+        turns,
+        600,
+        ("Ann", "Bob", "Cy"),
+        RULES,
+        improve=True,
+        sell_chance=0.2,
+    )
+
+
+def priced(repo, game_id: int) -> dict:
+    """Net worth per player, recomputed from every property they own."""
+    return {
+        p.id: p.money
+        + sum(
+            RULES.sale_value(space, state.improvement_count)
+            for space, state in repo.properties_by_owner(game_id, p.id)
+        )
+        for p in repo.list_players(game_id)
+    }
+
+
+@pytest.fixture(params=["memory", "sqlite", "sharded"])
+def repo(request):
+    if request.param == "memory":
+        yield InMemoryRepository()
+    elif request.param == "sqlite":
+        with SqliteDatabase(":memory:") as db:
+            yield SqliteRepository(db)
+    else:
+        sharded = ShardedRepository(memory_shards(2))
+        yield sharded
+        sharded.close()
+
+
+def test_net_worth_tracks_play_and_bankruptcy(repo):
+    engines = [play(repo, seed) for seed in range(4)]
+    assert any(
+        not p.is_active for e in engines for p in repo.list_players(e.game_id)
+    ), "expected at least one bankruptcy"
+
+    everyone = {}
+    for engine in engines:
+        standings = engine.standings()
+        assert [s.rank for s in standings] == list(range(1, len(standings) + 1))
+        assert {s.player_id: s.net_worth for s in standings} == priced(
+            repo, engine.game_id
+        )
+        assert [s.net_worth for s in standings] == sorted(
+            (s.net_worth for s in standings), reverse=True
+        )
+        assert engine.board_status().standings() == standings
+        for standing in standings:
+            if not standing.is_active:
+                assert standing.holdings == 0
+        everyone.update(priced(repo, engine.game_id))
+
+    top = repo.leaderboard(5)
+    assert [s.rank for s in top] == [1, 2, 3, 4, 5]
+    assert [(s.net_worth, s.player_id) for s in top] == sorted(
+        ((worth, pid) for pid, worth in everyone.items()),
+        key=lambda item: (-item[0], item[1]),
+    )[:5]
+
+
+def test_deleted_games_leave_the_leaderboard(repo):
+    first, second = play(repo, 1, turns=20), play(repo, 2, turns=20)
+    repo.delete_game(first.game_id)
+    assert {s.game_id for s in repo.leaderboard(10)} == {second.game_id}
+
+
+def test_import_keeps_holdings():
+    source = InMemoryRepository()
+    engine = play(source, 3, turns=60)
+    target = InMemoryRepository()
+    game_id = import_game(target, export_game(source, engine.game_id))
+    assert [(s.name, s.holdings, s.net_worth) for s in target.standings(game_id)] == [
+        (s.name, s.holdings, s.net_worth) for s in engine.standings()
+    ]
+
+
+def test_old_sqlite_files_get_holdings_priced_by_the_default_rules(tmp_path):
+    path = tmp_path / "old.db"
+    with SqliteDatabase(path) as db:
+        game_id = play(SqliteRepository(db), seed=4, turns=40).game_id
+        db.conn.executescript(
+            "DROP INDEX idx_players_net_worth;ALTER TABLE players DROP COLUMN holdings;"
+        )
+    with SqliteDatabase(path) as db:
+        repo = SqliteRepository(db)
+        rules = HouseRules()
+        expected = {
+            p.id: sum(
+                rules.sale_value(space, state.improvement_count)
+                for space, state in repo.properties_by_owner(game_id, p.id)
+            )
+            for p in repo.list_players(game_id)
+        }
+        assert any(expected.values())
+        assert {s.player_id: s.holdings for s in repo.standings(game_id)} == expected
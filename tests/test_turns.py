@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+
+from monopoly.db.memory import InMemoryRepository
+from monopoly.domain import GameEngine
+from monopoly.domain.turns import TurnRing
+from monopoly.models import Player
+
+
+def _players(count: int) -> list[Player]:
+    return [
+        Player(
+            id=pid,
+            game_id=1,
+            name=f"P{pid}",
+            money=0,
+            position=0,
+            is_active=True,
+            turn_order=count - pid,
+        )
+        for pid in range(1, count + 1)
+    ]
+
+
+def test_ring_rotates_in_turn_order_and_skips_eliminated_players():
+    ring = TurnRing(_players(4), current_id=4)
+    assert [ring.advance() for _ in range(5)] == [3, 2, 1, 4, 3]
+    ring.remove(2)
+    assert ring.advance() == 1 and len(ring) == 3
+    # An eliminated current player hands the turn to the first seat.
+    ring.remove(1)
+    assert ring.advance() == 4
+    ring.remove(4)
+    assert 4 not in ring and ring.sole_survivor() == 3
+    ring.remove(3)
+    assert ring.advance() is None and ring.head is None
+
+
+class CountingRepository(InMemoryRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scans = 0
+
+    def list_players(self, game_id: int, active_only: bool = False) -> list[Player]:
+        self.scans += 1
+        return super().list_players(game_id, active_only)
+
+
+def test_turns_do_not_rescan_players():
+    repo = CountingRepository()
+    engine = GameEngine.new_game_with_defaults(
+        repo,
+        [f"Bot {i}" for i in range(300)],
+        1500,
+        rng=random.Random(3),
+        record_history=False,
+    )
+    repo.scans = 0
+    player = engine.get_current_player()
+    for _ in range(600):
+        engine.roll_and_resolve(player)
+        player = engine.next_turn()
+    assert repo.scans == 0
+    assert player.id == engine.turn_ring.current_id
+    assert repo.get_game(engine.game_id).current_turn_player_id == player.id
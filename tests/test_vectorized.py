@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from monopoly.models import SpaceType  # noqa: E402
+from monopoly.sim.simulator import SimulationConfig  # noqa: E402
+from monopoly.sim.vectorized import simulate_vectorized  # noqa: E402
+
+
+def test_seeded_runs_are_deterministic():
+    config = SimulationConfig(games=200, players=3, max_turns=100, seed=5)
+    first = simulate_vectorized(config, chunk_size=64).to_dict()
+    second = simulate_vectorized(config, chunk_size=64).to_dict()
+    first.pop("turns_per_second")
+    second.pop("turns_per_second")
+    assert first == second
+    assert first["games"] == 200
+
+
+def test_first_mover_is_bankrupted_on_an_all_tax_board():
+    board = [
+        {"name": "GO", "type": SpaceType.GO, "event_amount": -500},
+        *({"name": f"Tax {i}", "type": SpaceType.TAX} for i in range(1, 13)),
+    ]
+    config = SimulationConfig(
+        games=50,
+        players=2,
+        starting_money=100,
+        policies=["aggressive", "passive"],
+        seed=1,
+    )
+    stats = simulate_vectorized(config, board=board)
+    assert stats.finished_games == 50
+    assert stats.min_turns == stats.max_turns == 1
+    assert stats.bankruptcies == 50
+    assert stats.wins == {"aggressive": 0, "passive": 50}
+
+
+def test_random_policy_is_rejected():
+    with pytest.raises(ValueError):
+        simulate_vectorized(SimulationConfig(games=1, policies=["random"]))